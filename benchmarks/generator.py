@@ -0,0 +1,92 @@
+"""Generates synthetic attendance data for benchmarks.
+
+The data is reproducible for a given seed and mixes three kinds of employees:
+
+- day workers, who mostly work on weekdays and sometimes on weekends, including legal holidays
+- night workers, whose shifts start in the evening and cross midnight
+- rotating workers, who change between early, late and night shifts every week
+
+Shifts longer than nine hours have a second break. Overtime follows an exponential
+distribution, so a few employees exceed the limits of the 36 Agreement.
+"""
+from datetime import date
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+DATE_FORMAT = '%m/%d/%Y %H:%M'
+COLUMN_NAMES = ['employee', 'start', 'start of break', 'end of break', 'end', 'start of break 2', 'end of break 2']
+
+DAY_WORKER, NIGHT_WORKER, ROTATING_WORKER = 0, 1, 2
+_KIND_PROBABILITIES = [0.6, 0.2, 0.2]
+# The probability of working on each weekday, from Monday to Sunday.
+_WORKING_PROBABILITIES = np.array([
+    [0.95, 0.95, 0.95, 0.95, 0.95, 0.15, 0.05],
+    [0.9, 0.9, 0.9, 0.9, 0.9, 0.1, 0.1],
+    [0.8, 0.8, 0.8, 0.8, 0.8, 0.6, 0.6],
+])
+_ROTATING_START_MINUTES = np.array([6 * 60, 14 * 60, 22 * 60])
+
+
+def generate(employees: int = 100, years: int = 1, seed: int = 0, first_day: date = date(2024, 1, 1), as_strings: bool = True) -> DataFrame:
+    """Generates the shifts of the employees over the years, sorted by employee and start.
+
+    Args:
+        employees (int, optional): The number of employees.
+        years (int, optional): The number of years of 365 days.
+        seed (int, optional): The seed of the random number generator.
+        first_day (date, optional): The first day of the period.
+        as_strings (bool, optional): Whether to format the timestamps with DATE_FORMAT,
+            as they are read from a CSV file, instead of returning datetime64 columns.
+
+    Returns:
+        DataFrame: One row per shift with the columns in COLUMN_NAMES. The second break
+        is missing for shifts without one.
+    """
+    random = np.random.default_rng(seed)
+    number_of_days = 365 * years
+    kinds = random.choice(3, size=employees, p=_KIND_PROBABILITIES)
+
+    employee_ids = np.repeat(np.arange(employees), number_of_days)
+    day_numbers = np.tile(np.arange(number_of_days), employees)
+    days = np.datetime64(first_day, 'D') + day_numbers
+    weekdays = (days.astype(np.int64) + 3) % 7
+    kinds_of_shifts = kinds[employee_ids]
+
+    works = random.random(len(days)) < _WORKING_PROBABILITIES[kinds_of_shifts, weekdays]
+    employee_ids, day_numbers, days, kinds_of_shifts = employee_ids[works], day_numbers[works], days[works], kinds_of_shifts[works]
+    number_of_shifts = len(days)
+
+    start_minutes = np.select(
+        [kinds_of_shifts == DAY_WORKER, kinds_of_shifts == NIGHT_WORKER],
+        [9 * 60, 22 * 60],
+        _ROTATING_START_MINUTES[(day_numbers // 7 + employee_ids) % 3]
+    ) + np.round(random.normal(0, 10, number_of_shifts)).astype(np.int64)
+
+    first_break_minutes = random.choice([45, 60], size=number_of_shifts)
+    overtime_minutes = np.minimum(np.round(random.exponential(60, number_of_shifts)), 6 * 60).astype(np.int64)
+    working_minutes = 8 * 60 + overtime_minutes - random.choice([0, 30, 60], size=number_of_shifts, p=[0.7, 0.2, 0.1])
+    has_second_break = working_minutes > 9 * 60
+    second_break_minutes = np.where(has_second_break, 15, 0)
+
+    starts = days.astype('datetime64[m]') + start_minutes
+    break_starts = starts + 4 * 60 + random.integers(-30, 30, number_of_shifts)
+    break_ends = break_starts + first_break_minutes
+    second_break_starts = break_ends + 3 * 60
+    second_break_ends = second_break_starts + second_break_minutes
+    ends = starts + working_minutes + first_break_minutes + second_break_minutes
+
+    dataframe = DataFrame({
+        'employee': employee_ids,
+        'start': starts,
+        'start of break': break_starts,
+        'end of break': break_ends,
+        'end': ends,
+        'start of break 2': np.where(has_second_break, second_break_starts, np.datetime64('NaT')),
+        'end of break 2': np.where(has_second_break, second_break_ends, np.datetime64('NaT')),
+    })
+
+    if as_strings:
+        for column_name in COLUMN_NAMES[1:]:
+            dataframe[column_name] = pd.to_datetime(dataframe[column_name]).dt.strftime(DATE_FORMAT)
+    return dataframe
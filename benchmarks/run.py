@@ -0,0 +1,143 @@
+"""Runs the benchmark suite and prints the results as JSON.
+
+Usage: python benchmarks/run.py [--employees N] [--years N] [--seed N] [--repeat N] [--output PATH]
+
+Each benchmark is timed over --repeat runs, then run once more under tracemalloc for
+its peak memory. ops_per_sec counts the unit of the benchmark, shifts or employees,
+so results of different sizes and releases can be compared.
+
+The validate benchmarks discard the cached aggregates before each validation, while
+the validate_with_cached_aggregates ones measure validating again against other limits.
+Likewise result.render renders each result anew rather than reading back its cached string.
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+from generator import DATE_FORMAT, generate
+from jikangai import Agreement36, AttendanceFactory, CompanyProfile, LegalHoliday, Validator
+
+AGGREGATES = [
+    'daily_overtime_work_hours',
+    'weekly_overtime_work_hours',
+    'monthly_overtime_work_hours',
+    'yearly_overtime_work_hours',
+    'weekly_regular_work_hours',
+]
+
+
+def make_validator() -> Validator:
+    agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364))
+    return Validator(CompanyProfile(LegalHoliday.of_every_sunday(), agreement36))
+
+
+def make_benchmarks(dataframe, validator: Validator) -> List[Tuple[str, str, int, Callable[[], object]]]:
+    columns = ('start', ['start of break', 'start of break 2'], ['end of break', 'end of break 2'], 'end', DATE_FORMAT)
+    groups = [group for _, group in dataframe.groupby('employee', sort=False)]
+    number_of_shifts = len(dataframe)
+    number_of_employees = len(groups)
+
+    def create_attendances():
+        return [AttendanceFactory.create_from_dataframe(group, *columns) for group in groups]
+
+    def create_columnar_attendances():
+        return list(AttendanceFactory.create_many_from_dataframe(dataframe, 'employee', *columns).values())
+
+    attendances = {'attendance': create_attendances(), 'columnar_attendance': create_columnar_attendances()}
+    results = [validator.validate(attendance) for attendance in attendances['attendance']]
+    working_hours_per_day = validator.labor_standards_act.working_hours_per_day
+    legal_holidays = validator.profile.legal_holiday_table
+
+    def validate_uncached(attendance):
+        attendance.invalidate_aggregates()
+        return validator.validate(attendance)
+
+    benchmarks = [
+        ('ingestion.create_from_dataframe', 'shifts', number_of_shifts, create_attendances),
+        ('ingestion.create_many_from_dataframe', 'shifts', number_of_shifts, create_columnar_attendances),
+    ]
+    for kind, attendances_of_kind in attendances.items():
+        for aggregate in AGGREGATES:
+            benchmarks.append((
+                f'{kind}.{aggregate}', 'shifts', number_of_shifts,
+                lambda attendances_of_kind=attendances_of_kind, aggregate=aggregate: [
+                    getattr(attendance, aggregate)(working_hours_per_day, legal_holidays) for attendance in attendances_of_kind]
+            ))
+        benchmarks.append((
+            f'{kind}.weekly_count_worked_on_legal_holidays', 'shifts', number_of_shifts,
+            lambda attendances_of_kind=attendances_of_kind: [
+                attendance.weekly_count_worked_on_legal_holidays(legal_holidays) for attendance in attendances_of_kind]
+        ))
+        benchmarks.append((
+            f'{kind}.validate', 'employees', number_of_employees,
+            lambda attendances_of_kind=attendances_of_kind: [validate_uncached(attendance) for attendance in attendances_of_kind]
+        ))
+        benchmarks.append((
+            f'{kind}.validate_with_cached_aggregates', 'employees', number_of_employees,
+            lambda attendances_of_kind=attendances_of_kind: [validator.validate(attendance) for attendance in attendances_of_kind]
+        ))
+    benchmarks.append(('result.render', 'employees', number_of_employees, lambda: [result.render() for result in results]))
+    return benchmarks
+
+
+def run(name: str, unit: str, ops: int, function: Callable[[], object], repeat: int) -> dict:
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    mean_seconds = sum(durations) / len(durations)
+    return {
+        'name': name,
+        'unit': unit,
+        'ops': ops,
+        'repeat': repeat,
+        'mean_seconds': mean_seconds,
+        'min_seconds': min(durations),
+        'ops_per_sec': ops / mean_seconds if mean_seconds > 0 else None,
+        'peak_memory_bytes': peak_memory,
+    }
+
+
+def main(argv=None) -> dict:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--employees', type=int, default=100)
+    parser.add_argument('--years', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--filter', default='', help='run only the benchmarks whose name contains this string')
+    parser.add_argument('--output', help='write the JSON to this file instead of stdout')
+    args = parser.parse_args(argv)
+
+    dataframe = generate(args.employees, args.years, args.seed)
+    report = {
+        'environment': {'python': platform.python_version(), 'implementation': platform.python_implementation(), 'machine': platform.machine()},
+        'parameters': {'employees': args.employees, 'years': args.years, 'seed': args.seed, 'shifts': len(dataframe)},
+        'results': [
+            run(name, unit, ops, function, args.repeat)
+            for name, unit, ops, function in make_benchmarks(dataframe, make_validator())
+            if args.filter in name
+        ],
+    }
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output)
+    else:
+        print(output)
+    return report
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -1,2 +1,31 @@
-from .attendance_factory import AttendanceFactory
-from .jikangai import Agreement36, Attendance, BreakTime, CompanyProfile, LaborStandardsAct, LegalHoliday, Result, Validator, WorkingDate
\ No newline at end of file
+import importlib
+from .jikangai import Aggregates, Agreement36, Attendance, BatchResult, BreakTime, CompanyProfile, IncrementalAttendance, LaborStandardsAct, LegalHoliday, LegalHolidayTable, Result, Validator, WorkingDate
+from .tracer import Tracer
+
+# The names whose modules import numpy, pandas, sqlite3 or asyncio, imported on their first use.
+_LAZY_NAMES = {
+    'AggregateStore': '.aggregate_store',
+    'AttendanceFactory': '.attendance_factory',
+    'AttendanceReader': '.attendance_reader',
+    'ColumnarAttendance': '.columnar_attendance',
+    'ResultWriter': '.result_writer',
+    'ValidationService': '.service',
+    'main': '.service',
+}
+
+__all__ = [
+    'Aggregates', 'Agreement36', 'Attendance', 'BatchResult', 'BreakTime', 'CompanyProfile', 'IncrementalAttendance',
+    'LaborStandardsAct', 'LegalHoliday', 'LegalHolidayTable', 'Result', 'Tracer', 'Validator', 'WorkingDate',
+    *_LAZY_NAMES
+]
+
+def __getattr__(name: str):
+    module_name = _LAZY_NAMES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
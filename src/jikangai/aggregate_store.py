@@ -0,0 +1,259 @@
+import sqlite3
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple, Union
+from .jikangai import _WORKING_HOURS_PER_WEEK, Aggregates, Attendance, LegalHoliday, LegalHolidayTable, Result, Validator, _statutory_overtime_work_hours
+
+_MICROSECOND = timedelta(microseconds=1)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weekly (
+    employee, setting TEXT, year INTEGER, week INTEGER, first_day INTEGER, last_day INTEGER,
+    overtime_of_holidays INTEGER, overtime_of_non_holidays INTEGER, count_worked_on_legal_holidays INTEGER,
+    PRIMARY KEY (employee, setting, year, week)
+);
+CREATE TABLE IF NOT EXISTS monthly (
+    employee, setting TEXT, year INTEGER, month INTEGER, first_day INTEGER, last_day INTEGER,
+    overtime_of_holidays INTEGER, overtime_of_non_holidays INTEGER, holiday_work_hours INTEGER,
+    PRIMARY KEY (employee, setting, year, month)
+);
+CREATE TABLE IF NOT EXISTS weekly_regular (
+    employee, setting TEXT, year INTEGER, week INTEGER, first_day INTEGER, last_day INTEGER,
+    calendar_year INTEGER, month INTEGER, regular_work_hours INTEGER,
+    PRIMARY KEY (employee, setting, year, week, calendar_year, month)
+);
+CREATE TABLE IF NOT EXISTS last_days (
+    employee, setting TEXT, last_day INTEGER, last_day_worked INTEGER,
+    PRIMARY KEY (employee, setting)
+);
+"""
+
+class AggregateStore:
+    """Persists the weekly and monthly aggregates of employees in SQLite.
+
+    Appending an attendance adds its period totals to the stored ones, so checking a
+    new month against yearly limits reads at most a year of weekly and monthly totals
+    instead of re-reading the shifts of the whole year. The aggregates are stored per
+    working hours per day and set of legal holidays, and each employee's attendances
+    must be appended in chronological order, each starting on a later day than the last
+    appended date. Employees are identified by a str or an int. The regular work hours of each week are stored per month, so the
+    statutory overtime of a week split between two attendances is derived from both.
+    The last day worked is stored too, so a legal holiday worked by a date crossing midnight
+    and by the next attendance is counted once in the weekly count of legal holidays worked.
+
+        with AggregateStore('aggregates.db') as store:
+            result = store.append_and_validate(validator, employee_id, attendance_of_the_month)
+    """
+    def __init__(self, path: str = ':memory:'):
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+        return False
+
+    @staticmethod
+    def _setting(working_hours_per_day: timedelta, legal_holidays: Union[List[LegalHoliday], LegalHolidayTable]) -> str:
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        return f'{working_hours_per_day // _MICROSECOND}:{sorted(legal_holidays.table)}'
+
+    @staticmethod
+    def _check_employee_id(employee_id: Union[str, int]):
+        # SQLite binds str and int, and would take True for 1.
+        if not isinstance(employee_id, (str, int)) or isinstance(employee_id, bool):
+            raise ValueError(f"employee_id must be a str or an int, not {type(employee_id).__name__}")
+
+    def _last_days(self, employee_id: Union[str, int], setting: str) -> Optional[Tuple[int, int]]:
+        self._check_employee_id(employee_id)
+        return self._connection.execute(
+            'SELECT last_day, last_day_worked FROM last_days WHERE employee = ? AND setting = ?', (employee_id, setting)
+        ).fetchone()
+
+    def last_day(self, employee_id: Union[str, int], working_hours_per_day: timedelta, legal_holidays: Union[List[LegalHoliday], LegalHolidayTable]) -> Optional[date]:
+        """Returns the day of the last appended date of the employee, or None if nothing has been appended.
+        """
+        row = self._last_days(employee_id, self._setting(working_hours_per_day, legal_holidays))
+        return date.fromordinal(row[0]) if row else None
+
+    def _aggregates_to_append(self,
+                              employee_id: Union[str, int],
+                              attendance: Attendance,
+                              working_hours_per_day: timedelta,
+                              legal_holidays: Union[List[LegalHoliday], LegalHolidayTable],
+                              working_hours_per_week: timedelta = _WORKING_HOURS_PER_WEEK) -> Aggregates:
+        """Returns the aggregates of the attendance to add to the stored ones.
+
+        A legal holiday worked by the last appended date, which crossed midnight into it, is
+        already in the stored weekly count, so it is left out when the attendance starts on it.
+        """
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        aggregates = attendance.aggregates(working_hours_per_day, legal_holidays, working_hours_per_week=working_hours_per_week)
+        row = self._last_days(employee_id, self._setting(working_hours_per_day, legal_holidays))
+        period = attendance.period()
+        if row is None or period is None or period[0].toordinal() != row[1] or not legal_holidays.is_legal_holiday_of_ordinal(row[1]):
+            return aggregates
+
+        year, week_number, _ = date.fromordinal(row[1]).isocalendar()
+        weekly_count_worked_on_legal_holidays = {year_of_weeks: dict(weeks) for year_of_weeks, weeks in aggregates.weekly_count_worked_on_legal_holidays.items()}
+        weekly_count_worked_on_legal_holidays[year][week_number] -= 1
+        return aggregates._replace(weekly_count_worked_on_legal_holidays=weekly_count_worked_on_legal_holidays)
+
+    def append(self, employee_id: Union[str, int], attendance: Attendance, working_hours_per_day: timedelta, legal_holidays: Union[List[LegalHoliday], LegalHolidayTable]):
+        """Adds the aggregates of the attendance to the stored aggregates of the employee.
+
+        Raises:
+            ValueError: If the attendance does not start on a later day than the last appended date.
+        """
+        period = attendance.period()
+        if period is None:
+            return
+
+        setting = self._setting(working_hours_per_day, legal_holidays)
+        first_day, last_day = period[0].date(), period[1].date()
+        last_appended_day = self.last_day(employee_id, working_hours_per_day, legal_holidays)
+        if last_appended_day is not None and not first_day > last_appended_day:
+            raise ValueError(f"attendance must start after {last_appended_day}, the day of the last appended date")
+
+        aggregates = self._aggregates_to_append(employee_id, attendance, working_hours_per_day, legal_holidays)
+        weekly_rows = []
+        for year, weeks in aggregates.weekly_overtime_work_hours.items():
+            for week_number, (overtime_of_holidays, overtime_of_non_holidays) in weeks.items():
+                monday = date.fromisocalendar(year, week_number, 1)
+                weekly_rows.append((
+                    employee_id, setting, year, week_number, monday.toordinal(), monday.toordinal() + 6,
+                    overtime_of_holidays // _MICROSECOND, overtime_of_non_holidays // _MICROSECOND,
+                    aggregates.weekly_count_worked_on_legal_holidays[year][week_number]
+                ))
+        weekly_regular_rows = []
+        for year, weeks in aggregates.weekly_regular_work_hours.items():
+            for week_number, regular_work_hours_of_months in weeks.items():
+                monday = date.fromisocalendar(year, week_number, 1)
+                for (calendar_year, month), regular_work_hours in regular_work_hours_of_months.items():
+                    weekly_regular_rows.append((
+                        employee_id, setting, year, week_number, monday.toordinal(), monday.toordinal() + 6,
+                        calendar_year, month, regular_work_hours // _MICROSECOND
+                    ))
+        monthly_rows = []
+        for year, months in aggregates.monthly_overtime_work_hours.items():
+            for month, (overtime_of_holidays, overtime_of_non_holidays) in months.items():
+                first_day_of_month = date(year, month, 1)
+                first_day_of_next_month = date(year + month // 12, month % 12 + 1, 1)
+                monthly_rows.append((
+                    employee_id, setting, year, month, first_day_of_month.toordinal(), first_day_of_next_month.toordinal() - 1,
+                    overtime_of_holidays // _MICROSECOND, overtime_of_non_holidays // _MICROSECOND,
+                    aggregates.monthly_holiday_work_hours.get(year, {}).get(month, timedelta()) // _MICROSECOND
+                ))
+
+        with self._connection:
+            self._connection.executemany("""
+                INSERT INTO weekly VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (employee, setting, year, week) DO UPDATE SET
+                    overtime_of_holidays = overtime_of_holidays + excluded.overtime_of_holidays,
+                    overtime_of_non_holidays = overtime_of_non_holidays + excluded.overtime_of_non_holidays,
+                    count_worked_on_legal_holidays = count_worked_on_legal_holidays + excluded.count_worked_on_legal_holidays
+            """, weekly_rows)
+            self._connection.executemany("""
+                INSERT INTO monthly VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (employee, setting, year, month) DO UPDATE SET
+                    overtime_of_holidays = overtime_of_holidays + excluded.overtime_of_holidays,
+                    overtime_of_non_holidays = overtime_of_non_holidays + excluded.overtime_of_non_holidays,
+                    holiday_work_hours = holiday_work_hours + excluded.holiday_work_hours
+            """, monthly_rows)
+            self._connection.executemany("""
+                INSERT INTO weekly_regular VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (employee, setting, year, week, calendar_year, month) DO UPDATE SET
+                    regular_work_hours = regular_work_hours + excluded.regular_work_hours
+            """, weekly_regular_rows)
+            self._connection.execute("""
+                INSERT INTO last_days VALUES (?, ?, ?, ?)
+                ON CONFLICT (employee, setting) DO UPDATE SET last_day = excluded.last_day, last_day_worked = excluded.last_day_worked
+            """, (employee_id, setting, last_day.toordinal(), attendance._last_day_worked()))
+
+    def load(self,
+             employee_id: Union[str, int],
+             working_hours_per_day: timedelta,
+             legal_holidays: Union[List[LegalHoliday], LegalHolidayTable],
+             since: datetime = None,
+             until: datetime = None,
+             working_hours_per_week: timedelta = _WORKING_HOURS_PER_WEEK) -> Aggregates:
+        """Loads the stored aggregates of the employee.
+
+        The yearly aggregates are the sums of the weekly ones by ISO year, as in Attendance.
+        The stored aggregates have no daily overtime.
+
+        Args:
+            since (datetime, optional): Loads only the weeks and the months which end on or after this day.
+            until (datetime, optional): Loads only the weeks and the months which start before this day.
+            working_hours_per_week (timedelta, optional): The working hours per week beyond which hours are statutory overtime.
+        """
+        self._check_employee_id(employee_id)
+        conditions = 'employee = ? AND setting = ?'
+        parameters = [employee_id, self._setting(working_hours_per_day, legal_holidays)]
+        if since is not None:
+            conditions += ' AND last_day >= ?'
+            parameters.append(since.toordinal())
+        if until is not None:
+            conditions += ' AND first_day < ?'
+            parameters.append(until.toordinal())
+
+        weekly_overtime_work_hours = {}
+        weekly_count_worked_on_legal_holidays = {}
+        yearly_overtime_work_hours = {}
+        for year, week_number, overtime_of_holidays, overtime_of_non_holidays, count in self._connection.execute(
+                f'SELECT year, week, overtime_of_holidays, overtime_of_non_holidays, count_worked_on_legal_holidays FROM weekly WHERE {conditions} ORDER BY year, week',
+                parameters):
+            overtime = (timedelta(microseconds=overtime_of_holidays), timedelta(microseconds=overtime_of_non_holidays))
+            weekly_overtime_work_hours.setdefault(year, {})[week_number] = overtime
+            weekly_count_worked_on_legal_holidays.setdefault(year, {})[week_number] = count
+            total_overtime_of_holidays, total_overtime_of_non_holidays = yearly_overtime_work_hours.get(year, (timedelta(), timedelta()))
+            yearly_overtime_work_hours[year] = (total_overtime_of_holidays + overtime[0], total_overtime_of_non_holidays + overtime[1])
+
+        monthly_overtime_work_hours = {}
+        monthly_holiday_work_hours = {}
+        for year, month, overtime_of_holidays, overtime_of_non_holidays, holiday_work_hours in self._connection.execute(
+                f'SELECT year, month, overtime_of_holidays, overtime_of_non_holidays, holiday_work_hours FROM monthly WHERE {conditions} ORDER BY year, month',
+                parameters):
+            monthly_overtime_work_hours.setdefault(year, {})[month] = (timedelta(microseconds=overtime_of_holidays), timedelta(microseconds=overtime_of_non_holidays))
+            if holiday_work_hours:
+                monthly_holiday_work_hours.setdefault(year, {})[month] = timedelta(microseconds=holiday_work_hours)
+
+        weekly_regular_work_hours = {}
+        for year, weeks in weekly_overtime_work_hours.items():
+            weekly_regular_work_hours[year] = {week_number: {} for week_number in weeks}
+        for year, week_number, calendar_year, month, regular_work_hours in self._connection.execute(
+                f'SELECT year, week, calendar_year, month, regular_work_hours FROM weekly_regular WHERE {conditions} ORDER BY year, week, calendar_year, month',
+                parameters):
+            weekly_regular_work_hours[year][week_number][(calendar_year, month)] = timedelta(microseconds=regular_work_hours)
+        weekly_statutory_overtime_work_hours, monthly_statutory_overtime_work_hours = _statutory_overtime_work_hours(weekly_regular_work_hours, working_hours_per_week)
+
+        return Aggregates(
+            ([], []), weekly_overtime_work_hours, monthly_overtime_work_hours, yearly_overtime_work_hours, weekly_count_worked_on_legal_holidays,
+            weekly_regular_work_hours, weekly_statutory_overtime_work_hours, monthly_statutory_overtime_work_hours, monthly_holiday_work_hours
+        )
+
+    def append_and_validate(self, validator: Validator, employee_id: Union[str, int], attendance: Attendance) -> Result:
+        """Validates the attendance together with the stored aggregates of the employee, then appends it.
+
+        When the company has an Agreement36, only the stored aggregates of its valid period are loaded.
+        The daily overtime is validated for the dates of the attendance only.
+        """
+        working_hours_per_day = validator.labor_standards_act.working_hours_per_day
+        working_hours_per_week = validator.labor_standards_act.working_hours_per_week
+        legal_holidays = validator.profile.legal_holiday_table
+        agreement36 = validator.profile.agreement36
+        if agreement36 is not None:
+            stored = self.load(employee_id, working_hours_per_day, legal_holidays, agreement36.starting_date, agreement36.ending_date, working_hours_per_week)
+        else:
+            stored = self.load(employee_id, working_hours_per_day, legal_holidays, working_hours_per_week=working_hours_per_week)
+
+        aggregates = self._aggregates_to_append(employee_id, attendance, working_hours_per_day, legal_holidays, working_hours_per_week)
+        result = validator.validate_aggregates(stored.merge(aggregates, working_hours_per_week))
+        self.append(employee_id, attendance, working_hours_per_day, legal_holidays)
+        return result
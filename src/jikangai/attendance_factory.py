@@ -1,29 +1,210 @@
 from datetime import datetime
+from typing import Dict, Hashable, List, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
 from pandas import DataFrame
+from .columnar_attendance import ColumnarAttendance, break_time_columns, invalid_rows
 from .jikangai import Attendance, BreakTime, WorkingDate
 
 class AttendanceFactory:
+    """Creates attendances from DataFrames of shifts.
+
+    The break times of a shift are given by a start and an end column, or by lists of
+    such columns, one pair per break time. With lists, a shift may leave both cells of
+    any break time empty, so the shifts of a DataFrame may have different numbers of
+    break times. create_many_from_break_table takes the break times as rows of another
+    DataFrame instead. Overlapping break times of a shift count once.
+    """
+    @staticmethod
+    def _break_column_names(
+        start_of_break_column_name: Union[str, Sequence[str]],
+        end_of_break_column_name: Union[str, Sequence[str]]) -> List[Tuple[str, str]]:
+
+        if isinstance(start_of_break_column_name, str) and isinstance(end_of_break_column_name, str):
+            return [(start_of_break_column_name, end_of_break_column_name)]
+        if isinstance(start_of_break_column_name, str) or isinstance(end_of_break_column_name, str) or len(start_of_break_column_name) != len(end_of_break_column_name):
+            raise ValueError("start_of_break_column_name and end_of_break_column_name must both be column names or lists of the same length")
+        return list(zip(start_of_break_column_name, end_of_break_column_name))
+
     @staticmethod
     def create_from_dataframe(
         dataframe: DataFrame,
         start_column_name: str,
-        start_of_break_column_name: str,
-        end_of_break_column_name: str,
+        start_of_break_column_name: Union[str, Sequence[str]],
+        end_of_break_column_name: Union[str, Sequence[str]],
         end_column_name: str,
         date_format: str) -> Attendance:
 
+        break_column_names = AttendanceFactory._break_column_names(start_of_break_column_name, end_of_break_column_name)
+        optional_breaks = not isinstance(start_of_break_column_name, str)
         dates = []
         for index, row in dataframe.iterrows():
             try:
                 start = datetime.strptime(row[start_column_name], date_format)
                 end = datetime.strptime(row[end_column_name], date_format)
-                break_time = BreakTime(
-                    datetime.strptime(row[start_of_break_column_name], date_format),
-                    datetime.strptime(row[end_of_break_column_name], date_format)
-                )
-                date = WorkingDate(start, end, [break_time])
-            except ValueError as e:
+                break_times = [
+                    BreakTime(datetime.strptime(row[start_name], date_format), datetime.strptime(row[end_name], date_format))
+                    for start_name, end_name in break_column_names
+                    if not (optional_breaks and pd.isna(row[start_name]) and pd.isna(row[end_name]))
+                ]
+                date = WorkingDate(start, end, break_times)
+            except (TypeError, ValueError) as e:
                 error_message = f'{e}\ncheck line {index}:\n{row}'
                 raise ValueError(error_message)
             dates.append(date)
         return Attendance(dates)
+
+    @staticmethod
+    def _parse(dataframe: DataFrame, column_name: str, date_format: str) -> np.ndarray:
+        parsed = pd.to_datetime(dataframe[column_name], format=date_format, errors='coerce')
+        return parsed.to_numpy(dtype='datetime64[us]')
+
+    @staticmethod
+    def _parse_columns(
+        dataframe: DataFrame,
+        start_column_name: str,
+        start_of_break_column_name: Union[str, Sequence[str]],
+        end_of_break_column_name: Union[str, Sequence[str]],
+        end_column_name: str,
+        date_format: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+
+        parse = AttendanceFactory._parse
+        starts = parse(dataframe, start_column_name, date_format)
+        ends = parse(dataframe, end_column_name, date_format)
+        unparsable = np.isnat(starts) | np.isnat(ends)
+
+        if isinstance(start_of_break_column_name, str) and isinstance(end_of_break_column_name, str):
+            break_starts = parse(dataframe, start_of_break_column_name, date_format)
+            break_ends = parse(dataframe, end_of_break_column_name, date_format)
+            unparsable |= np.isnat(break_starts) | np.isnat(break_ends)
+        else:
+            # Empty cells are absent break times, but other cells must parse.
+            break_column_names = AttendanceFactory._break_column_names(start_of_break_column_name, end_of_break_column_name)
+            break_starts = np.full((len(dataframe), len(break_column_names)), np.datetime64('NaT'), dtype='datetime64[us]')
+            break_ends = break_starts.copy()
+            for i, (start_name, end_name) in enumerate(break_column_names):
+                break_starts[:, i] = parse(dataframe, start_name, date_format)
+                break_ends[:, i] = parse(dataframe, end_name, date_format)
+                unparsable |= np.isnat(break_starts[:, i]) & dataframe[start_name].notna().to_numpy()
+                unparsable |= np.isnat(break_ends[:, i]) & dataframe[end_name].notna().to_numpy()
+
+        return AttendanceFactory._checked(dataframe.index, date_format, unparsable, starts, ends, break_starts, break_ends)
+
+    @staticmethod
+    def _checked(index: pd.Index, date_format: str, unparsable: np.ndarray, starts: np.ndarray, ends: np.ndarray, break_starts: np.ndarray, break_ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        errors = {}
+        if unparsable.any():
+            errors[f'time data does not match format {date_format!r}'] = np.flatnonzero(unparsable)
+
+        parsable = ~unparsable
+        parsable_starts = starts[parsable].astype(np.int64)
+        for message, rows in invalid_rows(
+                parsable_starts, ends[parsable].astype(np.int64),
+                *break_time_columns(parsable_starts, break_starts[parsable], break_ends[parsable])).items():
+            errors[message] = np.flatnonzero(parsable)[rows]
+
+        if errors:
+            error_message = '\n'.join(f'{message}\ncheck lines {index[rows].tolist()}' for message, rows in errors.items())
+            raise ValueError(error_message)
+
+        return (starts, ends, break_starts, break_ends)
+
+    @staticmethod
+    def create_columnar_from_dataframe(
+        dataframe: DataFrame,
+        start_column_name: str,
+        start_of_break_column_name: Union[str, Sequence[str]],
+        end_of_break_column_name: Union[str, Sequence[str]],
+        end_column_name: str,
+        date_format: str) -> ColumnarAttendance:
+        """Creates an attendance by parsing the timestamp columns in a single vectorized pass.
+
+        Unlike create_from_dataframe, every invalid row is reported at once.
+
+        Raises:
+            ValueError: If any row has an unparsable timestamp or violates the ordering
+                of start, breaks and end. The message lists the indexes of all such rows.
+        """
+        return ColumnarAttendance(*AttendanceFactory._parse_columns(
+            dataframe, start_column_name, start_of_break_column_name, end_of_break_column_name, end_column_name, date_format))
+
+    @staticmethod
+    def create_many_from_dataframe(
+        dataframe: DataFrame,
+        employee_column_name: str,
+        start_column_name: str,
+        start_of_break_column_name: Union[str, Sequence[str]],
+        end_of_break_column_name: Union[str, Sequence[str]],
+        end_column_name: str,
+        date_format: str) -> Dict[Hashable, ColumnarAttendance]:
+        """Creates the attendances of many employees from one long DataFrame.
+
+        The timestamp columns are parsed once for all employees as in create_columnar_from_dataframe.
+
+        Returns:
+            Dict[Hashable, ColumnarAttendance]: The attendances keyed by employee ID in the order
+            each employee first appears, ready for Validator.validate_many.
+        """
+        starts, ends, break_starts, break_ends = AttendanceFactory._parse_columns(
+            dataframe, start_column_name, start_of_break_column_name, end_of_break_column_name, end_column_name, date_format)
+        return {
+            employee_id: ColumnarAttendance(starts[rows], ends[rows], break_starts[rows], break_ends[rows])
+            for employee_id, rows in dataframe.groupby(employee_column_name, sort=False).indices.items()
+        }
+
+    @staticmethod
+    def create_many_from_break_table(
+        shifts: DataFrame,
+        break_times: DataFrame,
+        shift_column_name: str,
+        employee_column_name: str,
+        start_column_name: str,
+        start_of_break_column_name: str,
+        end_of_break_column_name: str,
+        end_column_name: str,
+        date_format: str) -> Dict[Hashable, ColumnarAttendance]:
+        """Creates the attendances of many employees from one DataFrame of shifts and one of break times.
+
+        Each row of break_times is a break time of the shift with the same value in the
+        shift_column_name columns of both, so a shift may have any number of break times.
+        The break times are laid out in columns per shift in one vectorized pass.
+
+        Raises:
+            ValueError: If the shift column of shifts has duplicates, if a break time belongs
+                to no shift, or if any row is invalid as in create_columnar_from_dataframe.
+                The message lists the indexes of the offending rows of the DataFrame they are in.
+
+        Returns:
+            Dict[Hashable, ColumnarAttendance]: The attendances keyed by employee ID in the order
+            each employee first appears.
+        """
+        shift_ids = pd.Index(shifts[shift_column_name])
+        if not shift_ids.is_unique:
+            raise ValueError(f'{shift_column_name} must be unique in shifts\ncheck lines {shifts.index[shift_ids.duplicated(keep=False)].tolist()}')
+        positions = shift_ids.get_indexer(break_times[shift_column_name])
+        if (positions < 0).any():
+            raise ValueError(f'break times must belong to a shift\ncheck lines {break_times.index[positions < 0].tolist()}')
+
+        parse = AttendanceFactory._parse
+        starts_of_breaks = parse(break_times, start_of_break_column_name, date_format)
+        ends_of_breaks = parse(break_times, end_of_break_column_name, date_format)
+        unparsable = np.isnat(starts_of_breaks) | np.isnat(ends_of_breaks)
+        if unparsable.any():
+            raise ValueError(f'time data does not match format {date_format!r}\ncheck lines {break_times.index[unparsable].tolist()}')
+
+        # The column of each break time is its rank among the break times of its shift.
+        columns = pd.Series(positions).groupby(positions).cumcount().to_numpy()
+        number_of_columns = int(columns.max()) + 1 if len(columns) else 0
+        break_starts = np.full((len(shifts), number_of_columns), np.datetime64('NaT'), dtype='datetime64[us]')
+        break_ends = break_starts.copy()
+        break_starts[positions, columns] = starts_of_breaks
+        break_ends[positions, columns] = ends_of_breaks
+
+        starts = parse(shifts, start_column_name, date_format)
+        ends = parse(shifts, end_column_name, date_format)
+        starts, ends, break_starts, break_ends = AttendanceFactory._checked(
+            shifts.index, date_format, np.isnat(starts) | np.isnat(ends), starts, ends, break_starts, break_ends)
+        return {
+            employee_id: ColumnarAttendance(starts[rows], ends[rows], break_starts[rows], break_ends[rows])
+            for employee_id, rows in shifts.groupby(employee_column_name, sort=False).indices.items()
+        }
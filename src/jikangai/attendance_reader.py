@@ -0,0 +1,114 @@
+from typing import Hashable, Iterable, Iterator, List, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from .attendance_factory import AttendanceFactory
+from .columnar_attendance import ColumnarAttendance
+
+class AttendanceReader:
+    """Reads the attendances of many employees from a file too large to fit in memory.
+
+    The file is read chunk by chunk, and the attendance of an employee is yielded as soon
+    as the rows of the next employee begin, so the memory held is bounded by the size of
+    a chunk and of the rows of a single employee rather than by the size of the file.
+    The rows of each employee must be contiguous in the file; within an employee they
+    are sorted by start time. The break columns may be lists of columns, one pair per
+    break time, as in AttendanceFactory.
+    """
+    def __init__(self,
+                 employee_column_name: str,
+                 start_column_name: str,
+                 start_of_break_column_name: Union[str, Sequence[str]],
+                 end_of_break_column_name: Union[str, Sequence[str]],
+                 end_column_name: str,
+                 date_format: str = None):
+        self._employee_column_name = employee_column_name
+        self._start_column_name = start_column_name
+        self._start_of_break_column_name = start_of_break_column_name
+        self._end_of_break_column_name = end_of_break_column_name
+        self._end_column_name = end_column_name
+        self._date_format = date_format
+
+    @property
+    def _column_names(self) -> List[str]:
+        break_column_names = AttendanceFactory._break_column_names(self._start_of_break_column_name, self._end_of_break_column_name)
+        return [self._employee_column_name, self._start_column_name, *(name for names in break_column_names for name in names), self._end_column_name]
+
+    def read_csv(self, filepath_or_buffer, chunksize: int = 100_000, **kwargs) -> Iterator[Tuple[Hashable, ColumnarAttendance]]:
+        """Reads a CSV file chunksize rows at a time.
+
+        Args:
+            filepath_or_buffer: Any path or buffer accepted by pandas.read_csv.
+            chunksize (int, optional): The number of rows per chunk.
+            **kwargs: Other arguments passed to pandas.read_csv.
+
+        Yields:
+            Tuple[Hashable, ColumnarAttendance]: The employee ID and the attendance of the employee.
+        """
+        with pd.read_csv(filepath_or_buffer, chunksize=chunksize, usecols=self._column_names, **kwargs) as chunks:
+            yield from self.read_chunks(chunks)
+
+    def read_parquet(self, path) -> Iterator[Tuple[Hashable, ColumnarAttendance]]:
+        """Reads a Parquet file one row group at a time. This requires pyarrow.
+
+        Yields:
+            Tuple[Hashable, ColumnarAttendance]: The employee ID and the attendance of the employee.
+        """
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+
+        def chunks():
+            offset = 0
+            for i in range(parquet_file.num_row_groups):
+                chunk = parquet_file.read_row_group(i, columns=self._column_names).to_pandas()
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+
+        yield from self.read_chunks(chunks())
+
+    def read_chunks(self, chunks: Iterable[DataFrame]) -> Iterator[Tuple[Hashable, ColumnarAttendance]]:
+        """Reads consecutive chunks of one long DataFrame.
+
+        Raises:
+            ValueError: If a chunk has invalid rows, or if the rows of an employee are not contiguous.
+
+        Yields:
+            Tuple[Hashable, ColumnarAttendance]: The employee ID and the attendance of the employee.
+        """
+        completed_employee_ids = set()
+        pending_employee_id = None
+        pending_columns = []
+
+        def complete():
+            completed_employee_ids.add(pending_employee_id)
+            starts, ends, break_starts, break_ends = (np.concatenate(columns) for columns in zip(*pending_columns))
+            order = np.argsort(starts, kind='stable')
+            return (pending_employee_id, ColumnarAttendance(starts[order], ends[order], break_starts[order], break_ends[order]))
+
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+
+            columns = AttendanceFactory._parse_columns(
+                chunk, self._start_column_name, self._start_of_break_column_name,
+                self._end_of_break_column_name, self._end_column_name, self._date_format)
+            employee_ids = chunk[self._employee_column_name].to_numpy()
+            boundaries = np.flatnonzero(employee_ids[1:] != employee_ids[:-1]) + 1
+
+            for start, end in zip(np.r_[0, boundaries], np.r_[boundaries, len(chunk)]):
+                employee_id = employee_ids[start]
+                if isinstance(employee_id, np.generic):
+                    employee_id = employee_id.item()
+                if pending_columns and employee_id != pending_employee_id:
+                    yield complete()
+                    pending_columns = []
+                if not pending_columns:
+                    if employee_id in completed_employee_ids:
+                        raise ValueError(f'rows of employee {employee_id} must be contiguous\ncheck line {chunk.index[start]}')
+                    pending_employee_id = employee_id
+                pending_columns.append(tuple(column[start:end].copy() for column in columns))
+
+        if pending_columns:
+            yield complete()
@@ -0,0 +1,329 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+import numpy as np
+from .jikangai import _EPOCH_ORDINAL, Attendance, BreakTime, LegalHoliday, LegalHolidayTable, WorkingDate
+
+MICROSECONDS_PER_DAY = 86_400_000_000
+
+def _to_microseconds(values) -> np.ndarray:
+    return np.asarray(values, dtype='datetime64[us]').astype(np.int64)
+
+def _to_timedeltas(microseconds: np.ndarray) -> List[timedelta]:
+    return microseconds.astype('timedelta64[us]').tolist()
+
+def break_time_columns(starts: np.ndarray, break_starts, break_ends) -> Tuple[np.ndarray, np.ndarray]:
+    """Converts the break times to microseconds, one row per shift and one column per break time.
+
+    The break times are given as one value per shift, or as rows of any number of them.
+    A break time whose start and end are both NaT is absent, and becomes an empty break
+    time at the start of its shift.
+
+    Args:
+        starts (np.ndarray): The starts of the shifts in microseconds.
+    """
+    break_starts = np.asarray(break_starts, dtype='datetime64[us]')
+    break_ends = np.asarray(break_ends, dtype='datetime64[us]')
+    if break_starts.ndim == 1:
+        break_starts, break_ends = break_starts[:, np.newaxis], break_ends[:, np.newaxis]
+    absent = np.isnat(break_starts) & np.isnat(break_ends)
+    shift_starts = np.broadcast_to(starts[:, np.newaxis], absent.shape)
+    return (np.where(absent, shift_starts, break_starts.astype(np.int64)), np.where(absent, shift_starts, break_ends.astype(np.int64)))
+
+def invalid_rows(starts: np.ndarray, ends: np.ndarray, break_starts: np.ndarray, break_ends: np.ndarray) -> Dict[str, np.ndarray]:
+    """Checks the ordering of every shift at once.
+
+    The break times may have one column per break time, as returned by break_time_columns.
+
+    Returns:
+        Dict[str, np.ndarray]: The positions of the offending rows keyed by the error message,
+        only for the messages which have at least one offending row.
+    """
+    if break_starts.ndim == 2:
+        starts, ends = starts[:, np.newaxis], ends[:, np.newaxis]
+    predicates = {
+        'end must be greater than or equal to start': ends < starts,
+        'break time end must be greater than or equal to break time start': break_ends < break_starts,
+        'break time start must be greater than or equal to start': break_starts < starts,
+        'break time end must be less than or equal to end': break_ends > ends,
+    }
+    return {
+        message: np.flatnonzero(mask.any(axis=1) if mask.ndim == 2 else mask)
+        for message, mask in predicates.items() if mask.any()
+    }
+
+def _break_microseconds_until(times: np.ndarray, break_starts: np.ndarray, break_ends: np.ndarray) -> np.ndarray:
+    """Returns the length of the union of the break times of each shift before the time of the shift.
+
+    The break times of each shift must be sorted by their starts. Each break time only adds
+    the part after the latest end of the break times before it, so overlaps count once.
+    """
+    if break_starts.shape[1] == 0:
+        return np.zeros(len(times), dtype=np.int64)
+    break_ends = np.minimum(break_ends, times[:, np.newaxis])
+    latest_ends = np.maximum.accumulate(break_ends, axis=1)
+    latest_ends_before = np.concatenate([np.full((len(times), 1), np.iinfo(np.int64).min), latest_ends[:, :-1]], axis=1)
+    return np.maximum(break_ends - np.maximum(break_starts, latest_ends_before), 0).sum(axis=1)
+
+def _calendar(days: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Returns the ISO years, week numbers and weekdays, and the years and months of days since the epoch.
+    """
+    weekdays = (days + 3) % 7 + 1
+    thursdays = (days - weekdays + 4).astype('datetime64[D]')
+    iso_years = thursdays.astype('datetime64[Y]')
+    week_numbers = (thursdays - iso_years.astype('datetime64[D]')).astype(np.int64) // 7 + 1
+    months = days.astype('datetime64[D]').astype('datetime64[M]').astype(np.int64)
+    return (iso_years.astype(np.int64) + 1970, week_numbers, weekdays, months // 12 + 1970, months % 12 + 1)
+
+class _Grouping:
+    """Rows grouped by an integer key, ready for grouped reductions with np.add.reduceat.
+
+    Groups are numbered in the order their key first appears in all rows, which is the
+    insertion order of the nested dicts built by Attendance. Only the selected rows take
+    part in the reductions.
+    """
+    def __init__(self, keys: np.ndarray, selected: np.ndarray):
+        unique_keys, first_indexes, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        order_of_appearance = np.argsort(first_indexes, kind='stable')
+        group_numbers = np.empty_like(order_of_appearance)
+        group_numbers[order_of_appearance] = np.arange(len(order_of_appearance))
+
+        self.keys = unique_keys[order_of_appearance]
+        groups = group_numbers[inverse.reshape(-1)][selected]
+        order = np.argsort(groups, kind='stable')
+        self._rows = selected[order]
+        sorted_groups = groups[order]
+        self._boundaries = np.flatnonzero(np.r_[True, sorted_groups[1:] != sorted_groups[:-1]])
+
+    def sum(self, values: np.ndarray) -> np.ndarray:
+        if len(self.keys) == 0:
+            return np.zeros(0, dtype=values.dtype)
+        return np.add.reduceat(values[self._rows], self._boundaries)
+
+class ColumnarAttendance(Attendance):
+    """An attendance backed by arrays of timestamps instead of WorkingDate objects.
+
+    Each shift is stored as microseconds since the epoch in int64 arrays, one
+    row per shift and one column per break time. The break times of a shift
+    may overlap, and count once. The calendar position of every shift, and of
+    every day worked by the shifts crossing midnight, is computed once, and
+    every aggregate is a grouped reduction over the arrays. The results are
+    identical to those of Attendance, including the order of their periods and
+    a later shift replacing an earlier one which starts on the same day, in
+    whatever order the shifts are given.
+    """
+    def __init__(self, starts, ends, break_starts, break_ends):
+        """
+        Args:
+            starts: The starts of the shifts.
+            ends: The ends of the shifts.
+            break_starts: The starts of the break times, one per shift, or rows of any
+                number of them per shift where absent break times are NaT.
+            break_ends: The ends of the break times, in the same shape as break_starts.
+        """
+        starts = _to_microseconds(starts)
+        ends = _to_microseconds(ends)
+
+        if not len(starts) == len(ends) == len(break_starts) == len(break_ends):
+            raise ValueError("starts, ends, break_starts and break_ends must have the same length")
+        if not np.shape(break_starts) == np.shape(break_ends):
+            raise ValueError("break_starts and break_ends must have the same shape")
+        break_starts, break_ends = break_time_columns(starts, break_starts, break_ends)
+
+        errors = invalid_rows(starts, ends, break_starts, break_ends)
+        if errors:
+            raise ValueError('\n'.join(f'{message}\ncheck rows {rows.tolist()}' for message, rows in errors.items()))
+
+        order = np.argsort(break_starts, axis=1, kind='stable')
+        self._starts = starts
+        self._ends = ends
+        self._break_starts = np.take_along_axis(break_starts, order, axis=1)
+        self._break_ends = np.take_along_axis(break_ends, order, axis=1)
+        self._working_hours = (ends - starts) - _break_microseconds_until(ends, self._break_starts, self._break_ends)
+        self._materialized = None
+        self._aggregate_cache = OrderedDict()
+
+        days = starts // MICROSECONDS_PER_DAY
+        self._iso_years, self._week_numbers, self._weekdays, _, _ = _calendar(days)
+
+        # Like Attendance, only the last shift of each day takes part in the weekly,
+        # monthly and yearly aggregates. The days are ordered as Attendance iterates them,
+        # by the first shift of their ISO week and then by the first shift of the day, so the
+        # periods of the aggregates come in the same order even if a later shift replaces one.
+        _, first_indexes = np.unique(days, return_index=True)
+        _, last_indexes_reversed = np.unique(days[::-1], return_index=True)
+        _, first_indexes_of_weeks, weeks = np.unique(self._iso_years * 100 + self._week_numbers, return_index=True, return_inverse=True)
+        first_indexes_of_weeks_of_days = first_indexes_of_weeks[weeks.reshape(-1)[first_indexes]]
+        latest_of_each_day = (len(days) - 1 - last_indexes_reversed)[np.lexsort((first_indexes, first_indexes_of_weeks_of_days))]
+        self._latest_of_each_day = latest_of_each_day
+
+        # The days worked by those shifts: the day each one starts on, and each later day
+        # with work hours, as in WorkingDate._days_worked.
+        first_days = days[latest_of_each_day]
+        numbers_of_days = np.maximum((ends[latest_of_each_day] - 1) // MICROSECONDS_PER_DAY - first_days + 1, 1)
+        shifts = np.repeat(latest_of_each_day, numbers_of_days)
+        day_numbers = np.arange(len(shifts)) - np.repeat(np.cumsum(numbers_of_days) - numbers_of_days, numbers_of_days)
+        days_worked = days[shifts] + day_numbers
+        worked_before = self._worked_until(shifts, np.maximum(starts[shifts], days_worked * MICROSECONDS_PER_DAY))
+        worked_until = self._worked_until(shifts, np.minimum(ends[shifts], (days_worked + 1) * MICROSECONDS_PER_DAY))
+        kept = (day_numbers == 0) | (worked_until > worked_before)
+        self._shifts_of_days = shifts[kept]
+        self._worked_before = worked_before[kept]
+        self._worked_until_end_of_days = worked_until[kept]
+        days_worked = days_worked[kept]
+        self._last_ordinal_worked = int(days_worked.max()) + _EPOCH_ORDINAL if len(days_worked) else None
+        _, first_indexes = np.unique(days_worked, return_index=True)
+        self._is_first_of_day = np.zeros(len(days_worked), dtype=bool)
+        self._is_first_of_day[first_indexes] = True
+
+        iso_years, week_numbers, weekdays, years_of_months, months_of_years = _calendar(days_worked)
+        self._week_numbers_of_days = week_numbers
+        self._weekdays_of_days = weekdays
+        self._week_keys = iso_years * 100 + week_numbers
+        self._month_keys = years_of_months * 100 + months_of_years
+        all_days = np.arange(len(days_worked))
+        self._weeks = _Grouping(self._week_keys, all_days)
+        self._years = _Grouping(iso_years, all_days)
+        self._months = _Grouping(self._month_keys, all_days)
+        self._holiday_masks = {}
+
+    def _worked_until(self, shifts: np.ndarray, times: np.ndarray) -> np.ndarray:
+        return (times - self._starts[shifts]) - _break_microseconds_until(times, self._break_starts[shifts], self._break_ends[shifts])
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def period(self) -> Optional[Tuple[datetime, datetime]]:
+        if len(self._starts) == 0:
+            return None
+        return (self._starts.min().astype('datetime64[us]').item(), self._starts.max().astype('datetime64[us]').item())
+
+    def _last_day_worked(self) -> Optional[int]:
+        return self._last_ordinal_worked
+
+    def _materialize(self) -> Tuple[List[WorkingDate], dict, dict]:
+        if self._materialized is None:
+            def to_datetimes(values):
+                return values.astype('datetime64[us]').tolist()
+
+            dates = [
+                WorkingDate(start, end, [BreakTime(break_start, break_end) for break_start, break_end in zip(break_starts, break_ends)])
+                for start, end, break_starts, break_ends in zip(
+                    to_datetimes(self._starts), to_datetimes(self._ends),
+                    to_datetimes(self._break_starts), to_datetimes(self._break_ends))
+            ]
+            attendance = Attendance(dates)
+            self._materialized = (dates, attendance._isocalendar_based_dates, attendance._monthly_based_dates)
+        return self._materialized
+
+    @property
+    def _dates(self) -> List[WorkingDate]:
+        return self._materialize()[0]
+
+    @property
+    def _isocalendar_based_dates(self) -> Dict[Tuple[int, int], Dict[int, WorkingDate]]:
+        return self._materialize()[1]
+
+    @property
+    def _monthly_based_dates(self) -> Dict[Tuple[int, int], Dict[int, WorkingDate]]:
+        return self._materialize()[2]
+
+    def _holiday_masks_of(self, legal_holidays: Union[List[LegalHoliday], LegalHolidayTable]) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns whether each shift starts on a legal holiday, and whether each day worked is one.
+        """
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        masks = self._holiday_masks.get(legal_holidays.table)
+        if masks is None:
+            # week_number % 4 ranges from 0 to 3, so holidays outside of it never match.
+            table = np.zeros((4, 8), dtype=bool)
+            for week_number_of_4weeks, weekday in legal_holidays.table:
+                if 0 <= week_number_of_4weeks < 4 and 1 <= weekday <= 7:
+                    table[week_number_of_4weeks, weekday] = True
+            masks = (table[self._week_numbers % 4, self._weekdays], table[self._week_numbers_of_days % 4, self._weekdays_of_days])
+            self._holiday_masks[legal_holidays.table] = masks
+        return masks
+
+    def _overtime(self, working_hours_per_day: timedelta) -> np.ndarray:
+        return np.maximum(self._working_hours - working_hours_per_day // timedelta(microseconds=1), 0)
+
+    def _work_hours_of_days(self, working_hours_per_day: timedelta) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns the regular work hours and the overtime of each day worked, in microseconds.
+        """
+        regular_work_hours = np.minimum(self._working_hours[self._shifts_of_days], working_hours_per_day // timedelta(microseconds=1))
+        regular_work_hours_of_days = np.minimum(self._worked_until_end_of_days, regular_work_hours) - np.minimum(self._worked_before, regular_work_hours)
+        return (regular_work_hours_of_days, self._worked_until_end_of_days - self._worked_before - regular_work_hours_of_days)
+
+    def _overtime_work_hours(self, working_hours_per_day: timedelta, legal_holidays) -> Tuple[np.ndarray, np.ndarray]:
+        _, overtime = self._work_hours_of_days(working_hours_per_day)
+        _, holiday_mask = self._holiday_masks_of(legal_holidays)
+        return (np.where(holiday_mask, overtime, 0), np.where(holiday_mask, 0, overtime))
+
+    def daily_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Tuple[List[timedelta], List[timedelta]]:
+        overtime = self._overtime(working_hours_per_day)
+        holiday_mask, _ = self._holiday_masks_of(legal_holidays)
+        return (_to_timedeltas(overtime[holiday_mask]), _to_timedeltas(overtime[~holiday_mask]))
+
+    def _periodic_overtime_work_hours(self, grouping: _Grouping, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
+        overtime_of_holidays, overtime_of_non_holidays = self._overtime_work_hours(working_hours_per_day, legal_holidays)
+        overtime_hours = {}
+        for key, overtime_of_holidays, overtime_of_non_holidays in zip(
+                grouping.keys.tolist(),
+                _to_timedeltas(grouping.sum(overtime_of_holidays)),
+                _to_timedeltas(grouping.sum(overtime_of_non_holidays))):
+            year, period = divmod(key, 100)
+            overtime_hours.setdefault(year, {})[period] = (overtime_of_holidays, overtime_of_non_holidays)
+        return overtime_hours
+
+    def weekly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
+        return self._periodic_overtime_work_hours(self._weeks, working_hours_per_day, legal_holidays)
+
+    def monthly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
+        return self._periodic_overtime_work_hours(self._months, working_hours_per_day, legal_holidays)
+
+    def yearly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Tuple[timedelta, timedelta]]:
+        overtime_of_holidays, overtime_of_non_holidays = self._overtime_work_hours(working_hours_per_day, legal_holidays)
+        return dict(zip(
+            self._years.keys.tolist(),
+            zip(_to_timedeltas(self._years.sum(overtime_of_holidays)), _to_timedeltas(self._years.sum(overtime_of_non_holidays)))
+        ))
+
+    def weekly_regular_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Dict[Tuple[int, int], timedelta]]]:
+        _, holiday_mask = self._holiday_masks_of(legal_holidays)
+        regular_work_hours, _ = self._work_hours_of_days(working_hours_per_day)
+        selected = np.flatnonzero(~holiday_mask)
+        # Sorting by the week and then the month puts the months of each week in the order of the days.
+        keys = (self._week_keys * 1_000_000 + self._month_keys)[selected]
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        boundaries = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]) if len(sorted_keys) else np.zeros(0, dtype=np.int64)
+        sums = np.add.reduceat(regular_work_hours[selected][order], boundaries) if len(sorted_keys) else np.zeros(0, dtype=np.int64)
+
+        regular_hours = {}
+        for key in self._weeks.keys.tolist():
+            year, week_number = divmod(key, 100)
+            regular_hours.setdefault(year, {})[week_number] = {}
+        for key, regular_work_hours_of_month in zip(sorted_keys[boundaries].tolist(), _to_timedeltas(sums)):
+            week_key, month_key = divmod(key, 1_000_000)
+            year, week_number = divmod(week_key, 100)
+            regular_hours[year][week_number][divmod(month_key, 100)] = regular_work_hours_of_month
+        return regular_hours
+
+    def monthly_holiday_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, timedelta]]:
+        _, holiday_mask = self._holiday_masks_of(legal_holidays)
+        selected = np.flatnonzero(holiday_mask)
+        grouping = _Grouping(self._month_keys[selected], np.arange(len(selected)))
+        work_hours = {}
+        for key, work_hours_of_month in zip(grouping.keys.tolist(), grouping.sum((self._worked_until_end_of_days - self._worked_before)[selected]).tolist()):
+            if work_hours_of_month:
+                year, month = divmod(key, 100)
+                work_hours.setdefault(year, {})[month] = timedelta(microseconds=work_hours_of_month)
+        return work_hours
+
+    def weekly_count_worked_on_legal_holidays(self, legal_holidays: List[LegalHoliday]) -> Dict[int, Dict[int, int]]:
+        _, holiday_mask = self._holiday_masks_of(legal_holidays)
+        counts = {}
+        for key, count in zip(self._weeks.keys.tolist(), self._weeks.sum((holiday_mask & self._is_first_of_day).astype(np.int64)).tolist()):
+            year, week_number = divmod(key, 100)
+            counts.setdefault(year, {})[week_number] = count
+        return counts
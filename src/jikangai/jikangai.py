@@ -1,5 +1,72 @@
-from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from collections import OrderedDict
+from datetime import date as _date, datetime, timedelta, timezone, tzinfo
+from typing import TYPE_CHECKING, Dict, FrozenSet, Hashable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+from .tracer import NULL_TRACER, Tracer
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+    import numpy as np
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+_WORKING_HOURS_PER_WEEK = timedelta(hours=40)
+
+def _to_microseconds(value: datetime, utcoffset: Optional[timedelta]) -> int:
+    """Converts a datetime to microseconds since the epoch.
+
+    A timezone aware datetime is converted to its wall clock time at utcoffset, so datetimes
+    of other UTC offsets keep the elapsed times between them. Naive datetimes take no utcoffset.
+    """
+    offset = value.utcoffset()
+    if (offset is None) != (utcoffset is None):
+        raise TypeError("can't compare offset-naive and offset-aware datetimes")
+    if offset is not None:
+        value = value.replace(tzinfo=None) + (utcoffset - offset)
+    return (value - _EPOCH) // _MICROSECOND
+
+def _to_datetime(microseconds: int, tz: Optional[tzinfo], utcoffset: Optional[timedelta] = None) -> datetime:
+    """Converts microseconds since the epoch back to a datetime in tz.
+
+    Args:
+        utcoffset (timedelta, optional): The UTC offset the microseconds are the wall clock
+            time at, if not that of tz at the time itself.
+    """
+    value = _EPOCH + timedelta(microseconds=microseconds)
+    if tz is None or utcoffset is None:
+        return value.replace(tzinfo=tz)
+    return (value - utcoffset).replace(tzinfo=timezone.utc).astimezone(tz)
+
+def _merge_intervals(intervals: Iterable[Tuple[int, int]]) -> Tuple[int, ...]:
+    """Sorts the intervals by their starts and merges those which overlap or touch, dropping empty ones.
+
+    Returns:
+        Tuple[int, ...]: The starts and the ends of the merged intervals, flattened in order.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if start == end:
+            continue
+        if merged and start <= merged[-1]:
+            merged[-1] = max(merged[-1], end)
+        else:
+            merged.append(start)
+            merged.append(end)
+    return tuple(merged)
+
+_CALENDAR_OF_DAYS = {}
+
+def _calendar_of_day(ordinal: int) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    """Returns the ISO year and week number, and the year and month of a day given as its ordinal.
+    """
+    calendar = _CALENDAR_OF_DAYS.get(ordinal)
+    if calendar is None:
+        day = _date.fromordinal(ordinal)
+        iso_year, week_number, _ = day.isocalendar()
+        calendar = ((iso_year, week_number), (day.year, day.month))
+        _CALENDAR_OF_DAYS[ordinal] = calendar
+    return calendar
 
 class LegalHoliday:
     def __init__(self, week_number_of_4weeks: int, weekday: int = 7):
@@ -22,50 +89,149 @@ class LegalHoliday:
     def of_every_sunday() -> List['LegalHoliday']:
         return [LegalHoliday(1), LegalHoliday(2), LegalHoliday(3), LegalHoliday(4)]
 
+class LegalHolidayTable:
+    """Legal holidays compiled into a lookup table of (week_number % 4, weekday).
+
+    The classification of each day is cached, so a table shared by every attendance
+    validated against the same CompanyProfile classifies each day only once. It iterates
+    over its legal holidays, so it can be passed wherever a list of them is expected.
+    """
+    def __init__(self, legal_holidays: List[LegalHoliday]):
+        self._legal_holidays = list(legal_holidays)
+        self._table = frozenset((holiday.week_number_of_4weeks, holiday.weekday) for holiday in self._legal_holidays)
+        self._classified_days = {}
+
+    @property
+    def legal_holidays(self) -> List[LegalHoliday]:
+        return self._legal_holidays
+
+    @property
+    def table(self) -> FrozenSet[Tuple[int, int]]:
+        """The pairs of week_number_of_4weeks and weekday of the legal holidays.
+        """
+        return self._table
+
+    def __iter__(self) -> Iterator[LegalHoliday]:
+        return iter(self._legal_holidays)
+
+    def __len__(self) -> int:
+        return len(self._legal_holidays)
+
+    def is_legal_holiday(self, day: datetime) -> bool:
+        return self.is_legal_holiday_of_ordinal(day.toordinal())
+
+    def is_legal_holiday_of_ordinal(self, ordinal: int) -> bool:
+        """Classifies a day given as its proleptic Gregorian ordinal, see date.toordinal().
+        """
+        is_legal_holiday = self._classified_days.get(ordinal)
+        if is_legal_holiday is None:
+            _, week_number, weekday = _date.fromordinal(ordinal).isocalendar()
+            is_legal_holiday = (week_number % 4, weekday) in self._table
+            self._classified_days[ordinal] = is_legal_holiday
+        return is_legal_holiday
+
 class BreakTime:
+    """A break time stored as microseconds since the epoch.
+
+    Timezone aware datetimes are stored as their wall clock time at the UTC offset of the
+    start, with the timezone of the start kept aside.
+    """
+    __slots__ = ('_start', '_end', '_tzinfo')
+
     def __init__(self, start: datetime, end: datetime):
-        if not end >= start:
-            raise ValueError("end must be greater than or equal to start")
+        utcoffset = start.utcoffset()
+        self._start = _to_microseconds(start, utcoffset)
+        self._end = _to_microseconds(end, utcoffset)
+        self._tzinfo = start.tzinfo
 
-        self._start = start
-        self._end = end
+        if not self._end >= self._start:
+            raise ValueError("end must be greater than or equal to start")
 
     @property
     def start(self) -> datetime:
-        return self._start
+        return _to_datetime(self._start, self._tzinfo)
 
     @property
     def end(self) -> datetime:
-        return self._end
+        return _to_datetime(self._end, self._tzinfo, self.start.utcoffset())
 
     def value(self) -> timedelta:
-        return self._end - self._start
+        return timedelta(microseconds=self._end - self._start)
 
 class WorkingDate:
+    """A working date stored as microseconds since the epoch.
+
+    The break times are sorted and merged where they overlap, then flattened into a tuple
+    of their starts and ends, so a working date holds no datetime or BreakTime objects.
+    Timezone aware datetimes are stored as their wall clock time at the UTC offset of the
+    start, so its days are those of the start's timezone, with that timezone kept aside.
+
+    A working date belongs to the day it starts on, even if it crosses midnight, but its
+    work hours are split at midnight between the days it spans, see _days_worked.
+    """
+    __slots__ = ('_start', '_end', '_break_times', '_tzinfo')
+
     def __init__(self, start: datetime, end: datetime, break_time_list: List[BreakTime]):
-        if not end >= start:
+        utcoffset = start.utcoffset()
+        self._start = _to_microseconds(start, utcoffset)
+        self._end = _to_microseconds(end, utcoffset)
+        self._tzinfo = start.tzinfo
+
+        if not self._end >= self._start:
             raise ValueError("end must be greater than or equal to start")
 
+        break_times = []
         for item in break_time_list:
-            if not item.start >= start:
+            if item._tzinfo is None and utcoffset is None:
+                break_start, break_end = item._start, item._end
+            else:
+                break_start, break_end = _to_microseconds(item.start, utcoffset), _to_microseconds(item.end, utcoffset)
+            if not break_start >= self._start:
                 raise ValueError("break time start must be greater than or equal to start")
-            elif not item.end <= end:
+            elif not break_end <= self._end:
                 raise ValueError("break time end must be less than or equal to end")
+            break_times.append((break_start, break_end))
+        self._break_times = _merge_intervals(break_times)
 
-        self._start = start
-        self._end = end
-        self._break_time_list = break_time_list
+    @property
+    def start(self) -> datetime:
+        return _to_datetime(self._start, self._tzinfo)
+
+    @property
+    def end(self) -> datetime:
+        return _to_datetime(self._end, self._tzinfo, self._utcoffset())
+
+    def _utcoffset(self) -> Optional[timedelta]:
+        return self.start.utcoffset()
+
+    @property
+    def break_time_list(self) -> List[BreakTime]:
+        """The break times in order, with overlapping ones merged.
+        """
+        break_times = self._break_times
+        utcoffset = self._utcoffset()
+        return [
+            BreakTime(_to_datetime(break_times[i], self._tzinfo, utcoffset), _to_datetime(break_times[i + 1], self._tzinfo, utcoffset))
+            for i in range(0, len(break_times), 2)
+        ]
+
+    def _break_microseconds(self) -> int:
+        break_times = self._break_times
+        return sum(break_times[1::2]) - sum(break_times[0::2])
 
     def break_time(self) -> timedelta:
-        total_break_time = timedelta()
-        for item in self._break_time_list:
-            total_break_time += item.value()
-        return total_break_time
+        return timedelta(microseconds=self._break_microseconds())
+
+    def _ordinal(self) -> int:
+        return _EPOCH_ORDINAL + self._start // _MICROSECONDS_PER_DAY
 
     def isocalendar(self):
-        return self._start.isocalendar()
+        return _date.fromordinal(self._ordinal()).isocalendar()
+
+    def is_legal_holiday(self, legal_holidays: Union[List[LegalHoliday], LegalHolidayTable]) -> bool:
+        if isinstance(legal_holidays, LegalHolidayTable):
+            return legal_holidays.is_legal_holiday_of_ordinal(self._ordinal())
 
-    def is_legal_holiday(self, legal_holidays: List[LegalHoliday]) -> bool:
         _, week_number, weekday = self.isocalendar()
         week_number_of_4weeks = week_number % 4
         return any(week_number_of_4weeks == holiday.week_number_of_4weeks and weekday == holiday.weekday for holiday in legal_holidays)
@@ -76,17 +242,145 @@ class WorkingDate:
         Returns:
             Tuple[int, int, int]: A tuple containing the year, month, and day components.
         """
-        return (self._start.year, self._start.month, self._start.day)
+        start_date = _date.fromordinal(self._ordinal())
+        return (start_date.year, start_date.month, start_date.day)
 
     def overtime_work_hours(self, legal_working_hours: timedelta) -> timedelta:
         return max(self.working_hours() - legal_working_hours, timedelta())
 
     def working_hours(self) -> timedelta:
-        return self._end - self._start - self.break_time()
+        return timedelta(microseconds=self._end - self._start - self._break_microseconds())
+
+    def _worked_microseconds_until(self, time: int) -> int:
+        break_times = self._break_times
+        worked = time - self._start
+        for i in range(0, len(break_times), 2):
+            if break_times[i] >= time:
+                break
+            worked -= min(break_times[i + 1], time) - break_times[i]
+        return worked
+
+    def _days_worked(self, working_hours_per_day: int) -> List[Tuple[int, int, int]]:
+        """Splits the work hours at midnight into the days the date spans.
+
+        The first working_hours_per_day microseconds worked are regular work hours and the
+        rest is overtime, so the overtime of a date crossing midnight falls on the day of
+        its last hours.
+
+        Returns:
+            List[Tuple[int, int, int]]: The ordinal, the regular work hours and the overtime in
+            microseconds of the first day, and of each later day with work hours, in order.
+        """
+        first_day = self._start // _MICROSECONDS_PER_DAY
+        last_day = (self._end - 1) // _MICROSECONDS_PER_DAY
+        working_hours = self._end - self._start - self._break_microseconds()
+        regular_work_hours = min(working_hours, working_hours_per_day)
+        if not last_day > first_day:
+            return [(_EPOCH_ORDINAL + first_day, regular_work_hours, working_hours - regular_work_hours)]
+
+        days = []
+        worked_before = 0
+        for day in range(first_day, last_day + 1):
+            worked = self._worked_microseconds_until(min((day + 1) * _MICROSECONDS_PER_DAY, self._end))
+            if worked > worked_before or day == first_day:
+                regular_work_hours_of_day = min(worked, regular_work_hours) - min(worked_before, regular_work_hours)
+                days.append((_EPOCH_ORDINAL + day, regular_work_hours_of_day, worked - worked_before - regular_work_hours_of_day))
+            worked_before = worked
+        return days
+
+def _statutory_overtime_of_week(regular_work_hours_of_months: Dict[Tuple[int, int], timedelta], working_hours_per_week: timedelta) -> Iterator[Tuple[Tuple[int, int], timedelta]]:
+    # The regular work hours of a week are given per month in the order of the dates, so the
+    # hours beyond the working hours per week go to the month of the dates which cross it.
+    regular_work_hours = timedelta()
+    for month, regular_work_hours_of_month in regular_work_hours_of_months.items():
+        overtime_before = max(regular_work_hours - working_hours_per_week, timedelta())
+        regular_work_hours += regular_work_hours_of_month
+        yield (month, max(regular_work_hours - working_hours_per_week, timedelta()) - overtime_before)
+
+def _statutory_overtime_work_hours(weekly_regular_work_hours: Dict[int, Dict[int, Dict[Tuple[int, int], timedelta]]], working_hours_per_week: timedelta) -> Tuple[Dict[int, Dict[int, timedelta]], Dict[int, Dict[int, timedelta]]]:
+    weekly_overtime_hours = {}
+    monthly_overtime_hours = {}
+    for year, weeks in weekly_regular_work_hours.items():
+        for week_number, regular_work_hours_of_months in weeks.items():
+            total_overtime = timedelta()
+            for (calendar_year, month), overtime in _statutory_overtime_of_week(regular_work_hours_of_months, working_hours_per_week):
+                total_overtime += overtime
+                months = monthly_overtime_hours.setdefault(calendar_year, {})
+                months[month] = months.get(month, timedelta()) + overtime
+            weekly_overtime_hours.setdefault(year, {})[week_number] = total_overtime
+    return (weekly_overtime_hours, monthly_overtime_hours)
+
+class Aggregates(NamedTuple):
+    """All the aggregates of an attendance for a working hours per day and a set of legal holidays.
+
+    The statutory overtime is the overtime beyond the working hours per week, see
+    Attendance.weekly_statutory_overtime_work_hours. It is derived from the weekly regular
+    work hours, which unlike it can be added up across attendances sharing a week.
+    The monthly holiday work hours are all the hours worked on legal holidays, which count
+    toward the caps on overtime including holiday work together with the overtime of non holidays.
+    """
+    daily_overtime_work_hours: Tuple[List[timedelta], List[timedelta]]
+    weekly_overtime_work_hours: Dict[int, Dict[int, Tuple[timedelta, timedelta]]]
+    monthly_overtime_work_hours: Dict[int, Dict[int, Tuple[timedelta, timedelta]]]
+    yearly_overtime_work_hours: Dict[int, Tuple[timedelta, timedelta]]
+    weekly_count_worked_on_legal_holidays: Dict[int, Dict[int, int]]
+    weekly_regular_work_hours: Dict[int, Dict[int, Dict[Tuple[int, int], timedelta]]] = {}
+    weekly_statutory_overtime_work_hours: Dict[int, Dict[int, timedelta]] = {}
+    monthly_statutory_overtime_work_hours: Dict[int, Dict[int, timedelta]] = {}
+    monthly_holiday_work_hours: Dict[int, Dict[int, timedelta]] = {}
+
+    def merge(self, other: 'Aggregates', working_hours_per_week: timedelta = _WORKING_HOURS_PER_WEEK) -> 'Aggregates':
+        """Returns the aggregates of the dates of both, which must not have dates on the same days.
+
+        The dates of other must be later than those of this in the weeks they share, and the
+        statutory overtime of the merged weeks is derived again for the working hours per week.
+        A legal holiday worked by a date of this crossing midnight and by a date of other would
+        be counted in both weekly counts, so the weekly count of other must leave it out, as
+        AggregateStore does.
+        """
+        def merge_periodic(periodic, other_periodic, add):
+            merged = {year: dict(periods) for year, periods in periodic.items()}
+            for year, periods in other_periodic.items():
+                merged_periods = merged.setdefault(year, {})
+                for period, value in periods.items():
+                    merged_periods[period] = add(merged_periods[period], value) if period in merged_periods else value
+            return merged
+
+        def add_overtime(overtime, other_overtime):
+            return (overtime[0] + other_overtime[0], overtime[1] + other_overtime[1])
+
+        def add_regular_work_hours(regular_work_hours_of_months, other_regular_work_hours_of_months):
+            merged_regular_work_hours_of_months = dict(regular_work_hours_of_months)
+            for month, regular_work_hours in other_regular_work_hours_of_months.items():
+                merged_regular_work_hours_of_months[month] = merged_regular_work_hours_of_months.get(month, timedelta()) + regular_work_hours
+            return merged_regular_work_hours_of_months
+
+        weekly_regular_work_hours = merge_periodic(self.weekly_regular_work_hours, other.weekly_regular_work_hours, add_regular_work_hours)
+        weekly_statutory_overtime_work_hours, monthly_statutory_overtime_work_hours = _statutory_overtime_work_hours(weekly_regular_work_hours, working_hours_per_week)
+
+        yearly_overtime_work_hours = dict(self.yearly_overtime_work_hours)
+        for year, overtime in other.yearly_overtime_work_hours.items():
+            yearly_overtime_work_hours[year] = add_overtime(yearly_overtime_work_hours[year], overtime) if year in yearly_overtime_work_hours else overtime
+
+        return Aggregates(
+            (self.daily_overtime_work_hours[0] + other.daily_overtime_work_hours[0], self.daily_overtime_work_hours[1] + other.daily_overtime_work_hours[1]),
+            merge_periodic(self.weekly_overtime_work_hours, other.weekly_overtime_work_hours, add_overtime),
+            merge_periodic(self.monthly_overtime_work_hours, other.monthly_overtime_work_hours, add_overtime),
+            yearly_overtime_work_hours,
+            merge_periodic(self.weekly_count_worked_on_legal_holidays, other.weekly_count_worked_on_legal_holidays, lambda count, other_count: count + other_count),
+            weekly_regular_work_hours,
+            weekly_statutory_overtime_work_hours,
+            monthly_statutory_overtime_work_hours,
+            merge_periodic(self.monthly_holiday_work_hours, other.monthly_holiday_work_hours, lambda work_hours, other_work_hours: work_hours + other_work_hours)
+        )
 
 class Attendance:
+    # The maximum number of Aggregates cached by aggregates, evicting the least recently used first.
+    aggregate_cache_size = 8
+
     def __init__(self, dates: List[WorkingDate]):
         self._dates = dates
+        self._aggregate_cache = OrderedDict()
 
         isocalendar_based_dates = {}
         for date in dates:
@@ -104,14 +398,110 @@ class Attendance:
     def isocalendar_based_dates(self) -> Dict[Tuple[int, int], Dict[int, WorkingDate]]:
         return self._isocalendar_based_dates
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_aggregate_cache'] = OrderedDict()
+        return state
+
+    def aggregates(self,
+                   working_hours_per_day: timedelta,
+                   legal_holidays: Union[List[LegalHoliday], LegalHolidayTable],
+                   tracer=NULL_TRACER,
+                   working_hours_per_week: timedelta = _WORKING_HOURS_PER_WEEK) -> Aggregates:
+        """Returns all the aggregates, computing them only once per working hours per day and set of legal holidays.
+
+        The aggregates are cached, so validating the same attendance against other limits of
+        Agreement36 reuses them. The cached aggregates are shared and must not be modified.
+        Call invalidate_aggregates after modifying the dates given to this attendance.
+
+        Args:
+            working_hours_per_day (timedelta): The working hours per day beyond which hours are overtime.
+            legal_holidays (Union[List[LegalHoliday], LegalHolidayTable]): The legal holidays.
+            tracer (Tracer, optional): Records the time spent in each aggregate when they are computed.
+            working_hours_per_week (timedelta, optional): The working hours per week beyond which hours are statutory overtime.
+        """
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        key = (working_hours_per_day, legal_holidays.table, working_hours_per_week)
+        aggregates = self._aggregate_cache.get(key)
+        if aggregates is not None:
+            self._aggregate_cache.move_to_end(key)
+            return aggregates
+
+        with tracer.phase('daily_overtime_work_hours'):
+            daily_overtime_work_hours = self.daily_overtime_work_hours(working_hours_per_day, legal_holidays)
+        with tracer.phase('weekly_overtime_work_hours'):
+            weekly_overtime_work_hours = self.weekly_overtime_work_hours(working_hours_per_day, legal_holidays)
+        with tracer.phase('monthly_overtime_work_hours'):
+            monthly_overtime_work_hours = self.monthly_overtime_work_hours(working_hours_per_day, legal_holidays)
+        with tracer.phase('yearly_overtime_work_hours'):
+            yearly_overtime_work_hours = self.yearly_overtime_work_hours(working_hours_per_day, legal_holidays)
+        with tracer.phase('weekly_count_worked_on_legal_holidays'):
+            weekly_count_worked_on_legal_holidays = self.weekly_count_worked_on_legal_holidays(legal_holidays)
+        with tracer.phase('weekly_regular_work_hours'):
+            weekly_regular_work_hours = self.weekly_regular_work_hours(working_hours_per_day, legal_holidays)
+        with tracer.phase('statutory_overtime_work_hours'):
+            weekly_statutory_overtime_work_hours, monthly_statutory_overtime_work_hours = _statutory_overtime_work_hours(weekly_regular_work_hours, working_hours_per_week)
+        with tracer.phase('monthly_holiday_work_hours'):
+            monthly_holiday_work_hours = self.monthly_holiday_work_hours(working_hours_per_day, legal_holidays)
+
+        aggregates = Aggregates(
+            daily_overtime_work_hours, weekly_overtime_work_hours, monthly_overtime_work_hours, yearly_overtime_work_hours, weekly_count_worked_on_legal_holidays,
+            weekly_regular_work_hours, weekly_statutory_overtime_work_hours, monthly_statutory_overtime_work_hours, monthly_holiday_work_hours
+        )
+        self._aggregate_cache[key] = aggregates
+        while len(self._aggregate_cache) > self.aggregate_cache_size:
+            self._aggregate_cache.popitem(last=False)
+        return aggregates
+
+    def period(self) -> Optional[Tuple[datetime, datetime]]:
+        """Returns the start of the first and of the last date, or None if there are no dates.
+        """
+        dates = list(self._dates)
+        if not dates:
+            return None
+        return (min(dates, key=lambda date: date._start).start, max(dates, key=lambda date: date._start).start)
+
+    def invalidate_aggregates(self):
+        """Discards the cached aggregates.
+        """
+        self._aggregate_cache.clear()
+
+    def _last_day_worked(self) -> Optional[int]:
+        """Returns the ordinal of the last day worked, which is the day after the last date if it crosses midnight.
+        """
+        return max((ordinal for ordinal, _, _ in self._days_worked(timedelta())), default=None)
+
     def _dates_of_holidays_and_non_holidays(self, dates, legal_holidays) -> Tuple[List[WorkingDate], List[WorkingDate]]:
-        dates_of_holidays = [date for date in dates if date.is_legal_holiday(legal_holidays)]
-        dates_of_non_holidays = [date for date in dates if not date.is_legal_holiday(legal_holidays)]
+        dates_of_holidays = []
+        dates_of_non_holidays = []
+        for date in dates:
+            if date.is_legal_holiday(legal_holidays):
+                dates_of_holidays.append(date)
+            else:
+                dates_of_non_holidays.append(date)
         return (dates_of_holidays, dates_of_non_holidays)
 
-    def _sum_overtime_work_hours(self, dates, working_hours_per_day) -> timedelta:
-        return sum([date.overtime_work_hours(working_hours_per_day) for date in dates], timedelta())
-        
+    def _days_worked(self, working_hours_per_day: timedelta) -> Iterator[Tuple[int, int, int]]:
+        """Yields the days worked by the last date of each day, see WorkingDate._days_worked.
+
+        A date crossing midnight counts in the weeks, months and years of the days it spans,
+        and is holiday work on the legal holidays among them.
+        """
+        working_hours_per_day = working_hours_per_day // _MICROSECOND
+        for week in self._isocalendar_based_dates.values():
+            for date in week.values():
+                yield from date._days_worked(working_hours_per_day)
+
+    def _sum_overtime_of_days(self, working_hours_per_day, legal_holidays, period_of_day) -> Dict[Hashable, List[int]]:
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        totals = {}
+        for ordinal, _, overtime in self._days_worked(working_hours_per_day):
+            total = totals.setdefault(period_of_day(ordinal), [0, 0])
+            total[0 if legal_holidays.is_legal_holiday_of_ordinal(ordinal) else 1] += overtime
+        return totals
+
     def daily_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Tuple[List[timedelta], List[timedelta]]:
         dates_of_holidays, dates_of_non_holidays = self._dates_of_holidays_and_non_holidays(self._dates, legal_holidays)
         return ([date.overtime_work_hours(working_hours_per_day) for date in dates_of_holidays],
@@ -119,42 +509,401 @@ class Attendance:
 
     def weekly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
         overtime_hours = {}
-        for (year, week_number), week in self._isocalendar_based_dates.items():
-            dates_of_holidays, dates_of_non_holidays = self._dates_of_holidays_and_non_holidays(week.values(), legal_holidays)
-            overtime_hours.setdefault(year, {})[week_number] = (
-                self._sum_overtime_work_hours(dates_of_holidays, working_hours_per_day),
-                self._sum_overtime_work_hours(dates_of_non_holidays, working_hours_per_day)
-            )
+        for (year, week_number), (overtime_of_holidays, overtime_of_non_holidays) in self._sum_overtime_of_days(
+                working_hours_per_day, legal_holidays, lambda ordinal: _calendar_of_day(ordinal)[0]).items():
+            overtime_hours.setdefault(year, {})[week_number] = (timedelta(microseconds=overtime_of_holidays), timedelta(microseconds=overtime_of_non_holidays))
         return overtime_hours
 
     def monthly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
         overtime_hours = {}
-        for (year, month_number), month in self._monthly_based_dates.items():
-            dates_of_holidays, dates_of_non_holidays = self._dates_of_holidays_and_non_holidays(month.values(), legal_holidays)
-            overtime_hours.setdefault(year, {})[month_number] = (
-                self._sum_overtime_work_hours(dates_of_holidays, working_hours_per_day),
-                self._sum_overtime_work_hours(dates_of_non_holidays, working_hours_per_day)
-            )
+        for (year, month_number), (overtime_of_holidays, overtime_of_non_holidays) in self._sum_overtime_of_days(
+                working_hours_per_day, legal_holidays, lambda ordinal: _calendar_of_day(ordinal)[1]).items():
+            overtime_hours.setdefault(year, {})[month_number] = (timedelta(microseconds=overtime_of_holidays), timedelta(microseconds=overtime_of_non_holidays))
         return overtime_hours
 
     def yearly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, timedelta]]:
+        return {
+            year: (timedelta(microseconds=overtime_of_holidays), timedelta(microseconds=overtime_of_non_holidays))
+            for year, (overtime_of_holidays, overtime_of_non_holidays) in self._sum_overtime_of_days(
+                working_hours_per_day, legal_holidays, lambda ordinal: _calendar_of_day(ordinal)[0][0]).items()
+        }
+
+    def weekly_count_worked_on_legal_holidays(self, legal_holidays: List[LegalHoliday]) -> int:
+        """Returns the number of legal holidays worked in each ISO week, including those
+        worked only by a date which started the day before.
+        """
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        days = dict.fromkeys(ordinal for ordinal, _, _ in self._days_worked(timedelta()))
+        counts = {}
+        for ordinal in days:
+            (year, week_number), _ = _calendar_of_day(ordinal)
+            weeks = counts.setdefault(year, {})
+            weeks[week_number] = weeks.get(week_number, 0) + int(legal_holidays.is_legal_holiday_of_ordinal(ordinal))
+        return counts
+
+    def weekly_regular_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Dict[Tuple[int, int], timedelta]]]:
+        """Returns the work hours within the working hours per day of non holidays of each ISO week,
+        split by the year and the month of the days in their order.
+
+        Hours beyond the working hours per day are already daily overtime, and work on legal
+        holidays is holiday work, so neither counts toward the working hours per week.
+        """
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        regular_hours = {}
+        for ordinal, regular_work_hours, _ in self._days_worked(working_hours_per_day):
+            (year, week_number), month = _calendar_of_day(ordinal)
+            regular_hours_of_months = regular_hours.setdefault(year, {}).setdefault(week_number, {})
+            if not legal_holidays.is_legal_holiday_of_ordinal(ordinal):
+                regular_hours_of_months[month] = regular_hours_of_months.get(month, 0) + regular_work_hours
+        # The months of a week are consecutive, so sorting them puts them in the order of the days.
+        return {
+            year: {
+                week_number: {month: timedelta(microseconds=regular_work_hours) for month, regular_work_hours in sorted(regular_hours_of_months.items())}
+                for week_number, regular_hours_of_months in weeks.items()
+            }
+            for year, weeks in regular_hours.items()
+        }
+
+    def monthly_holiday_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, timedelta]]:
+        """Returns all the hours worked on legal holidays of each month, within the working hours per day or not.
+
+        Months without hours worked on legal holidays are left out.
+        """
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        work_hours = {}
+        for ordinal, regular_work_hours, overtime in self._days_worked(working_hours_per_day):
+            if legal_holidays.is_legal_holiday_of_ordinal(ordinal):
+                _, month = _calendar_of_day(ordinal)
+                work_hours[month] = work_hours.get(month, 0) + regular_work_hours + overtime
+        holiday_work_hours = {}
+        for (year, month), work_hours_of_month in work_hours.items():
+            if work_hours_of_month:
+                holiday_work_hours.setdefault(year, {})[month] = timedelta(microseconds=work_hours_of_month)
+        return holiday_work_hours
+
+    def weekly_statutory_overtime_work_hours(self, working_hours_per_day, working_hours_per_week, legal_holidays) -> Dict[int, Dict[int, timedelta]]:
+        """Returns the overtime beyond the working hours per week of each ISO week.
+
+        Only the regular work hours count toward the working hours per week, see
+        weekly_regular_work_hours, so no hour is counted both as daily and as weekly overtime.
+        """
+        return _statutory_overtime_work_hours(self.weekly_regular_work_hours(working_hours_per_day, legal_holidays), working_hours_per_week)[0]
+
+    def monthly_statutory_overtime_work_hours(self, working_hours_per_day, working_hours_per_week, legal_holidays) -> Dict[int, Dict[int, timedelta]]:
+        """Returns the overtime beyond the working hours per week by the month of the dates which exceed it.
+        """
+        return _statutory_overtime_work_hours(self.weekly_regular_work_hours(working_hours_per_day, legal_holidays), working_hours_per_week)[1]
+
+class IncrementalAttendance(Attendance):
+    """An attendance which keeps its aggregates up to date as dates are added and removed.
+
+    The running totals are kept for the working hours per day and the legal holidays
+    given here, so that each add_date and remove_date updates only the days, ISO weeks,
+    months and ISO years the date spans. Like Attendance, only the last added date of
+    each day counts in the weekly, monthly and yearly aggregates.
+    """
+    def __init__(self,
+                 working_hours_per_day: timedelta,
+                 legal_holidays: List[LegalHoliday],
+                 dates: List[WorkingDate] = [],
+                 working_hours_per_week: timedelta = _WORKING_HOURS_PER_WEEK):
+        super().__init__([])
+        self._working_hours_per_day = working_hours_per_day
+        self._working_hours_per_week = working_hours_per_week
+        self._legal_holidays = legal_holidays
+        self._legal_holiday_table = legal_holidays if isinstance(legal_holidays, LegalHolidayTable) else LegalHolidayTable(legal_holidays)
+        self._dates = {}
+        self._dates_of_days = {}
+        self._weekly_overtime = {}
+        self._weekly_count = {}
+        self._monthly_overtime = {}
+        self._yearly_overtime = {}
+        self._monthly_holiday_work_hours = {}
+        # The number of days worked in each period, and of dates worked on each day.
+        self._number_of_days_of_weeks = {}
+        self._number_of_days_of_months = {}
+        self._number_of_days_of_years = {}
+        self._number_of_dates_of_days = {}
+        self._weekly_regular_work_hours = {}
+        self._number_of_regular_days = {}
+        self._statutory_overtime_of_weeks = {}
+        self._monthly_statutory_overtime = {}
+        self._yearly_statutory_overtime = {}
+        # The indices, year * 12 + month - 1, of the first and the last month with dates.
+        self._first_month_index = None
+        self._last_month_index = None
+        for date in dates:
+            self.add_date(date)
+
+    @property
+    def working_hours_per_day(self) -> timedelta:
+        return self._working_hours_per_day
+
+    @property
+    def legal_holidays(self) -> List[LegalHoliday]:
+        return self._legal_holidays
+
+    @property
+    def working_hours_per_week(self) -> timedelta:
+        return self._working_hours_per_week
+
+    def _tracks(self, working_hours_per_day: timedelta, legal_holidays: List[LegalHoliday]) -> bool:
+        if working_hours_per_day != self._working_hours_per_day:
+            return False
+        if legal_holidays is self._legal_holidays or legal_holidays is self._legal_holiday_table:
+            return True
+        if not isinstance(legal_holidays, LegalHolidayTable):
+            legal_holidays = LegalHolidayTable(legal_holidays)
+        return legal_holidays.table == self._legal_holiday_table.table
+
+    def _update_totals(self, date: WorkingDate, sign: int) -> List[Tuple[int, int]]:
+        """Adds the days worked by the date to the running totals, or removes them if sign is -1.
+
+        Returns:
+            List[Tuple[int, int]]: The ISO years and week numbers of the days.
+        """
+        def count(numbers, key) -> int:
+            number = numbers.get(key, 0) + sign
+            if number:
+                numbers[key] = number
+            else:
+                del numbers[key]
+            return number
+
+        def add(totals, numbers_of_days, key, overtime, is_legal_holiday):
+            if not count(numbers_of_days, key):
+                del totals[key]
+                return
+            overtime_of_holidays, overtime_of_non_holidays = totals.get(key, (timedelta(), timedelta()))
+            if is_legal_holiday:
+                totals[key] = (overtime_of_holidays + overtime, overtime_of_non_holidays)
+            else:
+                totals[key] = (overtime_of_holidays, overtime_of_non_holidays + overtime)
+
+        weeks = []
+        for ordinal, regular_work_hours, overtime in date._days_worked(self._working_hours_per_day // _MICROSECOND):
+            week, month = _calendar_of_day(ordinal)
+            is_legal_holiday = self._legal_holiday_table.is_legal_holiday_of_ordinal(ordinal)
+            if is_legal_holiday and regular_work_hours + overtime:
+                work_hours = self._monthly_holiday_work_hours.get(month, timedelta()) + timedelta(microseconds=(regular_work_hours + overtime) * sign)
+                if work_hours:
+                    self._monthly_holiday_work_hours[month] = work_hours
+                else:
+                    del self._monthly_holiday_work_hours[month]
+            overtime = timedelta(microseconds=overtime * sign)
+
+            add(self._weekly_overtime, self._number_of_days_of_weeks, week, overtime, is_legal_holiday)
+            add(self._monthly_overtime, self._number_of_days_of_months, month, overtime, is_legal_holiday)
+            self._update_month_indices(month)
+            add(self._yearly_overtime, self._number_of_days_of_years, week[0], overtime, is_legal_holiday)
+            # A legal holiday counts when its first date is added and until its last one is removed.
+            number_of_dates = count(self._number_of_dates_of_days, ordinal)
+            if week not in self._weekly_overtime:
+                del self._weekly_count[week]
+            else:
+                counted = is_legal_holiday and number_of_dates == (1 if sign > 0 else 0)
+                self._weekly_count[week] = self._weekly_count.get(week, 0) + (sign if counted else 0)
+
+            if not is_legal_holiday:
+                regular_work_hours_of_months = self._weekly_regular_work_hours.setdefault(week, {})
+                if count(self._number_of_regular_days, (week, month)):
+                    regular_work_hours_of_months[month] = regular_work_hours_of_months.get(month, timedelta()) + timedelta(microseconds=regular_work_hours * sign)
+                else:
+                    del regular_work_hours_of_months[month]
+                    if not regular_work_hours_of_months:
+                        del self._weekly_regular_work_hours[week]
+            weeks.append(week)
+        return weeks
+
+    def _update_month_indices(self, month: Tuple[int, int]):
+        index = month[0] * 12 + month[1] - 1
+        if month in self._monthly_overtime:
+            if self._first_month_index is None or index < self._first_month_index:
+                self._first_month_index = index
+            if self._last_month_index is None or index > self._last_month_index:
+                self._last_month_index = index
+        elif self._first_month_index == self._last_month_index == index:
+            self._first_month_index = self._last_month_index = None
+        else:
+            # When the last dates of the first or the last month are removed, the index moves
+            # inward to the nearest month with dates, which the other index bounds.
+            def has_dates(index):
+                year, month_of_year = divmod(index, 12)
+                return (year, month_of_year + 1) in self._monthly_overtime
+
+            while not has_dates(self._first_month_index):
+                self._first_month_index += 1
+            while not has_dates(self._last_month_index):
+                self._last_month_index -= 1
+
+    def _update_statutory_totals(self, year: int, week_number: int):
+        # The statutory overtime of a date depends on the other dates of its week, so the
+        # statutory overtime of the whole week is derived again from its regular work hours.
+        for month, overtime in self._statutory_overtime_of_weeks.pop((year, week_number), []):
+            self._monthly_statutory_overtime[month] -= overtime
+            self._yearly_statutory_overtime[year] -= overtime
+
+        regular_work_hours_of_months = self._weekly_regular_work_hours.get((year, week_number))
+        if regular_work_hours_of_months is None:
+            return
+        regular_work_hours_of_months = dict(sorted(regular_work_hours_of_months.items()))
+        self._weekly_regular_work_hours[(year, week_number)] = regular_work_hours_of_months
+        statutory_overtime_of_week = list(_statutory_overtime_of_week(regular_work_hours_of_months, self._working_hours_per_week))
+        for month, overtime in statutory_overtime_of_week:
+            self._monthly_statutory_overtime[month] = self._monthly_statutory_overtime.get(month, timedelta()) + overtime
+            self._yearly_statutory_overtime[year] = self._yearly_statutory_overtime.get(year, timedelta()) + overtime
+        self._statutory_overtime_of_weeks[(year, week_number)] = statutory_overtime_of_week
+
+    def _replace_date_of_day(self, date: WorkingDate, dates_of_day: List[WorkingDate], previous: WorkingDate):
+        year, week_number, weekday = date.isocalendar()
+        calendar_year, month, day = date.date_components()
+        weeks = []
+        if previous is not None:
+            weeks += self._update_totals(previous, -1)
+        if dates_of_day:
+            weeks += self._update_totals(dates_of_day[-1], 1)
+            self._isocalendar_based_dates.setdefault((year, week_number), {})[weekday] = dates_of_day[-1]
+            self._monthly_based_dates.setdefault((calendar_year, month), {})[day] = dates_of_day[-1]
+        else:
+            del self._dates_of_days[date.date_components()]
+            week = self._isocalendar_based_dates[(year, week_number)]
+            del week[weekday]
+            if not week:
+                del self._isocalendar_based_dates[(year, week_number)]
+            month_dates = self._monthly_based_dates[(calendar_year, month)]
+            del month_dates[day]
+            if not month_dates:
+                del self._monthly_based_dates[(calendar_year, month)]
+        for year, week_number in dict.fromkeys(weeks):
+            self._update_statutory_totals(year, week_number)
+
+    def add_date(self, date: WorkingDate):
+        if date in self._dates:
+            raise ValueError("date has already been added")
+
+        self.invalidate_aggregates()
+        self._dates[date] = None
+        dates_of_day = self._dates_of_days.setdefault(date.date_components(), [])
+        previous = dates_of_day[-1] if dates_of_day else None
+        dates_of_day.append(date)
+        self._replace_date_of_day(date, dates_of_day, previous)
+
+    def remove_date(self, date: WorkingDate):
+        if date not in self._dates:
+            raise ValueError("date has not been added")
+
+        self.invalidate_aggregates()
+        del self._dates[date]
+        dates_of_day = self._dates_of_days[date.date_components()]
+        if dates_of_day[-1] is date:
+            dates_of_day.pop()
+            self._replace_date_of_day(date, dates_of_day, date)
+        else:
+            dates_of_day.remove(date)
+
+    def weekly_overtime(self, year: int, week_number: int) -> Tuple[timedelta, timedelta]:
+        """Returns the overtime in holidays and in non holidays of an ISO week.
+        """
+        return self._weekly_overtime.get((year, week_number), (timedelta(), timedelta()))
+
+    def monthly_overtime(self, year: int, month: int) -> Tuple[timedelta, timedelta]:
+        """Returns the overtime in holidays and in non holidays of a month.
+
+        The monthly limit of Agreement36 also counts the statutory overtime, which this leaves
+        out, so use monthly_limited_overtime to find the overtime still available.
+        """
+        return self._monthly_overtime.get((year, month), (timedelta(), timedelta()))
+
+    def yearly_overtime(self, year: int) -> Tuple[timedelta, timedelta]:
+        """Returns the overtime in holidays and in non holidays of an ISO year.
+        """
+        return self._yearly_overtime.get(year, (timedelta(), timedelta()))
+
+    def monthly_holiday_work(self, year: int, month: int) -> timedelta:
+        """Returns all the hours worked on legal holidays of a month.
+        """
+        return self._monthly_holiday_work_hours.get((year, month), timedelta())
+
+    def monthly_statutory_overtime(self, year: int, month: int) -> timedelta:
+        """Returns the overtime beyond the working hours per week attributed to a month.
+        """
+        return self._monthly_statutory_overtime.get((year, month), timedelta())
+
+    def yearly_statutory_overtime(self, year: int) -> timedelta:
+        """Returns the overtime beyond the working hours per week of an ISO year.
+        """
+        return self._yearly_statutory_overtime.get(year, timedelta())
+
+    def monthly_limited_overtime(self, year: int, month: int) -> timedelta:
+        """Returns the overtime of a month which counts toward the monthly limit of Agreement36.
+
+        This is the overtime in non holidays and the statutory overtime, as Validator.validate_date
+        checks. Pass it, rather than monthly_overtime, to Agreement36.available_monthly_overtime.
+        """
+        return self.monthly_overtime(year, month)[1] + self.monthly_statutory_overtime(year, month)
+
+    def yearly_limited_overtime(self, year: int) -> timedelta:
+        """Returns the overtime of an ISO year which counts toward the yearly limit of Agreement36.
+
+        This is the overtime in non holidays and the statutory overtime, as Validator.validate_date
+        checks. Pass it, rather than yearly_overtime, to Agreement36.available_yearly_overtime.
+        """
+        return self.yearly_overtime(year)[1] + self.yearly_statutory_overtime(year)
+
+    def monthly_overtime_including_holiday_work(self, year: int, month: int) -> timedelta:
+        """Returns the monthly limited overtime and all the hours worked on legal holidays of a month,
+        which the cap of 100 hours and the average over 2 to 6 months apply to.
+        """
+        return self.monthly_limited_overtime(year, month) + self.monthly_holiday_work(year, month)
+
+    def weekly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
+        if not self._tracks(working_hours_per_day, legal_holidays):
+            return super().weekly_overtime_work_hours(working_hours_per_day, legal_holidays)
         overtime_hours = {}
-        for (year, _), week in self._isocalendar_based_dates.items():
-            dates_of_holidays, dates_of_non_holidays = self._dates_of_holidays_and_non_holidays(week.values(), legal_holidays)
-            total_overtime_of_holidays, total_overtime_of_non_holidays = overtime_hours.get(year, (timedelta(), timedelta()))
-            overtime_hours[year] = (
-                total_overtime_of_holidays + self._sum_overtime_work_hours(dates_of_holidays, working_hours_per_day),
-                total_overtime_of_non_holidays + self._sum_overtime_work_hours(dates_of_non_holidays, working_hours_per_day)
-            )
+        for (year, week_number), overtime in self._weekly_overtime.items():
+            overtime_hours.setdefault(year, {})[week_number] = overtime
         return overtime_hours
 
-    def weekly_count_worked_on_legal_holidays(self, legal_holidays: List[LegalHoliday]) -> int:
+    def monthly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
+        if not self._tracks(working_hours_per_day, legal_holidays):
+            return super().monthly_overtime_work_hours(working_hours_per_day, legal_holidays)
+        overtime_hours = {}
+        for (year, month_number), overtime in self._monthly_overtime.items():
+            overtime_hours.setdefault(year, {})[month_number] = overtime
+        return overtime_hours
+
+    def yearly_overtime_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Tuple[timedelta, timedelta]]:
+        if not self._tracks(working_hours_per_day, legal_holidays):
+            return super().yearly_overtime_work_hours(working_hours_per_day, legal_holidays)
+        return dict(self._yearly_overtime)
+
+    def monthly_holiday_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, timedelta]]:
+        if not self._tracks(working_hours_per_day, legal_holidays):
+            return super().monthly_holiday_work_hours(working_hours_per_day, legal_holidays)
+        work_hours = {}
+        for (year, month), work_hours_of_month in self._monthly_holiday_work_hours.items():
+            work_hours.setdefault(year, {})[month] = work_hours_of_month
+        return work_hours
+
+    def weekly_count_worked_on_legal_holidays(self, legal_holidays: List[LegalHoliday]) -> Dict[int, Dict[int, int]]:
+        if not self._tracks(self._working_hours_per_day, legal_holidays):
+            return super().weekly_count_worked_on_legal_holidays(legal_holidays)
         counts = {}
-        for (year, week_number), week in self._isocalendar_based_dates.items():
-            count = [date.is_legal_holiday(legal_holidays) for date in week.values()].count(True)
+        for (year, week_number), count in self._weekly_count.items():
             counts.setdefault(year, {})[week_number] = count
         return counts
 
+    def weekly_regular_work_hours(self, working_hours_per_day, legal_holidays) -> Dict[int, Dict[int, Dict[Tuple[int, int], timedelta]]]:
+        if not self._tracks(working_hours_per_day, legal_holidays):
+            return super().weekly_regular_work_hours(working_hours_per_day, legal_holidays)
+        regular_hours = {}
+        for (year, week_number) in self._weekly_overtime:
+            regular_hours.setdefault(year, {})[week_number] = dict(self._weekly_regular_work_hours.get((year, week_number), {}))
+        return regular_hours
+
 class LaborStandardsAct:
     def __init__(self):
         self._holidays_per_4weeks = 4
@@ -177,6 +926,10 @@ class Agreement36:
     LEGAL_MAX_DAILY_OVERTIME_LIMIT = timedelta(hours=24) - LaborStandardsAct().working_hours_per_day
     LEGAL_MAX_MONTHLY_OVERTIME_LIMIT = timedelta(hours=45)
     LEGAL_MAX_YEARLY_OVERTIME_LIMIT = timedelta(hours=360)
+    # The caps on overtime including holiday work, which apply whatever the limits of the agreement are.
+    LEGAL_MAX_MULTI_MONTH_AVERAGE_OVERTIME = timedelta(hours=80)
+    LEGAL_MONTHLY_OVERTIME_CAP = timedelta(hours=100)
+    MULTI_MONTH_AVERAGE_PERIODS = range(2, 7)
 
     def __init__(self,
                   starting_date: datetime,
@@ -200,6 +953,14 @@ class Agreement36:
         self._monthly_overtime_limit = monthly_overtime_limit
         self._yearly_overtime_limit = yearly_overtime_limit
 
+    @property
+    def starting_date(self) -> datetime:
+        return self._starting_date
+
+    @property
+    def ending_date(self) -> datetime:
+        return self._ending_date
+
     @property
     def daily_overtime_limit(self) -> timedelta:
         return self._daily_overtime_limit
@@ -227,10 +988,36 @@ class Agreement36:
     def validate_yearly_overtime(self, overtime: timedelta) -> bool:
         return overtime <= self._yearly_overtime_limit
 
+    def validate_monthly_overtime_including_holidays(self, overtime: timedelta) -> bool:
+        return overtime < self.LEGAL_MONTHLY_OVERTIME_CAP
+
+    def validate_multi_month_average_overtime(self, monthly_overtime: Sequence[timedelta]) -> bool:
+        """Validates the average overtime including holiday work of every 2 to 6 consecutive months.
+
+        The sums of the months are taken from prefix sums, so all the averages are checked
+        in one pass over the months.
+
+        Args:
+            monthly_overtime (Sequence[timedelta]): The overtime including holiday work of
+                consecutive months, with no overtime for months without dates.
+        """
+        limit = self.LEGAL_MAX_MULTI_MONTH_AVERAGE_OVERTIME // _MICROSECOND
+        prefix_sums = [0]
+        for overtime in monthly_overtime:
+            prefix_sums.append(prefix_sums[-1] + overtime // _MICROSECOND)
+            end = len(prefix_sums) - 1
+            for number_of_months in self.MULTI_MONTH_AVERAGE_PERIODS:
+                if number_of_months > end:
+                    break
+                if prefix_sums[end] - prefix_sums[end - number_of_months] > limit * number_of_months:
+                    return False
+        return True
+
 class CompanyProfile:
     def __init__(self, legal_holidays: List[LegalHoliday], agreement36: Agreement36 = None):
         self._agreement36 = agreement36
         self._legal_holidays  = legal_holidays
+        self._legal_holiday_table = LegalHolidayTable(legal_holidays)
 
     @property
     def agreement36(self) -> Agreement36:
@@ -240,6 +1027,12 @@ class CompanyProfile:
     def legal_holidays(self) -> List[LegalHoliday]:
         return self._legal_holidays
 
+    @property
+    def legal_holiday_table(self) -> LegalHolidayTable:
+        """The legal holidays compiled once for this profile.
+        """
+        return self._legal_holiday_table
+
     def has_agreement36(self) -> bool:
         return self._agreement36 != None
 
@@ -249,14 +1042,148 @@ class Result:
                  weekly_overtime_work_hours: Dict[int, Dict[int, timedelta]],
                  monthly_overtime_work_hours: Dict[int, Dict[int, timedelta]],
                  yearly_overtime_work_hours: Dict[int, timedelta],
-                 weekly_count_worked_on_legal_holidays: Dict[int, Dict[int, int]]):
+                 weekly_count_worked_on_legal_holidays: Dict[int, Dict[int, int]],
+                 weekly_statutory_overtime_work_hours: Dict[int, Dict[int, timedelta]] = None,
+                 monthly_statutory_overtime_work_hours: Dict[int, Dict[int, timedelta]] = None,
+                 monthly_holiday_work_hours: Dict[int, Dict[int, timedelta]] = None):
         self._violations = violations
         self._weekly_overtime_work_hours = weekly_overtime_work_hours
         self._monthly_overtime_work_hours = monthly_overtime_work_hours
         self._yearly_overtime_work_hours = yearly_overtime_work_hours
         self._weekly_count_worked_on_legal_holidays = weekly_count_worked_on_legal_holidays
+        self._weekly_statutory_overtime_work_hours = weekly_statutory_overtime_work_hours if weekly_statutory_overtime_work_hours is not None else {}
+        self._monthly_statutory_overtime_work_hours = monthly_statutory_overtime_work_hours if monthly_statutory_overtime_work_hours is not None else {}
+        self._monthly_holiday_work_hours = monthly_holiday_work_hours if monthly_holiday_work_hours is not None else {}
+        self._str = None
+        self._tables = None
+
+    @property
+    def violations(self) -> List[str]:
+        return self._violations
+
+    @property
+    def weekly_overtime_work_hours(self) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
+        return self._weekly_overtime_work_hours
+
+    @property
+    def monthly_overtime_work_hours(self) -> Dict[int, Dict[int, Tuple[timedelta, timedelta]]]:
+        return self._monthly_overtime_work_hours
+
+    @property
+    def yearly_overtime_work_hours(self) -> Dict[int, Tuple[timedelta, timedelta]]:
+        return self._yearly_overtime_work_hours
+
+    @property
+    def weekly_count_worked_on_legal_holidays(self) -> Dict[int, Dict[int, int]]:
+        return self._weekly_count_worked_on_legal_holidays
+
+    @property
+    def weekly_statutory_overtime_work_hours(self) -> Dict[int, Dict[int, timedelta]]:
+        return self._weekly_statutory_overtime_work_hours
+
+    @property
+    def monthly_statutory_overtime_work_hours(self) -> Dict[int, Dict[int, timedelta]]:
+        return self._monthly_statutory_overtime_work_hours
+
+    @property
+    def monthly_holiday_work_hours(self) -> Dict[int, Dict[int, timedelta]]:
+        """All the hours worked on legal holidays of each month.
+
+        The caps on monthly overtime including holiday work and on its average over 2 to 6
+        months apply to the overtime of non holidays, the statutory overtime and these hours together.
+        """
+        return self._monthly_holiday_work_hours
+
+    def tables(self) -> Dict[str, Dict[str, 'np.ndarray']]:
+        """Returns the aggregates and the violations as flat columnar tables.
+
+        The tables are built on the first call and cached:
+
+        - weekly: year, week, overtime_of_holidays, overtime_of_non_holidays, statutory_overtime, count_worked_on_legal_holidays
+        - monthly: year, month, overtime_of_holidays, overtime_of_non_holidays, statutory_overtime, holiday_work_hours
+        - yearly: year, overtime_of_holidays, overtime_of_non_holidays
+        - violations: violation
+
+        Returns:
+            Dict[str, Dict[str, np.ndarray]]: The columns of each table keyed by the table name.
+            Overtime columns are timedelta64[us] arrays.
+        """
+        if self._tables is None:
+            import numpy as np
+
+            def periodic_table(overtime_work_hours, statutory_overtime_work_hours, period_name):
+                rows = [(year, period, overtime_of_holidays, overtime_of_non_holidays, statutory_overtime_work_hours.get(year, {}).get(period, timedelta()))
+                        for year, periods in overtime_work_hours.items()
+                        for period, (overtime_of_holidays, overtime_of_non_holidays) in periods.items()]
+                years, periods, overtime_of_holidays, overtime_of_non_holidays, statutory_overtime = zip(*rows) if rows else ((), (), (), (), ())
+                return {
+                    'year': np.array(years, dtype=np.int64),
+                    period_name: np.array(periods, dtype=np.int64),
+                    'overtime_of_holidays': np.array(overtime_of_holidays, dtype='timedelta64[us]'),
+                    'overtime_of_non_holidays': np.array(overtime_of_non_holidays, dtype='timedelta64[us]'),
+                    'statutory_overtime': np.array(statutory_overtime, dtype='timedelta64[us]'),
+                }
+
+            weekly = periodic_table(self._weekly_overtime_work_hours, self._weekly_statutory_overtime_work_hours, 'week')
+            weekly['count_worked_on_legal_holidays'] = np.array([
+                self._weekly_count_worked_on_legal_holidays.get(year, {}).get(week, 0)
+                for year, week in zip(weekly['year'].tolist(), weekly['week'].tolist())
+            ], dtype=np.int64)
+
+            monthly = periodic_table(self._monthly_overtime_work_hours, self._monthly_statutory_overtime_work_hours, 'month')
+            monthly['holiday_work_hours'] = np.array([
+                self._monthly_holiday_work_hours.get(year, {}).get(month, timedelta())
+                for year, month in zip(monthly['year'].tolist(), monthly['month'].tolist())
+            ], dtype='timedelta64[us]')
+
+            yearly_rows = list(self._yearly_overtime_work_hours.items())
+            self._tables = {
+                'weekly': weekly,
+                'monthly': monthly,
+                'yearly': {
+                    'year': np.array([year for year, _ in yearly_rows], dtype=np.int64),
+                    'overtime_of_holidays': np.array([overtime for _, (overtime, _) in yearly_rows], dtype='timedelta64[us]'),
+                    'overtime_of_non_holidays': np.array([overtime for _, (_, overtime) in yearly_rows], dtype='timedelta64[us]'),
+                },
+                'violations': {'violation': np.array(self._violations, dtype=object)},
+            }
+        return self._tables
+
+    def to_dict(self) -> dict:
+        """Returns the violations and the aggregates as plain values which json.dumps accepts.
+
+        Overtime is given in seconds, as by ResultWriter, with the holiday and the non holiday
+        overtime of each period under 'holidays' and 'non_holidays'.
+        """
+        def overtime(overtime_of_holidays, overtime_of_non_holidays):
+            return {'holidays': overtime_of_holidays.total_seconds(), 'non_holidays': overtime_of_non_holidays.total_seconds()}
+
+        def periodic(overtime_work_hours):
+            return {year: {period: overtime(*overtime_of_period) for period, overtime_of_period in periods.items()} for year, periods in overtime_work_hours.items()}
+
+        def periodic_statutory(overtime_work_hours):
+            return {year: {period: overtime_of_period.total_seconds() for period, overtime_of_period in periods.items()} for year, periods in overtime_work_hours.items()}
+
+        return {
+            'violated': self.violated(),
+            'violations': list(self._violations),
+            'weekly_overtime_work_hours': periodic(self._weekly_overtime_work_hours),
+            'monthly_overtime_work_hours': periodic(self._monthly_overtime_work_hours),
+            'yearly_overtime_work_hours': {year: overtime(*overtime_of_year) for year, overtime_of_year in self._yearly_overtime_work_hours.items()},
+            'weekly_count_worked_on_legal_holidays': {year: dict(weeks) for year, weeks in self._weekly_count_worked_on_legal_holidays.items()},
+            'weekly_statutory_overtime_work_hours': periodic_statutory(self._weekly_statutory_overtime_work_hours),
+            'monthly_statutory_overtime_work_hours': periodic_statutory(self._monthly_statutory_overtime_work_hours),
+            'monthly_holiday_work_hours': periodic_statutory(self._monthly_holiday_work_hours),
+        }
 
     def __str__(self):
+        if self._str is None:
+            self._str = self.render()
+        return self._str
+
+    def render(self) -> str:
+        """Renders the text report anew. str() renders it once and returns it thereafter.
+        """
         violations_str = '\n'.join([f'  {violation}' for violation in self._violations])
 
         weekly_overtime_work_hours_str = '\n'
@@ -285,12 +1212,24 @@ class Result:
                 '\n'.join([f'    week {week_number}: {count}' for week_number, count in week.items()])
             )
 
+        def periodic_str(work_hours, period_name):
+            work_hours_str = '\n'
+            for year, periods in work_hours.items():
+                work_hours_str += (
+                    f'  {year}\n' +
+                    '\n'.join([f'    {period_name} {period}: {self.format_timedelta(hours)}' for period, hours in periods.items()])
+                )
+            return work_hours_str
+
         return f"""violated: {self.violated()}
 {violations_str}
 weekly_overtime_work_hours: {weekly_overtime_work_hours_str}
 monthly_overtime_work_hours: {monthly_overtime_work_hours_str}
 yearly_overtime_work_hours: {yearly_overtime_work_hours_str}
 weekly_count_worked_on_legal_holidays: {weekly_count_worked_on_legal_holidays_str}
+weekly_statutory_overtime_work_hours: {periodic_str(self._weekly_statutory_overtime_work_hours, 'week')}
+monthly_statutory_overtime_work_hours: {periodic_str(self._monthly_statutory_overtime_work_hours, 'month')}
+monthly_holiday_work_hours: {periodic_str(self._monthly_holiday_work_hours, 'month')}
 """
 
     def format_timedelta(self, td: timedelta) -> str:
@@ -302,22 +1241,95 @@ weekly_count_worked_on_legal_holidays: {weekly_count_worked_on_legal_holidays_st
     def violated(self) -> bool:
         return len(self._violations) > 0
 
+class BatchResult:
+    def __init__(self, results: Dict[Hashable, Result]):
+        self._results = results
+
+    @property
+    def results(self) -> Dict[Hashable, Result]:
+        return self._results
+
+    def __getitem__(self, employee_id: Hashable) -> Result:
+        return self._results[employee_id]
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def violations(self) -> Dict[str, List[Hashable]]:
+        """Returns the employees who violated each rule.
+
+        Returns:
+            Dict[str, List[Hashable]]: The employee IDs keyed by the violation message.
+        """
+        employees_by_violation = {}
+        for employee_id, result in self._results.items():
+            for violation in result.violations:
+                employees_by_violation.setdefault(violation, []).append(employee_id)
+        return employees_by_violation
+
+    def violated(self) -> bool:
+        return any(result.violated() for result in self._results.values())
+
+    def __str__(self):
+        violations_str = '\n'.join([f'  {violation}: {employee_ids}' for violation, employee_ids in self.violations().items()])
+        return f"""violated: {self.violated()}
+{violations_str}
+"""
+
+def _consecutive_monthly_overtime(monthly_overtime_work_hours: Dict[int, Dict[int, Tuple[timedelta, timedelta]]], monthly_holiday_work_hours: Dict[int, Dict[int, timedelta]]) -> List[timedelta]:
+    # The overtime including holiday work of every month from the first to the last month with dates,
+    # that is the overtime of non holidays and all the hours worked on legal holidays.
+    totals = {
+        year * 12 + month - 1: overtime_of_non_holidays
+        for year, months in monthly_overtime_work_hours.items()
+        for month, (_, overtime_of_non_holidays) in months.items()
+    }
+    for year, months in monthly_holiday_work_hours.items():
+        for month, work_hours in months.items():
+            totals[year * 12 + month - 1] = totals.get(year * 12 + month - 1, timedelta()) + work_hours
+    if not totals:
+        return []
+    return [totals.get(index, timedelta()) for index in range(min(totals), max(totals) + 1)]
+
+def _validate_chunk(validator: 'Validator', chunk: List[Tuple[Hashable, Attendance]]) -> Tuple[List[Tuple[Hashable, Result]], Optional[Dict[str, Dict[str, float]]]]:
+    if validator.tracer is None:
+        return ([(employee_id, validator.validate(attendance)) for employee_id, attendance in chunk], None)
+
+    # The tracer of the chunk is merged into the tracer of the validator by the caller,
+    # as the validator may be a copy in another process.
+    tracer = Tracer()
+    validator = Validator(validator._profile, validator._labor_standards_act, tracer)
+    return ([(employee_id, validator.validate(attendance)) for employee_id, attendance in chunk], tracer.to_dict())
+
 class Validator:
-    def __init__(self, profile: CompanyProfile, labor_standards_act: LaborStandardsAct = LaborStandardsAct()):
+    def __init__(self, profile: CompanyProfile, labor_standards_act: LaborStandardsAct = LaborStandardsAct(), tracer: Tracer = None):
+        """
+        Args:
+            profile (CompanyProfile): The company to validate against.
+            labor_standards_act (LaborStandardsAct, optional): The act to validate against.
+            tracer (Tracer, optional): Records the time spent in each phase of validate when given.
+        """
         self._profile = profile
         self._labor_standards_act = labor_standards_act
+        self._tracer = tracer
 
-    def validate(self, attendance: Attendance) -> Result:
-        (daily_overtime_work_hours_of_holiday, daily_overtime_work_hours_of_non_holiday) = attendance.daily_overtime_work_hours(self._labor_standards_act.working_hours_per_day, self._profile.legal_holidays)
-        weekly_overtime_work_hours = attendance.weekly_overtime_work_hours(self._labor_standards_act.working_hours_per_day, self._profile.legal_holidays)
-        monthly_overtime_work_hours = attendance.monthly_overtime_work_hours(self._labor_standards_act.working_hours_per_day, self._profile.legal_holidays)
-        yearly_overtime_work_hours = attendance.yearly_overtime_work_hours(self._labor_standards_act.working_hours_per_day, self._profile.legal_holidays)
-        weekly_count_worked_on_legal_holidays = attendance.weekly_count_worked_on_legal_holidays(self._profile.legal_holidays)
+    @property
+    def profile(self) -> CompanyProfile:
+        return self._profile
 
+    @property
+    def labor_standards_act(self) -> LaborStandardsAct:
+        return self._labor_standards_act
+
+    @property
+    def tracer(self) -> Optional[Tracer]:
+        return self._tracer
+
+    def _violations(self, daily_overtime_work_hours_of_non_holiday, monthly_overtime_work_hours_of_non_holiday, yearly_overtime_work_hours, consecutive_monthly_overtime) -> List[str]:
         violations = []
         if not self._profile.has_agreement36():
             violated = any(
-                overtime_of_holidays.total_seconds() != 0 or overtime_of_non_holidays.total_seconds() != 0 for _, (overtime_of_holidays, overtime_of_non_holidays) in yearly_overtime_work_hours.items()
+                overtime_of_holidays.total_seconds() != 0 or overtime_of_non_holidays.total_seconds() != 0 for overtime_of_holidays, overtime_of_non_holidays in yearly_overtime_work_hours
             )
             if violated:
                 violations.append('Must be no overtime')
@@ -330,15 +1342,150 @@ class Validator:
                 violations.append(f'Daily overtime must be {agreement36.daily_overtime_limit} hours or less')
 
             violated = any(
-                not agreement36.validate_monthly_overtime(overtime_of_non_holidays) for _, month in monthly_overtime_work_hours.items() for _, (_, overtime_of_non_holidays) in month.items()
+                not agreement36.validate_monthly_overtime(overtime_of_non_holidays) for overtime_of_non_holidays in monthly_overtime_work_hours_of_non_holiday
             )
             if violated:
                 violations.append(f'Montly overtime must be {agreement36.monthly_overtime_limit} hours or less')
 
             violated = any(
-                not agreement36.validate_yearly_overtime(overtime_of_non_holidays) for _, (_, overtime_of_non_holidays) in yearly_overtime_work_hours.items()
+                not agreement36.validate_yearly_overtime(overtime_of_non_holidays) for _, overtime_of_non_holidays in yearly_overtime_work_hours
             )
             if violated:
                 violations.append(f'fYearly overtime must be {agreement36.yearly_overtime_limit} hours or less')
 
-        return Result(violations, weekly_overtime_work_hours, monthly_overtime_work_hours, yearly_overtime_work_hours, weekly_count_worked_on_legal_holidays)
+            violated = any(
+                not agreement36.validate_monthly_overtime_including_holidays(overtime) for overtime in consecutive_monthly_overtime
+            )
+            if violated:
+                violations.append(f'Monthly overtime including holiday work must be less than {agreement36.LEGAL_MONTHLY_OVERTIME_CAP // timedelta(hours=1)} hours')
+
+            if not agreement36.validate_multi_month_average_overtime(consecutive_monthly_overtime):
+                violations.append(f'Average overtime including holiday work of any 2 to 6 months must be {agreement36.LEGAL_MAX_MULTI_MONTH_AVERAGE_OVERTIME // timedelta(hours=1)} hours or less')
+
+        return violations
+
+    def validate(self, attendance: Attendance) -> Result:
+        aggregates = attendance.aggregates(
+            self._labor_standards_act.working_hours_per_day, self._profile.legal_holiday_table, self._tracer or NULL_TRACER, self._labor_standards_act.working_hours_per_week
+        )
+        return self.validate_aggregates(aggregates)
+
+    def validate_aggregates(self, aggregates: Aggregates) -> Result:
+        """Validates aggregates computed beforehand, such as by Attendance.aggregates.
+
+        They must have been computed with the working hours per day, the working hours per week
+        and the legal holidays of this validator. The monthly and yearly overtime of non holidays
+        are checked together with the statutory overtime beyond the working hours per week, and
+        the caps on overtime including holiday work add all the hours worked on legal holidays.
+        """
+        _, daily_overtime_work_hours_of_non_holiday = aggregates.daily_overtime_work_hours
+        with (self._tracer or NULL_TRACER).phase('agreement36'):
+            monthly_statutory_overtime_work_hours = aggregates.monthly_statutory_overtime_work_hours
+            monthly_overtime_work_hours = {
+                year: {
+                    month_number: (overtime_of_holidays, overtime_of_non_holidays + monthly_statutory_overtime_work_hours.get(year, {}).get(month_number, timedelta()))
+                    for month_number, (overtime_of_holidays, overtime_of_non_holidays) in month.items()
+                }
+                for year, month in aggregates.monthly_overtime_work_hours.items()
+            }
+            yearly_statutory_overtime_work_hours = {
+                year: sum(week.values(), timedelta()) for year, week in aggregates.weekly_statutory_overtime_work_hours.items()
+            }
+            violations = self._violations(
+                daily_overtime_work_hours_of_non_holiday,
+                [overtime_of_non_holidays for _, month in monthly_overtime_work_hours.items() for _, (_, overtime_of_non_holidays) in month.items()],
+                [
+                    (overtime_of_holidays, overtime_of_non_holidays + yearly_statutory_overtime_work_hours.get(year, timedelta()))
+                    for year, (overtime_of_holidays, overtime_of_non_holidays) in aggregates.yearly_overtime_work_hours.items()
+                ],
+                _consecutive_monthly_overtime(monthly_overtime_work_hours, aggregates.monthly_holiday_work_hours)
+            )
+
+        return Result(
+            violations, aggregates.weekly_overtime_work_hours, aggregates.monthly_overtime_work_hours, aggregates.yearly_overtime_work_hours, aggregates.weekly_count_worked_on_legal_holidays,
+            aggregates.weekly_statutory_overtime_work_hours, aggregates.monthly_statutory_overtime_work_hours, aggregates.monthly_holiday_work_hours
+        )
+
+    def validate_date(self, attendance: IncrementalAttendance, date: WorkingDate) -> List[str]:
+        """Re-evaluates only the periods touched by adding or removing a date.
+
+        Only the date itself, its month, the months up to 5 months around it and its ISO
+        year are checked, using the running totals of the attendance, so the cost does not
+        depend on the number of dates.
+
+        Returns:
+            List[str]: The violations found in the touched periods.
+        """
+        working_hours_per_day = self._labor_standards_act.working_hours_per_day
+        if not (attendance._tracks(working_hours_per_day, self._profile.legal_holiday_table) and
+                attendance.working_hours_per_week == self._labor_standards_act.working_hours_per_week):
+            raise ValueError("attendance must track the working hours per day, the working hours per week and the legal holidays of this validator")
+
+        year, _, _ = date.isocalendar()
+        calendar_year, month, _ = date.date_components()
+        daily_overtime_work_hours_of_non_holiday = []
+        if date in attendance._dates and not date.is_legal_holiday(self._profile.legal_holiday_table):
+            daily_overtime_work_hours_of_non_holiday.append(date.overtime_work_hours(working_hours_per_day))
+        overtime_of_holidays, _ = attendance.yearly_overtime(year)
+        yearly_overtime = (overtime_of_holidays, attendance.yearly_limited_overtime(year))
+
+        consecutive_monthly_overtime = []
+        if attendance._first_month_index is not None:
+            month_index = calendar_year * 12 + month - 1
+            for index in range(max(month_index - 5, attendance._first_month_index), min(month_index + 5, attendance._last_month_index) + 1):
+                year_of_month, month_of_year = divmod(index, 12)
+                consecutive_monthly_overtime.append(attendance.monthly_overtime_including_holiday_work(year_of_month, month_of_year + 1))
+
+        return self._violations(
+            daily_overtime_work_hours_of_non_holiday,
+            [attendance.monthly_limited_overtime(calendar_year, month)],
+            [yearly_overtime],
+            consecutive_monthly_overtime
+        )
+
+    def validate_stream(self, attendances: Iterable[Tuple[Hashable, Attendance]]) -> Iterator[Tuple[Hashable, Result]]:
+        """Validates the attendances one by one as they are read, such as from AttendanceReader.
+
+        Yields:
+            Tuple[Hashable, Result]: The employee ID and the result of the employee.
+        """
+        for employee_id, attendance in attendances:
+            yield (employee_id, self.validate(attendance))
+
+    def validate_many(self, attendances: Mapping[Hashable, Attendance], executor: 'Executor' = None, max_workers: int = None, chunksize: int = 64) -> BatchResult:
+        """Validates the attendances of many employees in parallel.
+
+        The attendances are split into chunks of chunksize employees and each chunk
+        is validated by one task of the executor.
+
+        Args:
+            attendances (Mapping[Hashable, Attendance]): The attendances keyed by employee ID.
+                AttendanceFactory.create_many_from_dataframe builds it from one long DataFrame.
+            executor (Executor, optional): The executor to run the chunks on, such as a
+                ThreadPoolExecutor or a ProcessPoolExecutor. It is left running for reuse.
+                Defaults to a ProcessPoolExecutor with max_workers created for this call.
+            max_workers (int, optional): The number of workers of the default executor.
+            chunksize (int, optional): The number of employees per task.
+
+        Returns:
+            BatchResult: The results keyed by employee ID in the order of attendances.
+        """
+        if not chunksize > 0:
+            raise ValueError("chunksize must be greater than 0")
+
+        if executor is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return self.validate_many(attendances, executor, chunksize=chunksize)
+
+        items = list(attendances.items())
+        chunks = [items[i:i + chunksize] for i in range(0, len(items), chunksize)]
+        futures = [executor.submit(_validate_chunk, self, chunk) for chunk in chunks]
+        results = {}
+        for future in futures:
+            chunk_results, stats = future.result()
+            results.update(chunk_results)
+            if stats is not None:
+                self._tracer.merge(stats)
+        return BatchResult(results)
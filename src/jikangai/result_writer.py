@@ -0,0 +1,61 @@
+import os
+from typing import Dict, Hashable, Mapping, Union
+import numpy as np
+from pandas import DataFrame
+from .jikangai import BatchResult, Result
+
+class ResultWriter:
+    """Writes many results at once as one table per kind of aggregate.
+
+    Each table concatenates the columns of Result.tables of every employee, with an
+    employee column in front. Overtime columns are written as float seconds with a
+    _seconds suffix, so no value is formatted in Python.
+    """
+    @staticmethod
+    def to_dataframes(results: Union[Mapping[Hashable, Result], BatchResult]) -> Dict[str, DataFrame]:
+        """Returns the tables of all the results keyed by the table name: weekly, monthly, yearly and violations.
+        """
+        if isinstance(results, BatchResult):
+            results = results.results
+
+        employee_ids = np.empty(len(results), dtype=object)
+        for i, employee_id in enumerate(results.keys()):
+            employee_ids[i] = employee_id
+        tables_of_employees = [result.tables() for result in results.values()]
+
+        dataframes = {}
+        for table_name, empty_table in Result([], {}, {}, {}, {}).tables().items():
+            tables = [tables[table_name] for tables in tables_of_employees]
+            first_column_name = next(iter(empty_table))
+            columns = {'employee': np.repeat(employee_ids, [len(table[first_column_name]) for table in tables])}
+            for column_name, empty_column in empty_table.items():
+                column = np.concatenate([empty_column] + [table[column_name] for table in tables])
+                if column.dtype.kind == 'm':
+                    columns[f'{column_name}_seconds'] = column / np.timedelta64(1, 's')
+                else:
+                    columns[column_name] = column
+            dataframes[table_name] = DataFrame(columns)
+        return dataframes
+
+    @staticmethod
+    def write_csv(results: Union[Mapping[Hashable, Result], BatchResult], directory: str, **kwargs):
+        """Writes weekly.csv, monthly.csv, yearly.csv and violations.csv into the directory.
+
+        Args:
+            **kwargs: Other arguments passed to pandas.DataFrame.to_csv.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for table_name, dataframe in ResultWriter.to_dataframes(results).items():
+            dataframe.to_csv(os.path.join(directory, f'{table_name}.csv'), index=False, **kwargs)
+
+    @staticmethod
+    def write_parquet(results: Union[Mapping[Hashable, Result], BatchResult], directory: str, **kwargs):
+        """Writes weekly.parquet, monthly.parquet, yearly.parquet and violations.parquet into the directory.
+        This requires pyarrow.
+
+        Args:
+            **kwargs: Other arguments passed to pandas.DataFrame.to_parquet.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for table_name, dataframe in ResultWriter.to_dataframes(results).items():
+            dataframe.to_parquet(os.path.join(directory, f'{table_name}.parquet'), index=False, **kwargs)
@@ -0,0 +1,315 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import sys
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Optional, TextIO
+from .jikangai import Agreement36, Attendance, BreakTime, CompanyProfile, LegalHoliday, Result, Validator, WorkingDate, _validate_chunk
+
+# The number of lines read from stdin, or of connections served by the HTTP server,
+# which may wait for their results at once. It is also the listen backlog of the server.
+_MAX_PENDING_REQUESTS = 1024
+
+def _profile_from_dict(profile: dict) -> CompanyProfile:
+    legal_holidays = profile.get('legal_holidays')
+    if legal_holidays is None:
+        legal_holidays = LegalHoliday.of_every_sunday()
+    else:
+        legal_holidays = [LegalHoliday(week_number_of_4weeks, weekday) for week_number_of_4weeks, weekday in legal_holidays]
+
+    agreement36 = profile.get('agreement36')
+    if agreement36 is not None:
+        limits = {
+            f'{period}_overtime_limit': timedelta(hours=agreement36[f'{period}_overtime_limit_hours'])
+            for period in ('daily', 'monthly', 'yearly') if f'{period}_overtime_limit_hours' in agreement36
+        }
+        agreement36 = Agreement36(datetime.fromisoformat(agreement36['starting_date']), timedelta(days=agreement36['valid_period_days']), **limits)
+    return CompanyProfile(legal_holidays, agreement36)
+
+def _attendance_from_dict(request: dict) -> Attendance:
+    dates = []
+    for shift in request['shifts']:
+        break_times = [BreakTime(datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in shift.get('breaks', [])]
+        dates.append(WorkingDate(datetime.fromisoformat(shift['start']), datetime.fromisoformat(shift['end']), break_times))
+    return Attendance(dates)
+
+class ValidationService:
+    """Validates attendances from asyncio code without blocking the event loop.
+
+    Concurrent calls of validate with the same validator are collected into batches of up
+    to max_batch_size attendances, or of those which arrived within max_batch_delay seconds,
+    and each batch is validated by one task of the executor, as by Validator.validate_many.
+
+        async with ValidationService(validator) as service:
+            results = await asyncio.gather(*[service.validate(attendance) for attendance in attendances])
+
+    Requests in JSON form, as read by main, look like:
+
+        {
+            "id": "employee-1",
+            "shifts": [{"start": "2024-01-08T09:00", "end": "2024-01-08T18:00", "breaks": [["2024-01-08T12:00", "2024-01-08T13:00"]]}],
+            "profile": {
+                "legal_holidays": [[1, 7], [2, 7], [3, 7], [4, 7]],
+                "agreement36": {"starting_date": "2024-04-01", "valid_period_days": 364, "monthly_overtime_limit_hours": 45}
+            }
+        }
+
+    The profile is optional and defaults to the profile of the validator of the service. The
+    legal holidays are pairs of week_number_of_4weeks and weekday, every Sunday by default,
+    and the limits of the 36 Agreement default to the legal maximums. The validator of each
+    distinct profile is built once and reused by later requests, up to validator_cache_size
+    of them.
+    """
+    # The maximum number of validators of profiles kept by validator_of_profile, evicting the least recently used first.
+    validator_cache_size = 256
+
+    def __init__(self,
+                 validator: Validator = None,
+                 executor: Executor = None,
+                 max_workers: int = None,
+                 max_batch_size: int = 64,
+                 max_batch_delay: float = 0.002):
+        """
+        Args:
+            validator (Validator, optional): The validator of requests without a profile.
+                Defaults to a company whose legal holidays are every Sunday, without a 36 Agreement.
+            executor (Executor, optional): The executor to validate the batches on. It is left
+                running. Defaults to a ProcessPoolExecutor with max_workers, shut down by close.
+            max_workers (int, optional): The number of workers of the default executor.
+            max_batch_size (int, optional): The maximum number of attendances per batch.
+            max_batch_delay (float, optional): The seconds a batch waits for more attendances.
+        """
+        if not max_batch_size > 0:
+            raise ValueError("max_batch_size must be greater than 0")
+
+        self._validator = validator if validator is not None else Validator(CompanyProfile(LegalHoliday.of_every_sunday()))
+        self._executor = executor
+        self._max_workers = max_workers
+        self._owns_executor = executor is None
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        self._validators = OrderedDict()
+        self._batches = {}
+
+    @property
+    def validator(self) -> Validator:
+        return self._validator
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+        return False
+
+    def close(self):
+        """Shuts down the default executor, if it has been created.
+        """
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def validator_of_profile(self, profile: Optional[dict]) -> Validator:
+        """Returns the validator of a profile in its JSON form, building it on the first request of the profile.
+        """
+        if profile is None:
+            return self._validator
+
+        key = json.dumps(profile, sort_keys=True)
+        validator = self._validators.get(key)
+        if validator is not None:
+            self._validators.move_to_end(key)
+            return validator
+
+        validator = Validator(_profile_from_dict(profile), self._validator.labor_standards_act)
+        self._validators[key] = validator
+        while len(self._validators) > self.validator_cache_size:
+            self._validators.popitem(last=False)
+        return validator
+
+    async def validate(self, attendance: Attendance, validator: Validator = None) -> Result:
+        """Validates the attendance in the next batch of the validator, the validator of the service by default.
+        """
+        if validator is None:
+            validator = self._validator
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._batches.get(validator)
+        if batch is None:
+            batch = (loop.call_later(self._max_batch_delay, self._flush, validator), [])
+            self._batches[validator] = batch
+        batch[1].append((attendance, future))
+        if len(batch[1]) >= self._max_batch_size:
+            self._flush(validator)
+        return await future
+
+    async def validate_request(self, request: dict) -> dict:
+        """Validates a request in JSON form.
+
+        Returns:
+            dict: The id of the request and Result.to_dict, or the id and an error message
+            if the request is invalid.
+        """
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            validator = self.validator_of_profile(request.get('profile'))
+            attendance = _attendance_from_dict(request)
+        except (AttributeError, KeyError, TypeError, ValueError) as exception:
+            return {'id': request_id, 'error': f'{type(exception).__name__}: {exception}'}
+
+        result = await self.validate(attendance, validator)
+        return {'id': request_id, **result.to_dict()}
+
+    def _flush(self, validator: Validator):
+        handle, items = self._batches.pop(validator)
+        handle.cancel()
+        try:
+            if self._executor is None:
+                # Forked workers would inherit the sockets of the connections open at the time,
+                # which then stay open after the server closes them.
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers, mp_context=multiprocessing.get_context(start_method))
+
+            chunk = [(index, attendance) for index, (attendance, _) in enumerate(items)]
+            task = asyncio.get_running_loop().run_in_executor(self._executor, _validate_chunk, validator, chunk)
+        except Exception as exception:
+            # Such as an executor which has been shut down or whose workers died.
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(exception)
+            return
+
+        task.add_done_callback(lambda task: self._resolve(validator, items, task))
+
+    def _resolve(self, validator: Validator, items, task: asyncio.Future):
+        if task.cancelled() or task.exception() is not None:
+            for _, future in items:
+                if not future.done():
+                    if task.cancelled():
+                        future.cancel()
+                    else:
+                        future.set_exception(task.exception())
+            return
+
+        results, stats = task.result()
+        if stats is not None:
+            validator.tracer.merge(stats)
+        for (_, future), (_, result) in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+async def serve_lines(service: ValidationService, input: TextIO, output: TextIO):
+    """Validates the requests read from input, one JSON object per line, and writes each
+    response to output as one JSON line as soon as it is ready.
+    """
+    loop = asyncio.get_running_loop()
+    pending = asyncio.Semaphore(_MAX_PENDING_REQUESTS)
+
+    async def handle(line: str):
+        try:
+            try:
+                response = await service.validate_request(json.loads(line))
+            except Exception as exception:
+                # An invalid line, or a batch which failed, answers only the requests it concerns.
+                response = {'id': None, 'error': f'{type(exception).__name__}: {exception}'}
+            output.write(json.dumps(response) + '\n')
+            output.flush()
+        finally:
+            pending.release()
+
+    tasks = []
+    while True:
+        line = await loop.run_in_executor(None, input.readline)
+        if not line:
+            break
+        if not line.strip():
+            continue
+        await pending.acquire()
+        tasks.append(asyncio.ensure_future(handle(line)))
+    await asyncio.gather(*tasks)
+
+async def serve_http(service: ValidationService, host: str = '127.0.0.1', port: int = 8036) -> asyncio.AbstractServer:
+    """Starts a minimal HTTP server which validates the requests POSTed to /validate.
+
+    The body is one request in JSON form, or a list of them, and the response is the
+    response of validate_request, or a list of them. Each connection serves one request,
+    and connections beyond _MAX_PENDING_REQUESTS wait until others have been answered.
+    """
+    pending = asyncio.Semaphore(_MAX_PENDING_REQUESTS)
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async with pending:
+            try:
+                try:
+                    method, path, _ = (await reader.readline()).decode('latin-1').split(' ', 2)
+                    headers = {}
+                    while True:
+                        line = await reader.readline()
+                        if line in (b'\r\n', b'\n', b''):
+                            break
+                        name, _, value = line.decode('latin-1').partition(':')
+                        headers[name.strip().lower()] = value.strip()
+                    body = await reader.readexactly(int(headers.get('content-length', 0)))
+
+                    if method != 'POST' or path != '/validate':
+                        status, response = '404 Not Found', {'error': 'POST requests to /validate'}
+                    else:
+                        request = json.loads(body)
+                        if isinstance(request, list):
+                            response = list(await asyncio.gather(*[service.validate_request(item) for item in request]))
+                        else:
+                            response = await service.validate_request(request)
+                        status = '400 Bad Request' if isinstance(response, dict) and 'error' in response else '200 OK'
+                except (ValueError, asyncio.IncompleteReadError) as exception:
+                    status, response = '400 Bad Request', {'error': f'{type(exception).__name__}: {exception}'}
+                except Exception as exception:
+                    status, response = '500 Internal Server Error', {'error': f'{type(exception).__name__}: {exception}'}
+
+                payload = json.dumps(response).encode()
+                writer.write(
+                    f'HTTP/1.1 {status}\r\nContent-Type: application/json\r\nContent-Length: {len(payload)}\r\nConnection: close\r\n\r\n'.encode('latin-1') + payload
+                )
+                await writer.drain()
+            finally:
+                writer.close()
+
+    return await asyncio.start_server(handle, host, port, backlog=_MAX_PENDING_REQUESTS)
+
+async def _serve(args: argparse.Namespace):
+    validator = None
+    if args.profile is not None:
+        with open(args.profile) as file:
+            validator = Validator(_profile_from_dict(json.load(file)))
+
+    async with ValidationService(validator, max_workers=args.workers, max_batch_size=args.batch_size, max_batch_delay=args.batch_delay) as service:
+        if args.http is None:
+            await serve_lines(service, sys.stdin, sys.stdout)
+            return
+
+        host, _, port = args.http.rpartition(':')
+        server = await serve_http(service, host or '127.0.0.1', int(port))
+        print(f'Serving on http://{host or "127.0.0.1"}:{port}/validate', file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+def main(argv: List[str] = None):
+    """Validates the attendances given as JSON lines on stdin, or POSTed over HTTP with --http.
+
+    See ValidationService for the form of the requests.
+    """
+    parser = argparse.ArgumentParser(prog='jikangai', description=main.__doc__.splitlines()[0])
+    parser.add_argument('--http', metavar='[HOST]:PORT', help='serve over HTTP instead of reading stdin')
+    parser.add_argument('--profile', help='a JSON file of the company profile of requests without one')
+    parser.add_argument('--workers', type=int, help='the number of worker processes')
+    parser.add_argument('--batch-size', type=int, default=64, help='the maximum number of attendances per batch')
+    parser.add_argument('--batch-delay', type=float, default=0.002, help='the seconds a batch waits for more attendances')
+    args = parser.parse_args(argv)
+
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
@@ -1,2 +1,15 @@
 # The inclusion of the tests module is not meant to offer best practices for
 # testing in general.
+from datetime import datetime, timedelta
+from jikangai import Attendance, BreakTime, WorkingDate
+
+
+def make_working_date(day: datetime, hours: int) -> WorkingDate:
+    """Makes a date of the hours worked from 9:00 of the day, with a break of an hour at 12:00."""
+    start = day + timedelta(hours=9)
+    return WorkingDate(start, start + timedelta(hours=hours + 1), [BreakTime(start + timedelta(hours=3), start + timedelta(hours=4))])
+
+
+def make_attendance(first_day: datetime, days: int, hours: int) -> Attendance:
+    """Makes an attendance of the hours worked on each of the days from the first day."""
+    return Attendance([make_working_date(first_day + timedelta(days=day), hours) for day in range(days)])
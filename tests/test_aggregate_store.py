@@ -0,0 +1,106 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from jikangai import AggregateStore, Agreement36, Attendance, CompanyProfile, LegalHoliday, Validator, WorkingDate
+from . import make_attendance
+
+
+class TestAggregateStore(unittest.TestCase):
+
+    def setUp(self):
+        self.store = AggregateStore()
+        self.working_hours_per_day = timedelta(hours=8)
+        self.legal_holidays = LegalHoliday.of_every_sunday()
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_load_equals_aggregates_of_whole_attendance(self):
+        # January ends in the middle of an ISO week, which February continues.
+        january = make_attendance(datetime(2024, 1, 1), 31, 9)
+        february = make_attendance(datetime(2024, 2, 1), 29, 10)
+        self.store.append('a', january, self.working_hours_per_day, self.legal_holidays)
+        self.store.append('a', february, self.working_hours_per_day, self.legal_holidays)
+
+        loaded = self.store.load('a', self.working_hours_per_day, self.legal_holidays)
+        whole = Attendance(january._dates + february._dates).aggregates(self.working_hours_per_day, self.legal_holidays)
+        self.assertEqual(loaded.weekly_overtime_work_hours, whole.weekly_overtime_work_hours)
+        self.assertEqual(loaded.monthly_overtime_work_hours, whole.monthly_overtime_work_hours)
+        self.assertEqual(loaded.yearly_overtime_work_hours, whole.yearly_overtime_work_hours)
+        self.assertEqual(loaded.weekly_count_worked_on_legal_holidays, whole.weekly_count_worked_on_legal_holidays)
+        self.assertEqual(loaded.weekly_regular_work_hours, whole.weekly_regular_work_hours)
+        self.assertEqual(loaded.weekly_statutory_overtime_work_hours, whole.weekly_statutory_overtime_work_hours)
+        self.assertEqual(loaded.monthly_statutory_overtime_work_hours, whole.monthly_statutory_overtime_work_hours)
+        self.assertEqual(loaded.monthly_holiday_work_hours, whole.monthly_holiday_work_hours)
+
+    def test_night_shift_across_appends(self):
+        # The first attendance ends on Sunday April 7th, a legal holiday, which the second one starts on.
+        first = Attendance([WorkingDate(datetime(2024, 4, 6, 22), datetime(2024, 4, 7, 9), [])])
+        second = Attendance([WorkingDate(datetime(2024, 4, 7, 22), datetime(2024, 4, 8, 8), []), WorkingDate(datetime(2024, 4, 14, 9), datetime(2024, 4, 14, 18), [])])
+        validator = Validator(CompanyProfile(self.legal_holidays))
+        self.store.append('a', first, self.working_hours_per_day, self.legal_holidays)
+        result = self.store.append_and_validate(validator, 'a', second)
+
+        expected = {2024: {14: 1, 15: 1}}
+        self.assertEqual(Attendance(first._dates + second._dates).weekly_count_worked_on_legal_holidays(self.legal_holidays), expected)
+        self.assertEqual(result.weekly_count_worked_on_legal_holidays, expected)
+        self.assertEqual(self.store.load('a', self.working_hours_per_day, self.legal_holidays).weekly_count_worked_on_legal_holidays, expected)
+        self.assertEqual(second.aggregates(self.working_hours_per_day, self.legal_holidays).weekly_count_worked_on_legal_holidays, {2024: {14: 1, 15: 1}})
+
+    def test_load_since(self):
+        self.store.append('a', make_attendance(datetime(2024, 1, 1), 60, 9), self.working_hours_per_day, self.legal_holidays)
+        loaded = self.store.load('a', self.working_hours_per_day, self.legal_holidays, since=datetime(2024, 2, 1))
+        self.assertEqual(list(loaded.monthly_overtime_work_hours[2024]), [2])
+        self.assertEqual(min(loaded.weekly_overtime_work_hours[2024]), 5)
+
+    def test_append_rejects_overlapping_attendance(self):
+        self.store.append('a', make_attendance(datetime(2024, 1, 1), 10, 9), self.working_hours_per_day, self.legal_holidays)
+        with self.assertRaises(ValueError):
+            self.store.append('a', make_attendance(datetime(2024, 1, 10), 10, 9), self.working_hours_per_day, self.legal_holidays)
+        self.store.append('b', make_attendance(datetime(2024, 1, 10), 10, 9), self.working_hours_per_day, self.legal_holidays)
+        self.assertEqual(self.store.last_day('b', self.working_hours_per_day, self.legal_holidays), datetime(2024, 1, 19).date())
+
+    def test_rejects_employee_ids_of_other_types(self):
+        attendance = make_attendance(datetime(2024, 1, 1), 10, 9)
+        self.store.append(1, attendance, self.working_hours_per_day, self.legal_holidays)
+        for employee_id in [(1, 'a'), 1.0, True, None]:
+            with self.subTest(employee_id=employee_id):
+                with self.assertRaises(ValueError):
+                    self.store.append(employee_id, attendance, self.working_hours_per_day, self.legal_holidays)
+                with self.assertRaises(ValueError):
+                    self.store.load(employee_id, self.working_hours_per_day, self.legal_holidays)
+
+    def test_persists_to_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'aggregates.db')
+            with AggregateStore(path) as store:
+                store.append('a', make_attendance(datetime(2024, 1, 1), 10, 9), self.working_hours_per_day, self.legal_holidays)
+            with AggregateStore(path) as store:
+                loaded = store.load('a', self.working_hours_per_day, self.legal_holidays)
+            self.assertEqual(loaded.monthly_overtime_work_hours, {2024: {1: (timedelta(hours=1), timedelta(hours=9))}})
+
+    def test_append_and_validate(self):
+        agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364), monthly_overtime_limit=timedelta(hours=30))
+        validator = Validator(CompanyProfile(self.legal_holidays, agreement36))
+        # 2 hours of overtime a day stay under the monthly limit in each month, so only the stored totals can exceed the yearly one.
+        for month in range(1, 13):
+            first_day = datetime(2024, month, 1)
+            result = self.store.append_and_validate(validator, 'a', make_attendance(first_day, 14, 10))
+        self.assertFalse(any('Monthly' in violation for violation in result.violations))
+        self.assertEqual(result.yearly_overtime_work_hours[2024][1], self.store.load('a', self.working_hours_per_day, self.legal_holidays).yearly_overtime_work_hours[2024][1])
+
+
+class TestAggregates(unittest.TestCase):
+
+    def test_merge(self):
+        working_hours_per_day = timedelta(hours=8)
+        legal_holidays = LegalHoliday.of_every_sunday()
+        first = make_attendance(datetime(2024, 1, 1), 31, 9)
+        second = make_attendance(datetime(2024, 2, 1), 10, 10)
+        merged = first.aggregates(working_hours_per_day, legal_holidays).merge(second.aggregates(working_hours_per_day, legal_holidays))
+        self.assertEqual(merged, Attendance(first._dates + second._dates).aggregates(working_hours_per_day, legal_holidays))
+
+    def test_period(self):
+        self.assertIsNone(Attendance([]).period())
+        self.assertEqual(make_attendance(datetime(2024, 1, 1), 3, 9).period(), (datetime(2024, 1, 1, 9), datetime(2024, 1, 3, 9)))
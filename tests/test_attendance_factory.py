@@ -0,0 +1,109 @@
+import unittest
+from datetime import timedelta
+import pandas as pd
+from jikangai import AttendanceFactory, ColumnarAttendance, LegalHoliday
+
+DATE_FORMAT = '%m/%d/%Y %H:%M'
+
+
+def make_dataframe():
+    return pd.DataFrame({
+        'start': ['1/3/2024 8:53', '1/5/2024 8:58', '1/8/2024 8:47', '1/9/2024 8:44'],
+        'start of break': ['1/3/2024 12:55', '1/5/2024 12:53', '1/8/2024 13:03', '1/9/2024 12:36'],
+        'end of break': ['1/3/2024 13:32', '1/5/2024 13:31', '1/8/2024 13:58', '1/9/2024 13:13'],
+        'end': ['1/3/2024 18:03', '1/5/2024 19:03', '1/8/2024 19:21', '1/9/2024 19:22'],
+    })
+
+
+def make_dataframe_with_break_columns():
+    # The second shift has no second break, and the third one crosses midnight into a Sunday.
+    return pd.DataFrame({
+        'employee': ['a', 'a', 'b'],
+        'shift': [1, 2, 3],
+        'start': ['1/3/2024 8:53', '1/5/2024 8:58', '1/6/2024 22:00'],
+        'start of break': ['1/3/2024 12:55', '1/5/2024 12:53', '1/7/2024 2:00'],
+        'end of break': ['1/3/2024 13:32', '1/5/2024 13:31', '1/7/2024 3:00'],
+        'start of break 2': ['1/3/2024 13:20', None, '1/7/2024 6:00'],
+        'end of break 2': ['1/3/2024 15:00', None, '1/7/2024 6:15'],
+        'end': ['1/3/2024 20:03', '1/5/2024 19:03', '1/7/2024 10:00'],
+    })
+
+
+BREAK_COLUMNS = (['start of break', 'start of break 2'], ['end of break', 'end of break 2'])
+
+
+def create(factory_method, dataframe):
+    return factory_method(dataframe, 'start', 'start of break', 'end of break', 'end', DATE_FORMAT)
+
+
+class TestAttendanceFactory(unittest.TestCase):
+
+    def test_create_columnar_from_dataframe(self):
+        attendance = create(AttendanceFactory.create_columnar_from_dataframe, make_dataframe())
+        self.assertIsInstance(attendance, ColumnarAttendance)
+        self.assertEqual(len(attendance), 4)
+
+    def test_columnar_matches_row_based(self):
+        dataframe = make_dataframe()
+        expected = create(AttendanceFactory.create_from_dataframe, dataframe)
+        actual = create(AttendanceFactory.create_columnar_from_dataframe, dataframe)
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        self.assertEqual(actual.daily_overtime_work_hours(*args), expected.daily_overtime_work_hours(*args))
+        self.assertEqual(actual.weekly_overtime_work_hours(*args), expected.weekly_overtime_work_hours(*args))
+        self.assertEqual(actual.monthly_overtime_work_hours(*args), expected.monthly_overtime_work_hours(*args))
+        self.assertEqual(actual.yearly_overtime_work_hours(*args), expected.yearly_overtime_work_hours(*args))
+
+    def test_columnar_reports_every_invalid_row(self):
+        dataframe = make_dataframe()
+        dataframe.loc[1, 'start'] = 'not a date'
+        dataframe.loc[3, 'end'] = '1/9/2024 8:00'
+        with self.assertRaises(ValueError) as context:
+            create(AttendanceFactory.create_columnar_from_dataframe, dataframe)
+        message = str(context.exception)
+        self.assertIn('check lines [1]', message)
+        self.assertIn('end must be greater than or equal to start\ncheck lines [3]', message)
+
+    def test_create_many_from_dataframe(self):
+        dataframe = pd.concat([make_dataframe().assign(employee='a'), make_dataframe().iloc[:2].assign(employee='b')], ignore_index=True)
+        attendances = AttendanceFactory.create_many_from_dataframe(dataframe, 'employee', 'start', 'start of break', 'end of break', 'end', DATE_FORMAT)
+        self.assertEqual(list(attendances), ['a', 'b'])
+        self.assertEqual(len(attendances['a']), 4)
+        self.assertEqual(len(attendances['b']), 2)
+
+    def test_break_columns(self):
+        dataframe = make_dataframe_with_break_columns()
+        expected = AttendanceFactory.create_from_dataframe(dataframe, 'start', *BREAK_COLUMNS, 'end', DATE_FORMAT)
+        actual = AttendanceFactory.create_columnar_from_dataframe(dataframe, 'start', *BREAK_COLUMNS, 'end', DATE_FORMAT)
+        self.assertEqual([date.break_time() for date in expected._dates], [timedelta(hours=2, minutes=5), timedelta(minutes=38), timedelta(hours=1, minutes=15)])
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        self.assertEqual(actual.aggregates(*args), expected.aggregates(*args))
+        self.assertEqual(actual.monthly_overtime_work_hours(*args), {2024: {1: (timedelta(hours=2, minutes=45), timedelta(hours=2, minutes=32))}})
+
+        dataframe.loc[1, 'end of break 2'] = '1/5/2024 13:40'
+        with self.assertRaises(ValueError) as context:
+            AttendanceFactory.create_columnar_from_dataframe(dataframe, 'start', *BREAK_COLUMNS, 'end', DATE_FORMAT)
+        self.assertIn('check lines [1]', str(context.exception))
+        with self.assertRaises(ValueError):
+            AttendanceFactory.create_columnar_from_dataframe(dataframe, 'start', BREAK_COLUMNS[0], 'end of break', 'end', DATE_FORMAT)
+
+    def test_create_many_from_break_table(self):
+        dataframe = make_dataframe_with_break_columns()
+        shifts = dataframe[['employee', 'shift', 'start', 'end']]
+        break_times = pd.concat([
+            dataframe[['shift', 'start of break 2', 'end of break 2']].dropna().set_axis(['shift', 'start of break', 'end of break'], axis=1),
+            dataframe[['shift', 'start of break', 'end of break']],
+        ], ignore_index=True)
+        attendances = AttendanceFactory.create_many_from_break_table(shifts, break_times, 'shift', 'employee', 'start', 'start of break', 'end of break', 'end', DATE_FORMAT)
+        expected = AttendanceFactory.create_many_from_dataframe(dataframe, 'employee', 'start', *BREAK_COLUMNS, 'end', DATE_FORMAT)
+        self.assertEqual(list(attendances), ['a', 'b'])
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        for employee_id, attendance in attendances.items():
+            self.assertEqual(attendance.aggregates(*args), expected[employee_id].aggregates(*args))
+
+        break_times.loc[len(break_times)] = [4, '1/5/2024 12:00', '1/5/2024 12:30']
+        with self.assertRaises(ValueError) as context:
+            AttendanceFactory.create_many_from_break_table(shifts, break_times, 'shift', 'employee', 'start', 'start of break', 'end of break', 'end', DATE_FORMAT)
+        self.assertIn(f'check lines [{len(break_times) - 1}]', str(context.exception))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import io
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+import pandas as pd
+from jikangai import AttendanceFactory, AttendanceReader, LegalHoliday
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+DATE_FORMAT = '%m/%d/%Y %H:%M'
+
+
+def make_dataframe():
+    rows = []
+    for employee_id, number_of_days in [(1, 3), (2, 5), (3, 1)]:
+        for day in range(number_of_days, 0, -1):
+            rows.append((employee_id, f'1/{day + 7}/2024 9:00', f'1/{day + 7}/2024 12:00', f'1/{day + 7}/2024 13:00', f'1/{day + 7}/2024 {17 + day}:00'))
+    return pd.DataFrame(rows, columns=['employee', 'start', 'start of break', 'end of break', 'end'])
+
+
+class TestAttendanceReader(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = AttendanceReader('employee', 'start', 'start of break', 'end of break', 'end', DATE_FORMAT)
+        self.dataframe = make_dataframe()
+
+    def assert_same_attendances(self, attendances):
+        expected = AttendanceFactory.create_many_from_dataframe(self.dataframe, 'employee', 'start', 'start of break', 'end of break', 'end', DATE_FORMAT)
+        self.assertEqual([employee_id for employee_id, _ in attendances], list(expected))
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        for employee_id, attendance in attendances:
+            self.assertEqual(attendance.weekly_overtime_work_hours(*args), expected[employee_id].weekly_overtime_work_hours(*args))
+            # Shifts are sorted by start time within each employee
+            self.assertEqual(attendance.daily_overtime_work_hours(*args), ([], sorted(expected[employee_id].daily_overtime_work_hours(*args)[1])))
+
+    def test_read_csv(self):
+        buffer = io.StringIO(self.dataframe.to_csv(index=False))
+        self.assert_same_attendances(list(self.reader.read_csv(buffer, chunksize=2)))
+
+    def test_read_csv_with_break_columns(self):
+        self.dataframe['start of break 2'] = self.dataframe['start'].str.replace('9:00', '15:00')
+        self.dataframe['end of break 2'] = self.dataframe['start'].str.replace('9:00', '15:30')
+        self.dataframe.loc[[0, 4], ['start of break 2', 'end of break 2']] = None
+        starts_of_break, ends_of_break = ['start of break', 'start of break 2'], ['end of break', 'end of break 2']
+        reader = AttendanceReader('employee', 'start', starts_of_break, ends_of_break, 'end', DATE_FORMAT)
+        attendances = list(reader.read_csv(io.StringIO(self.dataframe.to_csv(index=False)), chunksize=2))
+        expected = AttendanceFactory.create_many_from_dataframe(self.dataframe, 'employee', 'start', starts_of_break, ends_of_break, 'end', DATE_FORMAT)
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        self.assertEqual([employee_id for employee_id, _ in attendances], list(expected))
+        for employee_id, attendance in attendances:
+            self.assertEqual(attendance.weekly_overtime_work_hours(*args), expected[employee_id].weekly_overtime_work_hours(*args))
+            self.assertEqual(attendance.monthly_overtime_work_hours(*args), expected[employee_id].monthly_overtime_work_hours(*args))
+        self.assertEqual(attendances[0][1].weekly_overtime_work_hours(*args), {2024: {2: (timedelta(), timedelta(hours=2, minutes=30))}})
+
+    def test_read_csv_reports_invalid_lines(self):
+        self.dataframe.loc[6, 'end'] = '1/8/2024 8:00'
+        buffer = io.StringIO(self.dataframe.to_csv(index=False))
+        with self.assertRaises(ValueError) as context:
+            list(self.reader.read_csv(buffer, chunksize=4))
+        self.assertIn('check lines [6]', str(context.exception))
+
+    def test_rows_of_employee_must_be_contiguous(self):
+        chunks = [self.dataframe.iloc[:4], self.dataframe.iloc[:1]]
+        with self.assertRaises(ValueError):
+            list(self.reader.read_chunks(chunks))
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_read_parquet(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'attendance.parquet')
+            self.dataframe.to_parquet(path, row_group_size=3)
+            self.assert_same_attendances(list(self.reader.read_parquet(path)))
+
+if __name__ == '__main__':
+    unittest.main()
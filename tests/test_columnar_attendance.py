@@ -0,0 +1,94 @@
+import unittest
+from datetime import datetime, timedelta
+import numpy as np
+from jikangai import Attendance, BreakTime, ColumnarAttendance, LegalHoliday, WorkingDate
+
+SHIFTS = [
+    # A night shift crossing midnight on a Saturday
+    (datetime(2023, 12, 30, 22, 0), datetime(2023, 12, 31, 9, 30), datetime(2023, 12, 31, 2, 0), datetime(2023, 12, 31, 3, 0)),
+    # Work on a legal holiday (Sunday of week 1)
+    (datetime(2024, 1, 7, 9, 0), datetime(2024, 1, 7, 20, 0), datetime(2024, 1, 7, 12, 0), datetime(2024, 1, 7, 13, 0)),
+    (datetime(2024, 1, 31, 9, 0), datetime(2024, 1, 31, 19, 15), datetime(2024, 1, 31, 12, 0), datetime(2024, 1, 31, 12, 45)),
+    (datetime(2024, 2, 1, 9, 0), datetime(2024, 2, 1, 21, 0), datetime(2024, 2, 1, 12, 0), datetime(2024, 2, 1, 13, 0)),
+    # A second shift on the same day replaces the first one in the periodic aggregates
+    (datetime(2024, 2, 1, 22, 0), datetime(2024, 2, 1, 23, 0), datetime(2024, 2, 1, 22, 0), datetime(2024, 2, 1, 22, 0)),
+]
+
+
+class TestColumnarAttendance(unittest.TestCase):
+
+    def setUp(self):
+        self.attendance = Attendance([WorkingDate(start, end, [BreakTime(break_start, break_end)]) for start, end, break_start, break_end in SHIFTS])
+        self.columnar_attendance = ColumnarAttendance(*zip(*SHIFTS))
+
+    def test_aggregates_match_attendance(self):
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        for name in ['daily_overtime_work_hours', 'weekly_overtime_work_hours', 'monthly_overtime_work_hours', 'yearly_overtime_work_hours', 'weekly_regular_work_hours', 'monthly_holiday_work_hours']:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(self.columnar_attendance, name)(*args), getattr(self.attendance, name)(*args))
+
+    def test_days_worked_matches_attendance(self):
+        working_hours_per_day = timedelta(hours=8)
+        self.assertEqual(list(self.columnar_attendance._days_worked(working_hours_per_day)), list(self.attendance._days_worked(working_hours_per_day)))
+        self.assertEqual(self.columnar_attendance._last_day_worked(), self.attendance._last_day_worked())
+        self.assertIsNone(ColumnarAttendance([], [], [], [])._last_day_worked())
+
+    def test_statutory_overtime_matches_attendance(self):
+        # A working week of 8 hours puts the shifts of January 31st and February 1st beyond it.
+        args = (timedelta(hours=8), timedelta(hours=8), LegalHoliday.of_every_sunday())
+        expected = self.attendance.monthly_statutory_overtime_work_hours(*args)
+        self.assertEqual(self.columnar_attendance.weekly_statutory_overtime_work_hours(*args), self.attendance.weekly_statutory_overtime_work_hours(*args))
+        self.assertEqual(self.columnar_attendance.monthly_statutory_overtime_work_hours(*args), expected)
+        self.assertEqual(expected, {2023: {12: timedelta()}, 2024: {1: timedelta(), 2: timedelta(hours=1)}})
+
+    def test_weekly_count_worked_on_legal_holidays(self):
+        holidays = LegalHoliday.of_every_sunday()
+        expected = self.attendance.weekly_count_worked_on_legal_holidays(holidays)
+        self.assertEqual(self.columnar_attendance.weekly_count_worked_on_legal_holidays(holidays), expected)
+        self.assertEqual(expected[2024][1], 1)
+
+    def test_periods_ordered_as_attendance(self):
+        # The later shift of February 1st comes first, so February precedes January as in Attendance.
+        shifts = [SHIFTS[4], SHIFTS[1], SHIFTS[3], SHIFTS[2]]
+        attendance = Attendance([WorkingDate(start, end, [BreakTime(break_start, break_end)]) for start, end, break_start, break_end in shifts])
+        columnar_attendance = ColumnarAttendance(*zip(*shifts))
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        for name in ['weekly_overtime_work_hours', 'monthly_overtime_work_hours', 'yearly_overtime_work_hours', 'weekly_regular_work_hours', 'monthly_holiday_work_hours']:
+            with self.subTest(name=name):
+                self.assertEqual(repr(getattr(columnar_attendance, name)(*args)), repr(getattr(attendance, name)(*args)))
+        self.assertEqual(list(columnar_attendance.monthly_overtime_work_hours(*args)[2024]), [2, 1])
+
+    def test_isocalendar_based_dates(self):
+        self.assertEqual(list(self.columnar_attendance.isocalendar_based_dates), [(2023, 52), (2024, 1), (2024, 5)])
+
+    def test_multiple_break_times(self):
+        # Rows of break times, where NaT marks an absent one and overlapping ones count once.
+        nat = np.datetime64('NaT')
+        starts = [datetime(2024, 4, 6, 22), datetime(2024, 4, 7, 22), datetime(2024, 4, 30, 20)]
+        ends = [datetime(2024, 4, 7, 9), datetime(2024, 4, 8, 8), datetime(2024, 5, 1, 7)]
+        break_starts = np.array([[datetime(2024, 4, 7, 2), datetime(2024, 4, 7, 2, 30)], [nat, nat], [datetime(2024, 5, 1, 4), datetime(2024, 5, 1, 0)]], dtype='datetime64[us]')
+        break_ends = np.array([[datetime(2024, 4, 7, 3), datetime(2024, 4, 7, 3, 30)], [nat, nat], [datetime(2024, 5, 1, 4, 15), datetime(2024, 5, 1, 1)]], dtype='datetime64[us]')
+        columnar_attendance = ColumnarAttendance(starts, ends, break_starts, break_ends)
+        attendance = Attendance([
+            WorkingDate(starts[0], ends[0], [BreakTime(datetime(2024, 4, 7, 2), datetime(2024, 4, 7, 3, 30))]),
+            WorkingDate(starts[1], ends[1], []),
+            WorkingDate(starts[2], ends[2], [BreakTime(datetime(2024, 5, 1, 0), datetime(2024, 5, 1, 1)), BreakTime(datetime(2024, 5, 1, 4), datetime(2024, 5, 1, 4, 15))]),
+        ])
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        for name in ['daily_overtime_work_hours', 'weekly_overtime_work_hours', 'monthly_overtime_work_hours', 'yearly_overtime_work_hours', 'weekly_regular_work_hours', 'monthly_holiday_work_hours']:
+            with self.subTest(name=name):
+                self.assertEqual(getattr(columnar_attendance, name)(*args), getattr(attendance, name)(*args))
+        self.assertEqual(columnar_attendance.weekly_count_worked_on_legal_holidays(args[1]), {2024: {14: 1, 15: 0, 18: 0}})
+        self.assertEqual(columnar_attendance.monthly_overtime_work_hours(*args), {2024: {4: (timedelta(hours=1, minutes=30), timedelta(hours=2)), 5: (timedelta(), timedelta(hours=1, minutes=45))}})
+        self.assertEqual([date.break_time() for date in columnar_attendance._dates], [timedelta(hours=1, minutes=30), timedelta(), timedelta(hours=1, minutes=15)])
+
+    def test_invalid_initialization(self):
+        starts = [datetime(2024, 3, 18, 9), datetime(2024, 3, 19, 9)]
+        ends = [datetime(2024, 3, 18, 18), datetime(2024, 3, 19, 8)]
+        break_starts = [datetime(2024, 3, 18, 12), datetime(2024, 3, 19, 9)]
+        break_ends = [datetime(2024, 3, 18, 13), datetime(2024, 3, 19, 9)]
+        with self.assertRaises(ValueError):
+            ColumnarAttendance(starts, ends, break_starts, break_ends)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,20 @@
+import json
 import unittest
-from datetime import datetime, timedelta
-from jikangai import BreakTime, LegalHoliday
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from jikangai import Agreement36, Attendance, BreakTime, CompanyProfile, IncrementalAttendance, LegalHoliday, LegalHolidayTable, Result, Validator, WorkingDate
+from . import make_working_date
+
+
+def make_night_shifts():
+    return [
+        # From Saturday to Sunday, a legal holiday, with the last 2 hours as overtime
+        WorkingDate(datetime(2024, 4, 6, 22), datetime(2024, 4, 7, 9), [BreakTime(datetime(2024, 4, 7, 2), datetime(2024, 4, 7, 3))]),
+        # From Sunday to Monday, the first day of the next ISO week
+        WorkingDate(datetime(2024, 4, 7, 22), datetime(2024, 4, 8, 8), []),
+        # From April to May
+        WorkingDate(datetime(2024, 4, 30, 20), datetime(2024, 5, 1, 7), [BreakTime(datetime(2024, 5, 1, 0), datetime(2024, 5, 1, 1))]),
+    ]
 
 
 class TestLegalHoliday(unittest.TestCase):
@@ -18,6 +32,28 @@ class TestLegalHoliday(unittest.TestCase):
             self.assertEqual(holiday.weekday, 7)
 
 
+class TestLegalHolidayTable(unittest.TestCase):
+
+    def test_table(self):
+        table = LegalHolidayTable([LegalHoliday(1), LegalHoliday(2, 3)])
+        self.assertEqual(table.table, frozenset([(1, 7), (2, 3)]))
+        self.assertEqual(len(table), 2)
+
+    def test_is_legal_holiday_matches_list(self):
+        legal_holidays = [LegalHoliday(0, 6), LegalHoliday(1), LegalHoliday(2), LegalHoliday(3), LegalHoliday(4)]
+        table = LegalHolidayTable(legal_holidays)
+        for day in range(60):
+            start = datetime(2023, 12, 1, 9, 0) + timedelta(days=day)
+            date = WorkingDate(start, start + timedelta(hours=8), [])
+            with self.subTest(day=day):
+                self.assertEqual(date.is_legal_holiday(table), date.is_legal_holiday(legal_holidays))
+
+    def test_compiled_once_per_profile(self):
+        profile = CompanyProfile(LegalHoliday.of_every_sunday())
+        self.assertIs(profile.legal_holiday_table, profile.legal_holiday_table)
+        self.assertEqual(list(profile.legal_holiday_table), profile.legal_holidays)
+
+
 class TestBreakTime(unittest.TestCase):
 
     def test_initialization(self):
@@ -40,5 +76,390 @@ class TestBreakTime(unittest.TestCase):
         with self.assertRaises(ValueError):
             BreakTime(start, end)
 
+    def test_timezone_aware_initialization(self):
+        start = datetime(2024, 3, 17, 9, 0, tzinfo=timezone(timedelta(hours=9)))
+        end = datetime(2024, 3, 17, 9, 30, tzinfo=timezone(timedelta(hours=9)))
+        break_time = BreakTime(start, end)
+        self.assertEqual(break_time.start, start)
+        self.assertEqual(break_time.end.tzinfo, start.tzinfo)
+        self.assertEqual(BreakTime(start, datetime(2024, 3, 17, 0, 30, tzinfo=timezone.utc)).value(), timedelta(minutes=30))
+
+
+class TestWorkingDate(unittest.TestCase):
+
+    def test_initialization(self):
+        start = datetime(2024, 3, 17, 9, 0, 0, 1)
+        end = datetime(2024, 3, 17, 18, 0)
+        date = WorkingDate(start, end, [BreakTime(datetime(2024, 3, 17, 12, 0), datetime(2024, 3, 17, 13, 0))])
+        self.assertEqual(date.start, start)
+        self.assertEqual(date.end, end)
+        self.assertEqual([(item.start, item.end) for item in date.break_time_list], [(datetime(2024, 3, 17, 12, 0), datetime(2024, 3, 17, 13, 0))])
+        self.assertFalse(hasattr(date, '__dict__'))
+
+    def test_working_hours(self):
+        date = make_working_date(datetime(2024, 1, 15), 9)
+        self.assertEqual(date.break_time(), timedelta(hours=1))
+        self.assertEqual(date.working_hours(), timedelta(hours=9))
+        self.assertEqual(date.overtime_work_hours(timedelta(hours=8)), timedelta(hours=1))
+        self.assertEqual(date.date_components(), (2024, 1, 15))
+        self.assertEqual(tuple(date.isocalendar()), (2024, 3, 1))
+
+    def test_overlapping_break_times(self):
+        start = datetime(2024, 3, 18, 9, 0)
+        break_times = [
+            BreakTime(datetime(2024, 3, 18, 15, 0), datetime(2024, 3, 18, 15, 10)),
+            BreakTime(datetime(2024, 3, 18, 12, 30), datetime(2024, 3, 18, 13, 30)),
+            BreakTime(datetime(2024, 3, 18, 12, 0), datetime(2024, 3, 18, 13, 0)),
+            BreakTime(datetime(2024, 3, 18, 16, 0), datetime(2024, 3, 18, 16, 0)),
+        ]
+        date = WorkingDate(start, datetime(2024, 3, 18, 19, 0), break_times)
+        self.assertEqual(date.break_time(), timedelta(hours=1, minutes=40))
+        self.assertEqual(date.working_hours(), timedelta(hours=8, minutes=20))
+        self.assertEqual([(item.start.time().isoformat(), item.end.time().isoformat()) for item in date.break_time_list], [('12:00:00', '13:30:00'), ('15:00:00', '15:10:00')])
+
+    def test_mixed_utc_offsets(self):
+        jst = timezone(timedelta(hours=9))
+        start = datetime(2024, 3, 18, 9, 0, tzinfo=jst)
+        end = datetime(2024, 3, 18, 9, 0, tzinfo=timezone.utc)
+        date = WorkingDate(start, end, [BreakTime(datetime(2024, 3, 18, 3, 0, tzinfo=timezone.utc), datetime(2024, 3, 18, 4, 0, tzinfo=timezone.utc))])
+        self.assertEqual(date.working_hours(), timedelta(hours=8))
+        self.assertEqual((date.start, date.end), (start, end))
+        self.assertEqual(date.end.tzinfo, jst)
+        self.assertEqual([(item.start, item.end) for item in date.break_time_list], [(datetime(2024, 3, 18, 12, 0, tzinfo=jst), datetime(2024, 3, 18, 13, 0, tzinfo=jst))])
+        self.assertEqual(date.date_components(), (2024, 3, 18))
+        with self.assertRaises(TypeError):
+            WorkingDate(start, datetime(2024, 3, 18, 18, 0), [])
+        with self.assertRaises(TypeError):
+            WorkingDate(datetime(2024, 3, 18, 9, 0), datetime(2024, 3, 18, 18, 0), [BreakTime(datetime(2024, 3, 18, 3, 0, tzinfo=timezone.utc), datetime(2024, 3, 18, 4, 0, tzinfo=timezone.utc))])
+
+    def test_invalid_initialization(self):
+        start = datetime(2024, 3, 17, 9, 0)
+        with self.assertRaises(ValueError):
+            WorkingDate(start, start - timedelta(minutes=1), [])
+        with self.assertRaises(ValueError):
+            WorkingDate(start, start + timedelta(hours=8), [BreakTime(start - timedelta(minutes=1), start)])
+        with self.assertRaises(ValueError):
+            WorkingDate(start, start + timedelta(hours=8), [BreakTime(start, start + timedelta(hours=9))])
+
+class TestAttendance(unittest.TestCase):
+
+    def setUp(self):
+        self.attendance = Attendance([make_working_date(datetime(2024, 1, day), 10) for day in range(7, 12)])
+
+    def test_aggregates(self):
+        aggregates = self.attendance.aggregates(timedelta(hours=8), LegalHoliday.of_every_sunday())
+        self.assertEqual(aggregates.weekly_overtime_work_hours, {2024: {1: (timedelta(hours=2), timedelta()), 2: (timedelta(), timedelta(hours=8))}})
+        self.assertEqual(aggregates.yearly_overtime_work_hours, {2024: (timedelta(hours=2), timedelta(hours=8))})
+        self.assertEqual(aggregates.weekly_count_worked_on_legal_holidays, {2024: {1: 1, 2: 0}})
+
+    def test_statutory_overtime(self):
+        args = (timedelta(hours=8), timedelta(hours=40), LegalHoliday.of_every_sunday())
+        # Daily overtime does not count toward the working hours per week.
+        self.assertEqual(self.attendance.weekly_statutory_overtime_work_hours(*args), {2024: {1: timedelta(), 2: timedelta()}})
+
+        # From Monday, January 29th to Sunday, February 4th, the sixth day exceeds 40 hours and
+        # the work on the Sunday is holiday work.
+        dates = [WorkingDate(datetime(2024, 1, 29, 9) + timedelta(days=day), datetime(2024, 1, 29, 15) + timedelta(days=day), []) for day in range(7)]
+        attendance = Attendance(dates)
+        self.assertEqual(attendance.weekly_regular_work_hours(*args[::2]), {2024: {5: {(2024, 1): timedelta(hours=18), (2024, 2): timedelta(hours=18)}}})
+        self.assertEqual(attendance.weekly_statutory_overtime_work_hours(*args), {2024: {5: timedelta()}})
+        dates = [WorkingDate(datetime(2024, 1, 29, 9) + timedelta(days=day), datetime(2024, 1, 29, 17) + timedelta(days=day), []) for day in range(7)]
+        attendance = Attendance(dates)
+        self.assertEqual(attendance.weekly_statutory_overtime_work_hours(*args), {2024: {5: timedelta(hours=8)}})
+        self.assertEqual(attendance.monthly_statutory_overtime_work_hours(*args), {2024: {1: timedelta(), 2: timedelta(hours=8)}})
+
+        aggregates = attendance.aggregates(timedelta(hours=8), LegalHoliday.of_every_sunday())
+        self.assertEqual(aggregates.monthly_statutory_overtime_work_hours, {2024: {1: timedelta(), 2: timedelta(hours=8)}})
+        merged = Attendance(dates[:3]).aggregates(*args[::2]).merge(Attendance(dates[3:]).aggregates(*args[::2]))
+        self.assertEqual(merged.monthly_statutory_overtime_work_hours, aggregates.monthly_statutory_overtime_work_hours)
+
+    def test_shifts_crossing_midnight(self):
+        attendance = Attendance(make_night_shifts())
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        # A shift belongs to the day it starts on, so each has 2 hours of daily overtime.
+        self.assertEqual(attendance.daily_overtime_work_hours(*args), ([timedelta(hours=2)], [timedelta(hours=2), timedelta(hours=2)]))
+        # But its hours count in the days they are worked on, the overtime in the last ones.
+        self.assertEqual(attendance.weekly_overtime_work_hours(*args), {2024: {14: (timedelta(hours=2), timedelta()), 15: (timedelta(), timedelta(hours=2)), 18: (timedelta(), timedelta(hours=2))}})
+        self.assertEqual(attendance.monthly_overtime_work_hours(*args), {2024: {4: (timedelta(hours=2), timedelta(hours=2)), 5: (timedelta(), timedelta(hours=2))}})
+        self.assertEqual(attendance.yearly_overtime_work_hours(*args), {2024: (timedelta(hours=2), timedelta(hours=4))})
+        self.assertEqual(attendance.weekly_count_worked_on_legal_holidays(args[1]), {2024: {14: 1, 15: 0, 18: 0}})
+        self.assertEqual(attendance.weekly_regular_work_hours(*args), {2024: {
+            14: {(2024, 4): timedelta(hours=2)},
+            15: {(2024, 4): timedelta(hours=6)},
+            18: {(2024, 4): timedelta(hours=4), (2024, 5): timedelta(hours=4)},
+        }})
+
+    def test_aggregates_are_cached_per_working_hours_and_holidays(self):
+        aggregates = self.attendance.aggregates(timedelta(hours=8), LegalHoliday.of_every_sunday())
+        self.assertIs(self.attendance.aggregates(timedelta(hours=8), LegalHolidayTable(reversed(LegalHoliday.of_every_sunday()))), aggregates)
+        self.assertIsNot(self.attendance.aggregates(timedelta(hours=7), LegalHoliday.of_every_sunday()), aggregates)
+        self.assertIsNot(self.attendance.aggregates(timedelta(hours=8), []), aggregates)
+
+    def test_least_recently_used_aggregates_are_evicted(self):
+        self.attendance.aggregate_cache_size = 2
+        first = self.attendance.aggregates(timedelta(hours=8), [])
+        second = self.attendance.aggregates(timedelta(hours=7), [])
+        self.assertIs(self.attendance.aggregates(timedelta(hours=8), []), first)
+        self.attendance.aggregates(timedelta(hours=6), [])
+        self.assertIs(self.attendance.aggregates(timedelta(hours=8), []), first)
+        self.assertIsNot(self.attendance.aggregates(timedelta(hours=7), []), second)
+
+    def test_invalidate_aggregates(self):
+        aggregates = self.attendance.aggregates(timedelta(hours=8), [])
+        self.attendance.invalidate_aggregates()
+        self.assertIsNot(self.attendance.aggregates(timedelta(hours=8), []), aggregates)
+
+
+class TestIncrementalAttendance(unittest.TestCase):
+
+    def setUp(self):
+        self.working_hours_per_day = timedelta(hours=8)
+        self.legal_holidays = LegalHoliday.of_every_sunday()
+        # January 7th is a legal holiday, and the second shift of January 8th replaces the first one.
+        self.dates = [make_working_date(datetime(2024, 1, day), hours) for day, hours in [(5, 9), (7, 10), (8, 12), (8, 9), (31, 11)]]
+
+    def assert_same_aggregates(self, attendance, dates):
+        expected = Attendance(dates)
+        args = (self.working_hours_per_day, self.legal_holidays)
+        self.assertEqual(attendance.daily_overtime_work_hours(*args), expected.daily_overtime_work_hours(*args))
+        self.assertEqual(attendance.weekly_overtime_work_hours(*args), expected.weekly_overtime_work_hours(*args))
+        self.assertEqual(attendance.monthly_overtime_work_hours(*args), expected.monthly_overtime_work_hours(*args))
+        self.assertEqual(attendance.yearly_overtime_work_hours(*args), expected.yearly_overtime_work_hours(*args))
+        self.assertEqual(attendance.weekly_count_worked_on_legal_holidays(self.legal_holidays), expected.weekly_count_worked_on_legal_holidays(self.legal_holidays))
+        self.assertEqual(attendance.weekly_regular_work_hours(*args), expected.weekly_regular_work_hours(*args))
+        self.assertEqual(attendance.monthly_holiday_work_hours(*args), expected.monthly_holiday_work_hours(*args))
+
+    def test_add_date(self):
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, self.dates)
+        self.assert_same_aggregates(attendance, self.dates)
+        self.assertEqual(attendance.monthly_overtime(2024, 1), (timedelta(hours=2), timedelta(hours=5)))
+        self.assertEqual(attendance.weekly_overtime(2024, 2), (timedelta(), timedelta(hours=1)))
+
+    def test_remove_date(self):
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, self.dates)
+        for date in [self.dates[3], self.dates[1], self.dates[4]]:
+            attendance.remove_date(date)
+        self.assert_same_aggregates(attendance, [self.dates[0], self.dates[2]])
+        self.assertEqual(attendance.weekly_overtime(2024, 2), (timedelta(), timedelta(hours=4)))
+        with self.assertRaises(ValueError):
+            attendance.remove_date(self.dates[1])
+
+    def test_statutory_overtime(self):
+        # Each of the three weeks has 8 regular hours, 4 hours beyond a working week of 4 hours.
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, self.dates, timedelta(hours=4))
+        self.assertEqual(attendance.monthly_statutory_overtime(2024, 1), timedelta(hours=12))
+        self.assertEqual(attendance.yearly_statutory_overtime(2024), timedelta(hours=12))
+        # The limits count 5 hours of overtime in non holidays with the 12 hours of statutory overtime.
+        self.assertEqual(attendance.monthly_limited_overtime(2024, 1), timedelta(hours=17))
+        self.assertEqual(attendance.yearly_limited_overtime(2024), timedelta(hours=17))
+        self.assertEqual(attendance.monthly_overtime_including_holiday_work(2024, 1), timedelta(hours=27))
+        attendance.remove_date(self.dates[4])
+        self.assertEqual(attendance.monthly_statutory_overtime(2024, 1), timedelta(hours=8))
+        self.assert_same_aggregates(attendance, self.dates[:4])
+
+    def test_shifts_crossing_midnight(self):
+        dates = make_night_shifts()
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, dates)
+        self.assert_same_aggregates(attendance, dates)
+        attendance.remove_date(dates[0])
+        self.assert_same_aggregates(attendance, dates[1:])
+        self.assertEqual(attendance.weekly_count_worked_on_legal_holidays(self.legal_holidays), {2024: {14: 1, 15: 0, 18: 0}})
+        attendance.remove_date(dates[1])
+        self.assert_same_aggregates(attendance, dates[2:])
+
+    def test_month_indices(self):
+        dates = [WorkingDate(datetime(2024, month, 10, 9), datetime(2024, month, 10, 18), []) for month in (1, 3, 5)]
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, dates)
+        self.assertEqual((attendance._first_month_index, attendance._last_month_index), (2024 * 12, 2024 * 12 + 4))
+        attendance.remove_date(dates[2])
+        self.assertEqual((attendance._first_month_index, attendance._last_month_index), (2024 * 12, 2024 * 12 + 2))
+        attendance.remove_date(dates[0])
+        self.assertEqual((attendance._first_month_index, attendance._last_month_index), (2024 * 12 + 2, 2024 * 12 + 2))
+        attendance.remove_date(dates[1])
+        self.assertEqual((attendance._first_month_index, attendance._last_month_index), (None, None))
+
+    def test_add_date_invalidates_aggregates(self):
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, self.dates[:1])
+        aggregates = attendance.aggregates(self.working_hours_per_day, self.legal_holidays)
+        attendance.add_date(self.dates[4])
+        self.assertEqual(attendance.aggregates(self.working_hours_per_day, self.legal_holidays).monthly_overtime_work_hours, {2024: {1: (timedelta(), timedelta(hours=4))}})
+        self.assertEqual(aggregates.monthly_overtime_work_hours, {2024: {1: (timedelta(), timedelta(hours=1))}})
+
+    def test_tracks_legal_holidays_in_any_order(self):
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, self.dates)
+        reversed_holidays = list(reversed(self.legal_holidays))
+        self.assertTrue(attendance._tracks(self.working_hours_per_day, reversed_holidays))
+        self.assertTrue(attendance._tracks(self.working_hours_per_day, LegalHolidayTable(reversed_holidays)))
+        self.assertFalse(attendance._tracks(self.working_hours_per_day, self.legal_holidays[:1]))
+        self.assertFalse(attendance._tracks(timedelta(hours=7), self.legal_holidays))
+
+    def test_add_date_twice(self):
+        attendance = IncrementalAttendance(self.working_hours_per_day, self.legal_holidays, self.dates[:1])
+        with self.assertRaises(ValueError):
+            attendance.add_date(self.dates[0])
+
+
+class TestAgreement36(unittest.TestCase):
+
+    def setUp(self):
+        self.agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364))
+
+    def test_validate_monthly_overtime_including_holidays(self):
+        self.assertTrue(self.agreement36.validate_monthly_overtime_including_holidays(timedelta(hours=99, minutes=59)))
+        self.assertFalse(self.agreement36.validate_monthly_overtime_including_holidays(timedelta(hours=100)))
+
+    def test_validate_multi_month_average_overtime(self):
+        hours = lambda *values: [timedelta(hours=value) for value in values]
+        self.assertTrue(self.agreement36.validate_multi_month_average_overtime(hours(99)))
+        self.assertTrue(self.agreement36.validate_multi_month_average_overtime(hours(90, 70, 80, 80)))
+        self.assertFalse(self.agreement36.validate_multi_month_average_overtime(hours(90, 71)))
+        # Only the average of the 3 months exceeds 80 hours.
+        self.assertFalse(self.agreement36.validate_multi_month_average_overtime(hours(81, 79, 81)))
+        self.assertTrue(self.agreement36.validate_multi_month_average_overtime(hours(81, 79, 80)))
+        self.assertTrue(self.agreement36.validate_multi_month_average_overtime(hours(99, 61, 80, 80, 80, 80, 80)))
+
+
+class TestResult(unittest.TestCase):
+
+    def setUp(self):
+        attendance = Attendance([make_working_date(datetime(2024, 1, day), 10) for day in range(7, 12)])
+        self.result = Validator(CompanyProfile(LegalHoliday.of_every_sunday())).validate(attendance)
+
+    def test_tables(self):
+        tables = self.result.tables()
+        self.assertEqual(tables['weekly']['week'].tolist(), [1, 2])
+        self.assertEqual(tables['weekly']['overtime_of_holidays'].tolist(), [timedelta(hours=2), timedelta()])
+        self.assertEqual(tables['weekly']['count_worked_on_legal_holidays'].tolist(), [1, 0])
+        self.assertEqual(tables['monthly']['overtime_of_non_holidays'].tolist(), [timedelta(hours=8)])
+        self.assertEqual(tables['monthly']['holiday_work_hours'].tolist(), [timedelta(hours=10)])
+        self.assertEqual(tables['yearly']['year'].tolist(), [2024])
+        self.assertEqual(tables['violations']['violation'].tolist(), ['Must be no overtime'])
+        self.assertIs(self.result.tables(), tables)
+
+    def test_str(self):
+        text = str(self.result)
+        self.assertTrue(text.startswith('violated: True\n  Must be no overtime\n'))
+        self.assertIn('    week 1: in holidays: 2:00:00, in non holidays: 0:00:00', text)
+        self.assertIs(str(self.result), text)
+        self.assertEqual(self.result.render(), text)
+        self.assertIsNot(self.result.render(), text)
+        self.assertIn('monthly_holiday_work_hours: \n  2024\n    month 1: 10:00:00\n', text)
+
+    def test_str_of_statutory_overtime(self):
+        result = Result([], {}, {}, {}, {}, {2024: {2: timedelta(hours=3)}}, {2024: {1: timedelta(hours=1), 2: timedelta(hours=2)}})
+        text = str(result)
+        self.assertIn('weekly_statutory_overtime_work_hours: \n  2024\n    week 2: 3:00:00\n', text)
+        self.assertIn('monthly_statutory_overtime_work_hours: \n  2024\n    month 1: 1:00:00\n    month 2: 2:00:00\n', text)
+
+    def test_to_dict(self):
+        dictionary = self.result.to_dict()
+        self.assertEqual(dictionary['violations'], ['Must be no overtime'])
+        self.assertEqual(dictionary['weekly_overtime_work_hours'][2024][1], {'holidays': 7200.0, 'non_holidays': 0.0})
+        self.assertEqual(dictionary['yearly_overtime_work_hours'], {2024: {'holidays': 7200.0, 'non_holidays': 28800.0}})
+        self.assertEqual(dictionary['monthly_holiday_work_hours'], {2024: {1: 36000.0}})
+        self.assertEqual(json.loads(json.dumps(dictionary))['weekly_count_worked_on_legal_holidays'], {'2024': {'1': 1, '2': 0}})
+
+
+class TestValidator(unittest.TestCase):
+
+    def setUp(self):
+        agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364), daily_overtime_limit=timedelta(hours=2))
+        self.validator = Validator(CompanyProfile(LegalHoliday.of_every_sunday(), agreement36))
+        self.attendances = {
+            'compliant': Attendance([make_working_date(datetime(2024, 1, day), 9) for day in range(8, 13)]),
+            'daily_overtime': Attendance([make_working_date(datetime(2024, 1, day), 11) for day in range(8, 13)]),
+        }
+
+    def test_validate(self):
+        self.assertFalse(self.validator.validate(self.attendances['compliant']).violated())
+        self.assertTrue(self.validator.validate(self.attendances['daily_overtime']).violated())
+
+    def test_validate_multi_month_overtime(self):
+        def attendance_of_months(*overtime_hours_of_months):
+            dates = []
+            for month, overtime_hours in enumerate(overtime_hours_of_months, start=1):
+                weekdays = [day for day in range(1, 29) if datetime(2024, month, day).isoweekday() <= 5][:20]
+                for day in weekdays:
+                    start = datetime(2024, month, day, 9, 0)
+                    dates.append(WorkingDate(start, start + timedelta(hours=8) + overtime_hours / 20, []))
+            return Attendance(dates)
+
+        validator = Validator(CompanyProfile(LegalHoliday.of_every_sunday(), Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364))))
+        average = 'Average overtime including holiday work of any 2 to 6 months must be 80 hours or less'
+        cap = 'Monthly overtime including holiday work must be less than 100 hours'
+        violations = validator.validate(attendance_of_months(timedelta(hours=90), timedelta(hours=60))).violations
+        self.assertNotIn(average, violations)
+        self.assertNotIn(cap, violations)
+        violations = validator.validate(attendance_of_months(timedelta(hours=90), timedelta(hours=80))).violations
+        self.assertIn(average, violations)
+        self.assertNotIn(cap, violations)
+        self.assertIn(cap, validator.validate(attendance_of_months(timedelta(hours=100))).violations)
+
+        attendance = IncrementalAttendance(timedelta(hours=8), LegalHoliday.of_every_sunday(), attendance_of_months(timedelta(hours=90), timedelta(hours=80))._dates)
+        self.assertIn(average, validator.validate_date(attendance, next(iter(attendance._dates))))
+
+    def test_validate_monthly_overtime_including_all_holiday_work(self):
+        # 57 hours of overtime on 19 weekdays of January, and 60 hours of work on three Sundays,
+        # of which only 36 hours are beyond the working hours per day.
+        weekdays = [day for day in range(1, 32) if datetime(2024, 1, day).isoweekday() <= 5][:19]
+        dates = [WorkingDate(datetime(2024, 1, day, 9), datetime(2024, 1, day, 20), []) for day in weekdays]
+        dates += [WorkingDate(datetime(2024, 1, day, 2), datetime(2024, 1, day, 22), []) for day in (7, 14, 21)]
+        validator = Validator(CompanyProfile(LegalHoliday.of_every_sunday(), Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364))))
+        cap = 'Monthly overtime including holiday work must be less than 100 hours'
+
+        attendance = Attendance(dates)
+        args = (timedelta(hours=8), LegalHoliday.of_every_sunday())
+        self.assertEqual(attendance.monthly_holiday_work_hours(*args), {2024: {1: timedelta(hours=60)}})
+        self.assertEqual(attendance.monthly_overtime_work_hours(*args), {2024: {1: (timedelta(hours=36), timedelta(hours=57))}})
+        self.assertIn(cap, validator.validate(attendance).violations)
+        self.assertNotIn(cap, validator.validate(Attendance(dates[:-2])).violations)
+        incremental_attendance = IncrementalAttendance(*args, dates)
+        self.assertIn(cap, validator.validate_date(incremental_attendance, dates[-1]))
+        incremental_attendance.remove_date(dates[-1])
+        incremental_attendance.remove_date(dates[-2])
+        self.assertNotIn(cap, validator.validate_date(incremental_attendance, dates[0]))
+
+    def test_validate_date(self):
+        attendance = IncrementalAttendance(timedelta(hours=8), LegalHoliday.of_every_sunday())
+        for day in range(8, 12):
+            date = make_working_date(datetime(2024, 1, day), 9)
+            attendance.add_date(date)
+            self.assertEqual(self.validator.validate_date(attendance, date), [])
+        date = make_working_date(datetime(2024, 1, 12), 11)
+        attendance.add_date(date)
+        self.assertEqual(self.validator.validate_date(attendance, date), ['Daily overtime must be 2:00:00 hours or less'])
+        self.assertEqual(self.validator.validate(attendance).violations, ['Daily overtime must be 2:00:00 hours or less'])
+
+    def test_validate_weekly_statutory_overtime(self):
+        # Six days of 8 hours a week in the three weeks from January 8th exceed 40 hours by 8 hours a week.
+        dates = [make_working_date(datetime(2024, 1, day), 8) for day in range(8, 31) if datetime(2024, 1, day).isoweekday() <= 6]
+        validator = Validator(CompanyProfile(LegalHoliday.of_every_sunday()))
+        result = validator.validate(Attendance(dates))
+        self.assertEqual(result.violations, ['Must be no overtime'])
+        self.assertEqual(result.monthly_statutory_overtime_work_hours, {2024: {1: timedelta(hours=24)}})
+
+        agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364), monthly_overtime_limit=timedelta(hours=20))
+        validator = Validator(CompanyProfile(LegalHoliday.of_every_sunday(), agreement36))
+        self.assertEqual(validator.validate(Attendance(dates)).violations, ['Montly overtime must be 20:00:00 hours or less'])
+        attendance = IncrementalAttendance(timedelta(hours=8), LegalHoliday.of_every_sunday(), dates)
+        self.assertEqual(validator.validate_date(attendance, dates[-1]), ['Montly overtime must be 20:00:00 hours or less'])
+
+    def test_validate_stream(self):
+        results = list(self.validator.validate_stream(iter(self.attendances.items())))
+        self.assertEqual([(employee_id, result.violated()) for employee_id, result in results], [('compliant', False), ('daily_overtime', True)])
+
+    def test_validate_many(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            batch_result = self.validator.validate_many(self.attendances, executor, chunksize=1)
+        self.assertEqual(list(batch_result.results), ['compliant', 'daily_overtime'])
+        for employee_id, attendance in self.attendances.items():
+            self.assertEqual(str(batch_result[employee_id]), str(self.validator.validate(attendance)))
+        self.assertEqual(batch_result.violations(), {'Daily overtime must be 2:00:00 hours or less': ['daily_overtime']})
+
+    def test_validate_many_with_process_pool(self):
+        batch_result = self.validator.validate_many(self.attendances, max_workers=2)
+        self.assertTrue(batch_result.violated())
+        self.assertEqual(len(batch_result), 2)
+
 if __name__ == '__main__':
     unittest.main()
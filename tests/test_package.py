@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import unittest
+import jikangai
+
+
+class TestPackage(unittest.TestCase):
+
+    def test_import_does_not_load_heavy_modules(self):
+        script = "import sys, jikangai; print(' '.join(module for module in ('asyncio', 'numpy', 'pandas', 'sqlite3') if module in sys.modules))"
+        completed = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+        self.assertEqual(completed.stdout.split(), [])
+
+    def test_lazy_names(self):
+        from jikangai.attendance_factory import AttendanceFactory
+        from jikangai.service import main
+        self.assertIs(jikangai.AttendanceFactory, AttendanceFactory)
+        self.assertIs(jikangai.main, main)
+        self.assertIn('ResultWriter', dir(jikangai))
+        self.assertEqual(sorted(jikangai.__all__), sorted(name for name in jikangai.__all__ if hasattr(jikangai, name)))
+        with self.assertRaises(AttributeError):
+            jikangai.Nonexistent
+
+
+if __name__ == '__main__':
+    unittest.main()
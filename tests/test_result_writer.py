@@ -0,0 +1,51 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime
+import pandas as pd
+from jikangai import CompanyProfile, LegalHoliday, ResultWriter, Validator
+from . import make_attendance
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestResultWriter(unittest.TestCase):
+
+    def setUp(self):
+        validator = Validator(CompanyProfile(LegalHoliday.of_every_sunday()))
+        self.results = {(1, 'a'): validator.validate(make_attendance(datetime(2024, 1, 5), 4, 8)), (2, 'b'): validator.validate(make_attendance(datetime(2024, 1, 5), 4, 9))}
+
+    def test_to_dataframes(self):
+        dataframes = ResultWriter.to_dataframes(self.results)
+        self.assertEqual(list(dataframes), ['weekly', 'monthly', 'yearly', 'violations'])
+        weekly = dataframes['weekly']
+        self.assertEqual(list(weekly.columns), ['employee', 'year', 'week', 'overtime_of_holidays_seconds', 'overtime_of_non_holidays_seconds', 'statutory_overtime_seconds', 'count_worked_on_legal_holidays'])
+        self.assertEqual(weekly['employee'].tolist(), [(1, 'a'), (1, 'a'), (2, 'b'), (2, 'b')])
+        self.assertEqual(weekly['overtime_of_non_holidays_seconds'].tolist(), [0.0, 0.0, 7200.0, 3600.0])
+        self.assertEqual(weekly['overtime_of_holidays_seconds'].tolist(), [0.0, 0.0, 3600.0, 0.0])
+        self.assertEqual(dataframes['violations']['employee'].tolist(), [(2, 'b')])
+
+    def test_to_dataframes_of_no_results(self):
+        dataframes = ResultWriter.to_dataframes({})
+        self.assertEqual(len(dataframes['monthly']), 0)
+        self.assertEqual(list(dataframes['monthly'].columns), ['employee', 'year', 'month', 'overtime_of_holidays_seconds', 'overtime_of_non_holidays_seconds', 'statutory_overtime_seconds', 'holiday_work_hours_seconds'])
+
+    def test_write_csv(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ResultWriter.write_csv(self.results, directory)
+            yearly = pd.read_csv(os.path.join(directory, 'yearly.csv'))
+        self.assertEqual(yearly['overtime_of_non_holidays_seconds'].tolist(), [0.0, 10800.0])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_write_parquet(self):
+        results = {employee_id: result for (employee_id, _), result in self.results.items()}
+        with tempfile.TemporaryDirectory() as directory:
+            ResultWriter.write_parquet(results, directory)
+            monthly = pd.read_parquet(os.path.join(directory, 'monthly.parquet'))
+        self.assertEqual(monthly['employee'].tolist(), [1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
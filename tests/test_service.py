@@ -0,0 +1,148 @@
+import asyncio
+import io
+import json
+import unittest
+import unittest.mock
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from jikangai import Agreement36, CompanyProfile, LegalHoliday, ValidationService, Validator
+from jikangai.service import serve_http, serve_lines
+from . import make_attendance
+
+PROFILE = {'agreement36': {'starting_date': '2024-01-01', 'valid_period_days': 364, 'daily_overtime_limit_hours': 2}}
+
+
+def make_request(request_id, hours: int) -> dict:
+    shifts = []
+    for day in range(8, 13):
+        start = datetime(2024, 1, day, 9, 0)
+        shifts.append({
+            'start': start.isoformat(),
+            'end': (start + timedelta(hours=hours + 1)).isoformat(),
+            'breaks': [[(start + timedelta(hours=3)).isoformat(), (start + timedelta(hours=4)).isoformat()]],
+        })
+    return {'id': request_id, 'shifts': shifts, 'profile': PROFILE}
+
+
+class TestValidationService(unittest.TestCase):
+
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364), daily_overtime_limit=timedelta(hours=2))
+        self.validator = Validator(CompanyProfile(LegalHoliday.of_every_sunday(), agreement36))
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_validate_in_batches(self):
+        attendances = [make_attendance(datetime(2024, 1, 8), 5, 9 + i % 4) for i in range(10)]
+        batch_sizes = []
+
+        def validate_chunk(validator, chunk):
+            batch_sizes.append(len(chunk))
+            return ([(index, validator.validate(attendance)) for index, attendance in chunk], None)
+
+        async def validate_all():
+            service = ValidationService(self.validator, self.executor, max_batch_size=4, max_batch_delay=1)
+            return await asyncio.gather(*[service.validate(attendance) for attendance in attendances])
+
+        with unittest.mock.patch('jikangai.service._validate_chunk', validate_chunk):
+            results = asyncio.run(validate_all())
+        self.assertEqual(batch_sizes, [4, 4, 2])
+        self.assertEqual([str(result) for result in results], [str(self.validator.validate(attendance)) for attendance in attendances])
+
+    def test_validate_on_shut_down_executor(self):
+        self.executor.shutdown()
+
+        async def validate():
+            return await asyncio.wait_for(ValidationService(self.validator, self.executor).validate(make_attendance(datetime(2024, 1, 8), 5, 9)), 5)
+
+        with self.assertRaises(RuntimeError):
+            asyncio.run(validate())
+
+    def test_validate_request(self):
+        async def validate_requests():
+            service = ValidationService(executor=self.executor)
+            responses = await asyncio.gather(service.validate_request(make_request('a', 9)), service.validate_request(make_request('b', 11)))
+            self.assertIs(service.validator_of_profile(dict(PROFILE)), service.validator_of_profile(PROFILE))
+            return responses + [await service.validate_request({'id': 'c', 'shifts': [{'start': '2024-01-08T09:00'}]})]
+
+        compliant, violated, invalid = asyncio.run(validate_requests())
+        self.assertEqual((compliant['id'], compliant['violated']), ('a', False))
+        self.assertEqual(violated['violations'], ['Daily overtime must be 2:00:00 hours or less'])
+        self.assertEqual(violated['weekly_overtime_work_hours'][2024][2], {'holidays': 0.0, 'non_holidays': 15 * 3600.0})
+        self.assertEqual(invalid, {'id': 'c', 'error': "KeyError: 'end'"})
+
+    def test_validator_cache_size(self):
+        service = ValidationService(executor=self.executor)
+        service.validator_cache_size = 2
+        profiles = [{'agreement36': dict(PROFILE['agreement36'], daily_overtime_limit_hours=hours)} for hours in (1, 2, 3)]
+        first = service.validator_of_profile(profiles[0])
+        service.validator_of_profile(profiles[1])
+        self.assertIs(service.validator_of_profile(profiles[0]), first)
+        service.validator_of_profile(profiles[2])
+        # The profile used least recently is evicted.
+        self.assertEqual(list(service._validators), [json.dumps(profile, sort_keys=True) for profile in profiles[::2]])
+        self.assertIs(service.validator_of_profile(profiles[0]), first)
+
+    def test_serve_lines(self):
+        lines = io.StringIO('\n'.join([json.dumps(make_request(1, 9)), 'not json', json.dumps(make_request(2, 11))]) + '\n')
+        output = io.StringIO()
+
+        async def serve():
+            await serve_lines(ValidationService(executor=self.executor), lines, output)
+
+        asyncio.run(serve())
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(sorted((response['id'] is None, response.get('violated')) for response in responses), [(False, False), (False, True), (True, None)])
+
+    def test_serve_lines_on_shut_down_executor(self):
+        self.executor.shutdown()
+        lines = io.StringIO('\n'.join([json.dumps(make_request(1, 9)), json.dumps(make_request(2, 11))]) + '\n')
+        output = io.StringIO()
+
+        async def serve():
+            await asyncio.wait_for(serve_lines(ValidationService(executor=self.executor), lines, output), 5)
+
+        asyncio.run(serve())
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([response['error'].split(':')[0] for response in responses], ['RuntimeError', 'RuntimeError'])
+
+    def test_serve_http(self):
+        async def post(port, body: bytes):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b'POST /validate HTTP/1.1\r\nContent-Type: application/json\r\nContent-Length: %d\r\n\r\n' % len(body) + body)
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+            head, _, payload = response.partition(b'\r\n\r\n')
+            return head.split(b'\r\n')[0], json.loads(payload)
+
+        async def serve():
+            server = await serve_http(ValidationService(executor=self.executor), '127.0.0.1', 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server:
+                return await asyncio.gather(
+                    post(port, json.dumps(make_request('a', 11)).encode()),
+                    post(port, json.dumps([make_request('b', 9), make_request('c', 11)]).encode()),
+                    post(port, b'{'),
+                )
+
+        async def serve_on_shut_down_executor():
+            self.executor.shutdown()
+            server = await serve_http(ValidationService(executor=self.executor), '127.0.0.1', 0)
+            async with server:
+                return await asyncio.wait_for(post(server.sockets[0].getsockname()[1], json.dumps(make_request('d', 9)).encode()), 5)
+
+        single, many, invalid = asyncio.run(serve())
+        self.assertEqual(single[0], b'HTTP/1.1 200 OK')
+        self.assertTrue(single[1]['violated'])
+        self.assertEqual([response['violated'] for response in many[1]], [False, True])
+        self.assertEqual(invalid[0], b'HTTP/1.1 400 Bad Request')
+        failed = asyncio.run(serve_on_shut_down_executor())
+        self.assertEqual(failed[0], b'HTTP/1.1 500 Internal Server Error')
+        self.assertTrue(failed[1]['error'].startswith('RuntimeError'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import json
+import unittest
+from datetime import datetime, timedelta
+from jikangai import Agreement36, CompanyProfile, LegalHoliday, Tracer, Validator
+from . import make_attendance
+
+PHASES = [
+    'daily_overtime_work_hours',
+    'weekly_overtime_work_hours',
+    'monthly_overtime_work_hours',
+    'yearly_overtime_work_hours',
+    'weekly_count_worked_on_legal_holidays',
+    'weekly_regular_work_hours',
+    'statutory_overtime_work_hours',
+    'monthly_holiday_work_hours',
+    'agreement36',
+]
+
+
+class TestTracer(unittest.TestCase):
+
+    def setUp(self):
+        agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364))
+        self.profile = CompanyProfile(LegalHoliday.of_every_sunday(), agreement36)
+
+    def test_validate_records_each_phase(self):
+        recorded = []
+        tracer = Tracer(callback=lambda name, seconds: recorded.append(name))
+        validator = Validator(self.profile, tracer=tracer)
+        validator.validate(make_attendance(datetime(2024, 1, 8), 1, 9))
+        validator.validate(make_attendance(datetime(2024, 1, 8), 1, 9))
+        stats = tracer.to_dict()
+        self.assertEqual(list(stats), PHASES)
+        self.assertTrue(all(stat['calls'] == 2 and stat['seconds'] >= 0 for stat in stats.values()))
+        self.assertEqual(recorded, PHASES * 2)
+        self.assertEqual(json.loads(tracer.to_json()), stats)
+
+    def test_validate_many_merges_stats_of_workers(self):
+        tracer = Tracer()
+        Validator(self.profile, tracer=tracer).validate_many({employee_id: make_attendance(datetime(2024, 1, 8), 1, 9) for employee_id in range(3)}, max_workers=2, chunksize=1)
+        self.assertEqual({name: stat['calls'] for name, stat in tracer.to_dict().items()}, {name: 3 for name in PHASES})
+
+    def test_aggregates_are_reused_across_limits(self):
+        attendance = make_attendance(datetime(2024, 1, 8), 1, 9)
+        Validator(self.profile).validate(attendance)
+        tracer = Tracer()
+        agreement36 = Agreement36(starting_date=datetime(2024, 1, 1), valid_period=timedelta(days=364), daily_overtime_limit=timedelta(minutes=30))
+        result = Validator(CompanyProfile(LegalHoliday.of_every_sunday(), agreement36), tracer=tracer).validate(attendance)
+        self.assertTrue(result.violated())
+        self.assertEqual(list(tracer.to_dict()), ['agreement36'])
+
+    def test_reset(self):
+        tracer = Tracer()
+        with tracer.phase('phase'):
+            pass
+        tracer.reset()
+        self.assertEqual(tracer.to_dict(), {})
+
+    def test_disabled(self):
+        validator = Validator(self.profile)
+        self.assertIsNone(validator.tracer)
+        self.assertFalse(validator.validate(make_attendance(datetime(2024, 1, 8), 1, 9)).violated())
+
+if __name__ == '__main__':
+    unittest.main()